@@ -0,0 +1,468 @@
+"""Columnar tables over the run ledger, for aggregate questions.
+
+"How many vetoes per screen per month", or "how has catalysts_in_window
+moved", means reading every run in the ledger. Through `RunLedger.read` that
+is a JSON parse of every entry -- and of every veto sidecar -- per question.
+
+`LedgerAnalytics` converts the ledger once into four tables in the
+`helios_signals.columnar` format, one file each under a store directory:
+
+    runs      one row per run: date, health, catalyst counts, outcome counts
+    sources   one row per source per run
+    signals   one row per signal
+    vetoes    one row per veto
+
+Every child row carries its run's row number (`run`) and date (`day`, a date
+ordinal), so a question about one table needs no join. Strings -- tickers,
+NCT IDs, source and screen names, decisions -- are stored as integer codes
+into dictionaries kept in the runs table's metadata, shared across tables.
+
+`refresh` is incremental. It reads only the ledger entries after the last one
+converted, reached through the ledger's index, and rewrites the tables with
+the new rows appended. The runs table is written last and its row count is
+what counts as converted, so an interrupted refresh leaves child rows for
+runs the runs table does not list; they are dropped on the next refresh. If
+the ledger no longer starts with the runs already converted, the tables are
+rebuilt from scratch.
+
+Queries open the tables memory-mapped and aggregate over the columns with
+`collections.Counter` and `zip`, which run in C, so a question over thousands
+of runs costs milliseconds. `group_by` is the general form; the CLI exposes it:
+
+    python -m helios_signals.analytics refresh
+    python -m helios_signals.analytics query vetoes --by month screen
+    python -m helios_signals.analytics query runs --by month \\
+        --value catalysts_in_window --agg mean
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import bisect
+import logging
+import math
+import sys
+from collections import Counter
+from datetime import date
+from itertools import compress, repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .columnar import ColumnarError, ColumnarTable, write_table
+from .ledger import DEFAULT_LEDGER, RunLedger, _run_date
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE = Path(".cache/helios-analytics")
+_KIND = "helios.analytics"
+_FORMAT = 1
+_NO_DATE = 0
+_NONE = -1  # code of a missing string
+_NAN = float("nan")
+
+# Column typecodes per table. Columns named in _DICTIONARIES hold codes.
+_SCHEMA: Dict[str, Dict[str, str]] = {
+    "runs": {
+        "day": "i",
+        "healthy": "b",
+        "dry_run": "b",
+        "catalysts_found": "q",
+        "catalysts_in_window": "q",
+        "sources_failed": "i",
+        "signals": "i",
+        "vetoes": "i",
+    },
+    "sources": {
+        "run": "i",
+        "day": "i",
+        "source": "h",
+        "ok": "b",
+        "records": "q",
+        "elapsed_ms": "q",
+        "cache_hits": "q",
+        "cache_misses": "q",
+    },
+    "signals": {
+        "run": "i",
+        "day": "i",
+        "ticker": "i",
+        "nct": "i",
+        "decision": "h",
+        "entry_price": "d",
+        "position_value": "d",
+    },
+    "vetoes": {
+        "run": "i",
+        "day": "i",
+        "screen": "h",
+        "ticker": "i",
+        "nct": "i",
+    },
+}
+_DICTIONARIES = ("source", "ticker", "nct", "decision", "screen")
+# Keys `group_by` derives from `day` rather than reading from a column.
+_DERIVED = {
+    "date": lambda day: date.fromordinal(day).isoformat() if day else "",
+    "month": lambda day: date.fromordinal(day).isoformat()[:7] if day else "",
+    "year": lambda day: str(date.fromordinal(day).year) if day else "",
+}
+_AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+
+class LedgerAnalytics:
+    """The analytics store in `directory`: refreshed from a ledger, then queried."""
+
+    def __init__(self, directory: Path = DEFAULT_STORE) -> None:
+        self.directory = Path(directory)
+
+    def _path(self, table: str) -> Path:
+        return self.directory / f"{table}.col"
+
+    # ----------------------------------------------------------------- refresh
+
+    def refresh(self, ledger: RunLedger) -> int:
+        """Convert the ledger entries not yet in the tables. Returns how many."""
+        columns, meta = self._load()
+        converted = len(columns["runs"]["day"])
+        if converted and not self._still_prefix(ledger, converted, meta["run_ids"][-1]):
+            logger.warning("Ledger no longer matches %s; rebuilding it", self.directory)
+            columns, meta = _empty(), _empty_meta()
+            converted = 0
+
+        codes = {name: {s: i for i, s in enumerate(meta["dictionaries"][name])}
+                 for name in _DICTIONARIES}
+        added = 0
+        for entry in ledger.read(start=converted):
+            self._add_run(ledger, entry, converted + added, columns, codes, meta["run_ids"])
+            added += 1
+        if not added and self._path("runs").exists():
+            return 0
+
+        meta["dictionaries"] = {
+            name: sorted(table, key=table.__getitem__) for name, table in codes.items()
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for table in ("sources", "signals", "vetoes", "runs"):  # runs last: it commits
+            table_meta = {"kind": _KIND, "format": _FORMAT, "table": table}
+            if table == "runs":
+                table_meta.update(meta)
+            write_table(self._path(table), columns[table], meta=table_meta)
+        logger.info("Analytics store %s: %d runs added, %d total",
+                    self.directory, added, converted + added)
+        return added
+
+    def _load(self) -> Tuple[Dict[str, Dict[str, array.array]], Dict[str, Any]]:
+        """The stored columns as growable arrays, cut back to the committed runs."""
+        columns, meta = _empty(), _empty_meta()
+        if not self._path("runs").exists():
+            return columns, meta
+        try:
+            with ColumnarTable(self._path("runs")) as runs:
+                if runs.meta.get("kind") != _KIND or runs.meta.get("format") != _FORMAT:
+                    raise ColumnarError(f"{runs.path} is not a version {_FORMAT} analytics table")
+                meta = {"run_ids": runs.meta["run_ids"],
+                        "dictionaries": runs.meta["dictionaries"]}
+                columns["runs"] = _copy(runs, _SCHEMA["runs"])
+            converted = len(columns["runs"]["day"])
+            for table in ("sources", "signals", "vetoes"):
+                with ColumnarTable(self._path(table)) as child:
+                    loaded = _copy(child, _SCHEMA[table])
+                # Rows past the committed runs are from an interrupted refresh.
+                keep = bisect.bisect_left(loaded["run"], converted)
+                columns[table] = {name: col[:keep] for name, col in loaded.items()}
+        except (ColumnarError, KeyError) as exc:
+            logger.warning("Rebuilding unreadable analytics store %s: %s", self.directory, exc)
+            return _empty(), _empty_meta()
+        return columns, meta
+
+    @staticmethod
+    def _still_prefix(ledger: RunLedger, converted: int, last_run_id: str) -> bool:
+        last = next(ledger.read(start=converted - 1), None)
+        return last is not None and last.get("run_id") == last_run_id
+
+    @staticmethod
+    def _add_run(
+        ledger: RunLedger,
+        entry: Dict[str, Any],
+        run: int,
+        columns: Dict[str, Dict[str, array.array]],
+        codes: Dict[str, Dict[str, int]],
+        run_ids: List[str],
+    ) -> None:
+        def code(name: str, value: Optional[str]) -> int:
+            if value is None:
+                return _NONE
+            table = codes[name]
+            return table.setdefault(value, len(table))
+
+        run_id = str(entry.get("run_id") or "")
+        day = _day(_run_date(run_id, entry.get("started_at")))
+        sources = entry.get("sources") or []
+        signals = entry.get("signals") or []
+        try:
+            vetoes = list(ledger.read_vetoes(entry))
+        except (OSError, ValueError) as exc:
+            logger.error("Vetoes of run %s not converted: %s", run_id, exc)
+            vetoes = []
+
+        _append(columns["runs"], {
+            "day": day,
+            "healthy": bool(entry.get("healthy")),
+            "dry_run": bool(entry.get("dry_run")),
+            "catalysts_found": int(entry.get("catalysts_found") or 0),
+            "catalysts_in_window": int(entry.get("catalysts_in_window") or 0),
+            "sources_failed": sum(1 for s in sources if not s.get("ok")),
+            "signals": len(signals),
+            "vetoes": len(vetoes),
+        })
+        run_ids.append(run_id)
+        for source in sources:
+            _append(columns["sources"], {
+                "run": run,
+                "day": day,
+                "source": code("source", source.get("name")),
+                "ok": bool(source.get("ok")),
+                "records": int(source.get("records") or 0),
+                "elapsed_ms": int(source.get("elapsed_ms") or 0),
+                "cache_hits": int(source.get("cache_hits") or 0),
+                "cache_misses": int(source.get("cache_misses") or 0),
+            })
+        for signal in signals:
+            _append(columns["signals"], {
+                "run": run,
+                "day": day,
+                "ticker": code("ticker", signal.get("ticker")),
+                "nct": code("nct", (signal.get("catalyst") or {}).get("external_id")),
+                "decision": code("decision", signal.get("decision")),
+                "entry_price": _num(signal.get("entry_price")),
+                "position_value": _num(signal.get("position_value")),
+            })
+        for veto in vetoes:
+            _append(columns["vetoes"], {
+                "run": run,
+                "day": day,
+                "screen": code("screen", veto.get("screen")),
+                "ticker": code("ticker", veto.get("ticker")),
+                "nct": code("nct", veto.get("external_id")),
+            })
+
+    # ------------------------------------------------------------------ query
+
+    def group_by(
+        self,
+        table: str,
+        keys: Sequence[str] = (),
+        value: Optional[str] = None,
+        agg: str = "count",
+        where: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[Tuple[Any, ...], float]:
+        """Aggregate `value` over the rows of `table`, grouped by `keys`.
+
+        Keys are column names -- dictionary columns come back as strings --
+        or `date`, `month` or `year`, derived from `day`. `where` keeps the
+        rows whose columns equal the given values, compared the same way.
+        `count` needs no `value`; `sum`, `mean`, `min` and `max` ignore NaN.
+        Groups come back in key order.
+        """
+        if table not in _SCHEMA:
+            raise ValueError(f"unknown table {table!r}; expected one of {sorted(_SCHEMA)}")
+        if agg not in _AGGREGATES:
+            raise ValueError(f"unknown aggregate {agg!r}; expected one of {_AGGREGATES}")
+        if agg != "count" and value is None:
+            raise ValueError(f"{agg} needs a value column")
+
+        with ColumnarTable(self._path(table)) as data, \
+                ColumnarTable(self._path("runs")) as runs:
+            dictionaries = runs.meta["dictionaries"]
+            rows = len(data)
+            if table != "runs":
+                # Drop rows left by an interrupted refresh.
+                rows = bisect.bisect_left(data.column("run"), len(runs))
+            raw = [_values(data, "day" if key in _DERIVED else key, rows) for key in keys]
+            mask = self._where(data, where or {}, dictionaries, rows)
+            values = _values(data, value, rows) if agg != "count" else None
+
+        # Group on the stored codes, which are cheap to hash, and decode only
+        # the distinct groups afterwards.
+        if mask is not None:
+            raw = [list(compress(column, mask)) for column in raw]
+            values = list(compress(values, mask)) if values is not None else None
+            rows = sum(mask)
+        groups = zip(*raw) if raw else repeat((), rows)
+        decode = [self._decoder(key, dictionaries) for key in keys]
+
+        if values is None:
+            counted = Counter(groups)
+            labels = _labels(counted, decode)
+            counts: Dict[Tuple[Any, ...], float] = {}
+            for group, n in counted.items():
+                label = labels(group)
+                counts[label] = counts.get(label, 0.0) + n
+            return dict(sorted(counts.items(), key=_sort_key))
+
+        totals: Dict[Tuple[Any, ...], List[float]] = {}
+        for group, number in zip(groups, values):
+            if number == number:  # not NaN
+                totals.setdefault(group, []).append(number)
+        labels = _labels(totals, decode)
+        merged: Dict[Tuple[Any, ...], List[float]] = {}
+        for group, numbers in totals.items():
+            merged.setdefault(labels(group), []).extend(numbers)
+        reduce = {
+            "sum": math.fsum,
+            "mean": lambda xs: math.fsum(xs) / len(xs),
+            "min": min,
+            "max": max,
+        }[agg]
+        return {k: float(reduce(v)) for k, v in sorted(merged.items(), key=_sort_key)}
+
+    @staticmethod
+    def _decoder(key: str, dictionaries: Dict[str, List[str]]) -> Callable[[Any], Any]:
+        if key in _DERIVED:
+            return _DERIVED[key]
+        if key in _DICTIONARIES:
+            words = dictionaries[key]
+            return lambda code: words[code] if code >= 0 else None
+        return lambda code: code
+
+    @staticmethod
+    def _where(
+        data: ColumnarTable, where: Mapping[str, Any], dictionaries: Dict[str, List[str]],
+        rows: int,
+    ) -> Optional[List[bool]]:
+        mask: Optional[List[bool]] = None
+        for key, wanted in where.items():
+            if key in _DERIVED:
+                days = _values(data, "day", rows)
+                hit = {day for day in set(days) if _DERIVED[key](day) == wanted}
+                keep = list(map(hit.__contains__, days))
+            else:
+                column = _values(data, key, rows)
+                if key in _DICTIONARIES:
+                    words = dictionaries[key]
+                    wanted = words.index(wanted) if wanted in words else -2
+                # `==`, not `wanted.__eq__`: an int against a float column
+                # is NotImplemented one way round and a match the other.
+                keep = [value == wanted for value in column]
+            mask = keep if mask is None else list(map(min, mask, keep))
+        return mask
+
+    # ---------------------------------------------------------- common questions
+
+    def vetoes_per_screen_per_month(self) -> Dict[Tuple[Any, ...], float]:
+        return self.group_by("vetoes", ("month", "screen"))
+
+    def catalysts_in_window_trend(self, by: str = "month") -> Dict[Tuple[Any, ...], float]:
+        return self.group_by("runs", (by,), value="catalysts_in_window", agg="mean")
+
+
+def _empty() -> Dict[str, Dict[str, array.array]]:
+    return {
+        table: {name: array.array(code) for name, code in schema.items()}
+        for table, schema in _SCHEMA.items()
+    }
+
+
+def _empty_meta() -> Dict[str, Any]:
+    return {"run_ids": [], "dictionaries": {name: [] for name in _DICTIONARIES}}
+
+
+def _copy(table: ColumnarTable, schema: Mapping[str, str]) -> Dict[str, array.array]:
+    out = {}
+    for name, typecode in schema.items():
+        col = array.array(typecode)
+        col.frombytes(table.column(name).tobytes())
+        out[name] = col
+    return out
+
+
+def _append(columns: Dict[str, array.array], row: Mapping[str, Any]) -> None:
+    for name, value in row.items():
+        columns[name].append(value)
+
+
+def _values(data: ColumnarTable, name: str, rows: int) -> List[Any]:
+    """The first `rows` values of a column, copied out of the mapping.
+
+    A copy, not a slice of the view: a live slice would keep the mapping
+    from closing.
+    """
+    if name not in data.names:
+        raise ValueError(f"{data.path.stem} has no column {name!r}")
+    return data.column(name).tolist()[:rows]
+
+
+def _labels(
+    groups: Iterable[Tuple[Any, ...]], decode: Sequence[Callable[[Any], Any]]
+) -> Callable[[Tuple[Any, ...]], Tuple[Any, ...]]:
+    """Decode group keys, each distinct code once per position."""
+    groups = list(groups)
+    tables = [
+        {code: d(code) for code in {group[i] for group in groups}} for i, d in enumerate(decode)
+    ]
+    return lambda group: tuple(table[code] for table, code in zip(tables, group))
+
+
+def _sort_key(item: Tuple[Tuple[Any, ...], Any]) -> Tuple[Any, ...]:
+    # None (a missing string) sorts first rather than failing to compare.
+    return tuple((k is not None, k) for k in item[0])
+
+
+def _day(iso: str) -> int:
+    return date.fromisoformat(iso).toordinal() if iso else _NO_DATE
+
+
+def _num(value: Any) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _format(value: float) -> str:
+    return str(int(value)) if value.is_integer() else f"{value:.4g}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Aggregate queries over the run ledger")
+    parser.add_argument("--ledger", type=Path, default=DEFAULT_LEDGER)
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("refresh", help="Convert new ledger entries into the store")
+    query = commands.add_parser("query", help="Group and aggregate one table (refreshes first)")
+    query.add_argument("table", choices=sorted(_SCHEMA))
+    query.add_argument("--by", nargs="*", default=[], metavar="KEY",
+                       help="Columns to group by, or date/month/year")
+    query.add_argument("--value", default=None, help="Column to aggregate")
+    query.add_argument("--agg", choices=_AGGREGATES, default="count")
+    query.add_argument("--where", action="append", default=[], metavar="KEY=VALUE",
+                       help="Keep rows where KEY equals VALUE (repeatable)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    store = LedgerAnalytics(args.store)
+    store.refresh(RunLedger(args.ledger))
+    if args.command == "refresh":
+        return 0
+
+    where: Dict[str, Any] = {}
+    for clause in args.where:
+        key, _, raw = clause.partition("=")
+        where[key] = raw if key in _DICTIONARIES or key in _DERIVED else _parse_number(raw)
+    try:
+        result = store.group_by(args.table, args.by, args.value, args.agg, where)
+    except ValueError as exc:
+        parser.error(str(exc))
+    print("\t".join([*args.by, args.agg if args.value is None else f"{args.agg}({args.value})"]))
+    for group, value in result.items():
+        print("\t".join(["" if k is None else str(k) for k in group] + [_format(value)]))
+    return 0
+
+
+def _parse_number(raw: str) -> Any:
+    lowered = raw.lower()
+    if lowered in ("true", "false"):
+        return int(lowered == "true")
+    return float(raw) if "." in raw else int(raw)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""Event-study replay: the engine run over past dates, on what was known then.
+
+`SignalEngine.run(as_of=...)` against the live sources screens a past date
+with today's registry, today's tickers and today's filings. `Backtest` swaps
+in the point-in-time sources from `sources.snapshots` -- studies and tickers
+as captured on or before each date, runway from facts filed by it -- and runs
+the unchanged engine once per date. The output is a panel: one row per
+signal and per veto per date, which is the event-outcome dataset the config's
+thresholds are waiting on.
+
+Dates are split into contiguous chunks and the chunks replayed in a process
+pool. Each worker opens the archive and the facts index once, walks its
+chunk's dates in order so the archive's timeline only advances, parses each
+study version once however many dates it stays current, and computes each
+filer's runway once per filing rather than once per date. A replayed run
+is unhealthy for the same reasons a live one is -- most often a date the
+archive has no recent capture for -- and is reported, not skipped.
+
+    python -m helios_signals.backtest --archive .cache/helios-snapshots.json.gz \\
+        --facts-index .cache/companyfacts.idx --start 2025-01-01 --end 2025-12-31 \\
+        --out panel.csv
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import csv
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .config import AccountConfig, SignalConfig
+from .engine import SignalEngine
+from .models import CashRunway, RunReport
+from .sources.bulkfacts import FactsIndex
+from .sources.sec import CompanyFactsSource, _parse_date
+from .sources.snapshots import (
+    STUDIES,
+    TICKERS,
+    SnapshotArchive,
+    SnapshotCatalystSource,
+    SnapshotTickerResolver,
+)
+
+logger = logging.getLogger(__name__)
+
+PANEL_FIELDS = (
+    "as_of", "kind", "outcome", "ticker", "nct_id", "sponsor", "event_date", "phase", "reason"
+)
+
+
+@dataclass
+class ReplayDay:
+    """How the replayed run for one date went."""
+
+    as_of: date
+    healthy: bool
+    catalysts_found: int
+    catalysts_in_window: int
+    signals: int
+    vetoes: int
+    errors: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        d = asdict(self)
+        d["as_of"] = self.as_of.isoformat()
+        return d
+
+
+@dataclass
+class BacktestResult:
+    days: List[ReplayDay]
+    panel: List[Dict[str, Any]]
+
+    @property
+    def unhealthy(self) -> List[ReplayDay]:
+        return [day for day in self.days if not day.healthy]
+
+    def write_panel(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=PANEL_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.panel)
+        return path
+
+
+@dataclass(frozen=True)
+class _Job:
+    """Everything a worker needs, in picklable form."""
+
+    archive: str
+    facts_index: str
+    config: SignalConfig
+    account: AccountConfig
+    max_staleness_days: int
+    ticker_staleness_days: int
+    dates: Tuple[date, ...]
+
+
+class Backtest:
+    """Replays the engine over a date range from a snapshot archive."""
+
+    def __init__(
+        self,
+        archive: Path,
+        facts_index: Path,
+        config: Optional[SignalConfig] = None,
+        account: Optional[AccountConfig] = None,
+        max_staleness_days: int = 7,
+        workers: Optional[int] = None,
+        ticker_staleness_days: Optional[int] = None,
+    ) -> None:
+        self.archive = Path(archive)
+        self.facts_index = Path(facts_index)
+        self.config = config or SignalConfig()
+        self.account = account or AccountConfig()
+        self.max_staleness_days = max_staleness_days
+        # Ticker history is often backfilled from monthly copies of the
+        # ticker file (see sources.snapshots), so it may be allowed to lag.
+        self.ticker_staleness_days = (
+            max_staleness_days if ticker_staleness_days is None else ticker_staleness_days
+        )
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, start: date, end: date, step_days: int = 1) -> BacktestResult:
+        if end < start:
+            raise ValueError(f"end {end} is before start {start}")
+        dates = [start + timedelta(days=n) for n in range(0, (end - start).days + 1, step_days)]
+        return self.run_dates(dates)
+
+    def run_dates(self, dates: Sequence[date]) -> BacktestResult:
+        dates = sorted(set(dates))
+        # Several chunks per worker balance the load; one process needs one.
+        count = self.workers * 4 if self.workers > 1 else 1
+        jobs = [self._job(chunk) for chunk in chunks(dates, count)]
+        if self.workers == 1 or len(jobs) <= 1:
+            results = [_replay(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(jobs))) as pool:
+                results = list(pool.map(_replay, jobs))
+
+        days: List[ReplayDay] = []
+        panel: List[Dict[str, Any]] = []
+        for chunk_days, chunk_panel in results:
+            days.extend(chunk_days)
+            panel.extend(chunk_panel)
+        logger.info(
+            "Replayed %d dates: %d unhealthy, %d panel rows",
+            len(days), sum(1 for d in days if not d.healthy), len(panel),
+        )
+        return BacktestResult(days, panel)
+
+    def _job(self, dates: Sequence[date]) -> _Job:
+        return _Job(
+            str(self.archive), str(self.facts_index), self.config, self.account,
+            self.max_staleness_days, self.ticker_staleness_days, tuple(dates),
+        )
+
+
+def chunks(items: Sequence[Any], count: int) -> List[Sequence[Any]]:
+    """`items` in at most `count` contiguous, nearly equal runs.
+
+    Shared with `sweep`, which splits variants across workers the same way.
+    """
+    count = max(1, min(count, len(items)))
+    size, extra = divmod(len(items), count)
+    out, start = [], 0
+    for n in range(count):
+        stop = start + size + (1 if n < extra else 0)
+        if stop > start:
+            out.append(items[start:stop])
+        start = stop
+    return out
+
+
+class PointInTimeRunways:
+    """Runway from a facts index as of any date, computed once per filing.
+
+    Stands in for the engine's `RunwayTable`. What `runway_from_facts` sees
+    with `filed_by` changes only when the filer files something, so a result
+    is kept under the number of filing dates it saw and reused on every
+    later date until the next filing. CIKs the index lacks are left to the
+    engine's facts source, which reports them as unknown runway.
+    """
+
+    name = "sec.companyfacts.as_of"
+
+    def __init__(self, index: FactsIndex) -> None:
+        self.index = index
+        self._facts = CompanyFactsSource(client=None)
+        self._filings: Dict[int, Optional[Tuple[Any, List[str]]]] = {}
+        self._memo: Dict[Tuple[int, int], CashRunway] = {}
+
+    def lookup(self, cik: str, as_of: date) -> Optional[CashRunway]:
+        number = int(cik)
+        if number not in self._filings:
+            self._filings[number] = self._load(number)
+        if self._filings[number] is None:
+            return None
+        payload, filed = self._filings[number]
+        key = (number, bisect.bisect_right(filed, as_of.isoformat()))
+        if key not in self._memo:
+            url = f"{self.index.path.name}#CIK{number:010d}"
+            self._memo[key] = self._facts.runway_from_facts(cik, payload, url, filed_by=as_of)
+        return self._memo[key]
+
+    def _load(self, cik: int) -> Optional[Tuple[Any, List[str]]]:
+        payload = self.index.get(cik)
+        if payload is None:
+            return None
+        filed = {
+            fact["filed"]
+            for series in ((payload.get("facts") or {}).get("us-gaap") or {}).values()
+            for fact in ((series.get("units") or {}).get("USD") or [])
+            if isinstance(fact, dict) and _parse_date(fact.get("filed")) is not None
+        }
+        return payload, sorted(filed)
+
+
+# Opened once per worker process and reused by every chunk it is given.
+_OPEN: Dict[Tuple[str, str], Tuple[SnapshotArchive, FactsIndex, PointInTimeRunways]] = {}
+
+
+def _opened(job: _Job) -> Tuple[SnapshotArchive, FactsIndex, PointInTimeRunways]:
+    key = (job.archive, job.facts_index)
+    if key not in _OPEN:
+        index = FactsIndex(Path(job.facts_index))
+        _OPEN[key] = (SnapshotArchive.load(Path(job.archive)), index, PointInTimeRunways(index))
+    return _OPEN[key]
+
+
+def _replay(job: _Job) -> Tuple[List[ReplayDay], List[Dict[str, Any]]]:
+    archive, facts_index, runways = _opened(job)
+    studies, tickers = archive.timeline(STUDIES), archive.timeline(TICKERS)
+    parsed: Dict[Any, Any] = {}
+    days, panel = [], []
+    for as_of in job.dates:
+        engine = SignalEngine(
+            catalysts_source=SnapshotCatalystSource(
+                archive, as_of, job.max_staleness_days, studies, parsed
+            ),
+            resolver=SnapshotTickerResolver(archive, as_of, job.ticker_staleness_days, tickers),
+            facts=CompanyFactsSource(client=None, bulk_index=facts_index, as_of=as_of),
+            config=job.config,
+            account=job.account,
+            runway_table=runways,
+        )
+        report = engine.run(as_of=as_of, dry_run=True)
+        days.append(_day(as_of, report))
+        panel.extend(_panel_rows(as_of, report))
+    return days, panel
+
+
+def _day(as_of: date, report: RunReport) -> ReplayDay:
+    errors = [f"{s.name}: {s.error}" for s in report.sources if not s.ok]
+    if report.fatal_error:
+        errors.insert(0, report.fatal_error)
+    return ReplayDay(
+        as_of, report.healthy, report.catalysts_found, report.catalysts_in_window,
+        len(report.signals), len(report.vetoes), errors,
+    )
+
+
+def _panel_rows(as_of: date, report: RunReport) -> List[Dict[str, Any]]:
+    rows = []
+    for signal in report.signals:
+        catalyst = signal.catalyst
+        rows.append({
+            "as_of": as_of.isoformat(),
+            "kind": "signal",
+            "outcome": signal.decision.value,
+            "ticker": signal.ticker,
+            "nct_id": catalyst.external_id,
+            "sponsor": catalyst.sponsor,
+            "event_date": catalyst.event_date.isoformat(),
+            "phase": catalyst.phase_label,
+            "reason": signal.reason,
+        })
+    for veto in report.vetoes:
+        catalyst = veto.catalyst
+        rows.append({
+            "as_of": as_of.isoformat(),
+            "kind": "veto",
+            "outcome": veto.screen_name,
+            "ticker": veto.ticker or "",
+            "nct_id": catalyst.external_id if catalyst else "",
+            "sponsor": catalyst.sponsor if catalyst else "",
+            "event_date": catalyst.event_date.isoformat() if catalyst else "",
+            "phase": catalyst.phase_label if catalyst else "",
+            "reason": veto.reason,
+        })
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay the signal engine over past dates from a snapshot archive"
+    )
+    parser.add_argument("--archive", type=Path, required=True,
+                        help="Snapshot archive recorded by run_nightly --snapshot-archive")
+    parser.add_argument("--facts-index", type=Path, required=True,
+                        help="Facts index from sources.bulkfacts, for point-in-time runway")
+    parser.add_argument("--start", required=True, metavar="YYYY-MM-DD")
+    parser.add_argument("--end", required=True, metavar="YYYY-MM-DD")
+    parser.add_argument("--step-days", type=int, default=1)
+    parser.add_argument("--max-staleness-days", type=int, default=7)
+    parser.add_argument("--ticker-staleness-days", type=int, default=None,
+                        help="Staleness allowed for ticker captures (default: as above)")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=Path, required=True, help="Panel CSV to write")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    result = Backtest(
+        args.archive, args.facts_index, SignalConfig.from_env(),
+        max_staleness_days=args.max_staleness_days,
+        workers=args.workers,
+        ticker_staleness_days=args.ticker_staleness_days,
+    ).run(date.fromisoformat(args.start), date.fromisoformat(args.end), args.step_days)
+    result.write_panel(args.out)
+    for day in result.unhealthy:
+        print(f"{day.as_of}: unhealthy -- {'; '.join(day.errors)}")
+    print(f"{len(result.days)} dates replayed, {len(result.unhealthy)} unhealthy, "
+          f"{len(result.panel)} panel rows -> {args.out}")
+    return 0 if not result.unhealthy else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
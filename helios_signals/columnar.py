@@ -0,0 +1,162 @@
+"""A minimal columnar file format on the standard library.
+
+Tables the pipeline computes in bulk -- runway for every filer at every as-of
+date, say -- are read far more often than written, and almost always one or
+two columns at a time. Row-oriented JSON makes every read parse everything.
+Here each column is a typed `array.array` written contiguously, and a reader
+memory-maps the file and exposes each column as a zero-copy `memoryview`, so
+opening a table costs a header parse and reading a value costs an index.
+
+File layout:
+
+    "HXCT" | version u16 | pad
+    column data, each column starting on an 8-byte boundary
+    header JSON: row count, byte order, per-column typecode/offset, caller meta
+    footer: header offset u64 | header length u32 | "HXCT"
+
+Values are stored in the writer's native byte order, which the header records;
+a reader on a machine with the other byte order refuses the file rather than
+misread it. Only fixed-width numeric typecodes are supported. Callers encode
+strings as small integer codes and keep the dictionary in `meta`.
+"""
+
+from __future__ import annotations
+
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+_MAGIC = b"HXCT"
+_VERSION = 1
+_PRELUDE = struct.Struct("<4sHxx")
+_FOOTER = struct.Struct("<QI4s")
+_ALIGN = 8
+_TYPECODES = frozenset("bBhHiIlLqQfd")
+
+
+class ColumnarError(ValueError):
+    """The file is not a readable columnar table."""
+
+
+def write_table(
+    path: Path, columns: Mapping[str, array.array], meta: Optional[Mapping[str, Any]] = None
+) -> None:
+    """Write equal-length typed columns to `path`, atomically.
+
+    `meta` is stored verbatim in the header and must be JSON-serialisable.
+    """
+    lengths = {len(col) for col in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"columns differ in length: {sorted(lengths)}")
+    for name, col in columns.items():
+        if not isinstance(col, array.array) or col.typecode not in _TYPECODES:
+            raise ValueError(f"column {name!r} must be a numeric array.array")
+
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    specs = []
+    with open(tmp, "wb") as out:
+        out.write(_PRELUDE.pack(_MAGIC, _VERSION))
+        for name, col in columns.items():
+            out.write(b"\0" * (-out.tell() % _ALIGN))
+            specs.append({"name": name, "type": col.typecode, "offset": out.tell()})
+            col.tofile(out)
+        header = json.dumps(
+            {
+                "rows": lengths.pop() if lengths else 0,
+                "byteorder": sys.byteorder,
+                "columns": specs,
+                "meta": dict(meta or {}),
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+        header_offset = out.tell()
+        out.write(header)
+        out.write(_FOOTER.pack(header_offset, len(header), _MAGIC))
+    os.replace(tmp, path)
+
+
+class ColumnarTable:
+    """Read-only, memory-mapped view of a file written by `write_table`.
+
+    Columns are `memoryview`s into the mapping: slicing and indexing them does
+    not copy. They are invalid once the table is closed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise ColumnarError(f"Cannot open {self.path}: {exc}") from exc
+        try:
+            self._header = self._read_header()
+        except ColumnarError:
+            self._mm.close()
+            raise
+        self.rows: int = self._header["rows"]
+        self.meta: Dict[str, Any] = self._header["meta"]
+        self._views: Dict[str, memoryview] = {}
+        self._base = memoryview(self._mm)
+        for spec in self._header["columns"]:
+            width = array.array(spec["type"]).itemsize
+            start = spec["offset"]
+            raw = self._base[start:start + self.rows * width]
+            self._views[spec["name"]] = raw.cast(spec["type"])
+
+    def _read_header(self) -> Dict[str, Any]:
+        size = len(self._mm)
+        if size < _PRELUDE.size + _FOOTER.size:
+            raise ColumnarError(f"{self.path} is not a columnar table")
+        magic, version = _PRELUDE.unpack_from(self._mm, 0)
+        header_offset, header_len, tail_magic = _FOOTER.unpack_from(self._mm, size - _FOOTER.size)
+        if magic != _MAGIC or tail_magic != _MAGIC or version != _VERSION:
+            raise ColumnarError(f"{self.path} is not a version {_VERSION} columnar table")
+        if header_offset + header_len != size - _FOOTER.size:
+            raise ColumnarError(f"{self.path} is truncated or corrupt")
+        try:
+            header = json.loads(self._mm[header_offset:header_offset + header_len])
+        except ValueError as exc:
+            raise ColumnarError(f"{self.path} has an unreadable header: {exc}") from exc
+        if header.get("byteorder") != sys.byteorder:
+            raise ColumnarError(
+                f"{self.path} was written {header.get('byteorder')}-endian; "
+                f"this machine is {sys.byteorder}-endian"
+            )
+        for spec in header["columns"]:
+            end = spec["offset"] + header["rows"] * array.array(spec["type"]).itemsize
+            if spec["type"] not in _TYPECODES or end > header_offset:
+                raise ColumnarError(f"{self.path}: column {spec['name']!r} is out of bounds")
+        return header
+
+    @property
+    def names(self) -> Iterable[str]:
+        return list(self._views)
+
+    def column(self, name: str) -> memoryview:
+        try:
+            return self._views[name]
+        except KeyError:
+            raise KeyError(f"{self.path.name} has no column {name!r}") from None
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __enter__(self) -> "ColumnarTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        self._views.clear()
+        self._base.release()
+        self._mm.close()
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -62,7 +62,44 @@ class SignalConfig:
     max_signals_per_run: int = 3
     request_timeout_s: int = 30
     max_retries: int = 4
+    # Concurrent SEC companyfacts fetches.
+    runway_fetch_workers: int = 4
+    # Client-side request rates by domain (subdomains included), shared by
+    # every source on the client. SEC's fair-access policy allows 10 requests
+    # per second and enforces it with IP blocks, so that figure is a ceiling,
+    # not a target. clinicaltrials.gov publishes no fixed rate; add one here if
+    # it starts answering 429.
+    rate_limits_per_s: Dict[str, float] = field(default_factory=lambda: {"sec.gov": 10.0})
     user_agent: str = "Helios-X/0.1 (research; andrewncooper@gmail.com)"
+    # Directory for the conditional-GET response cache. None disables it, in
+    # which case every run downloads every payload in full.
+    http_cache_dir: Optional[str] = None
+    # Index built from SEC's bulk companyfacts.zip (see sources.bulkfacts).
+    # When set, runway is computed from it offline and companyfacts is never
+    # requested over HTTP.
+    companyfacts_index: Optional[str] = None
+    # Precomputed runway table (see sources.runway_table). CIKs it covers are
+    # screened from it; a row older than runway_table_max_age_days is treated
+    # as absent and the CIK is fetched instead.
+    runway_table: Optional[str] = None
+    runway_table_max_age_days: int = 7
+    # Local store of ClinicalTrials.gov study records (see
+    # sources.catalyst_store). When set, the catalyst calendar is delta-synced
+    # against it, with a full download at least every catalyst_full_refresh_days.
+    catalyst_store: Optional[str] = None
+    catalyst_full_refresh_days: int = 7
+    # Push the sponsor-class, intervention-type and completion-window screens
+    # into the clinicaltrials.gov query, so records they would discard are
+    # never downloaded. The screens still run locally either way; check the
+    # pushed-down query with `run_nightly --verify-query` after changing them.
+    # Off by default: it changes what catalysts_found and the veto log count,
+    # so enabling it is a ledger change of its own, made once a recorded
+    # --verify-query run shows no disagreements.
+    catalyst_prefilter: bool = False
+    # Compiled ticker index (see sources.ticker_index). When set, the resolver
+    # reuses it while company_tickers.json is unchanged and rewrites it when
+    # the file changes.
+    ticker_index: Optional[str] = None
 
     # Phases worth tracking. Phase 1 readouts rarely move a stock in a
     # tradeable, predictable way and add noise to a thin universe.
@@ -77,6 +114,31 @@ class SignalConfig:
             cfg.min_cash_runway_months = float(v)
         if v := os.environ.get("HELIOS_MAX_SIGNALS"):
             cfg.max_signals_per_run = int(v)
+        if v := os.environ.get("HELIOS_HTTP_CACHE_DIR"):
+            cfg.http_cache_dir = v
+        if v := os.environ.get("HELIOS_COMPANYFACTS_INDEX"):
+            cfg.companyfacts_index = v
+        if v := os.environ.get("HELIOS_RUNWAY_TABLE"):
+            cfg.runway_table = v
+        if v := os.environ.get("HELIOS_CATALYST_STORE"):
+            cfg.catalyst_store = v
+        if v := os.environ.get("HELIOS_TICKER_INDEX"):
+            cfg.ticker_index = v
+        if v := os.environ.get("HELIOS_CATALYST_PREFILTER"):
+            cfg.catalyst_prefilter = v.strip().lower() not in ("0", "false", "no", "off")
+        if v := os.environ.get("HELIOS_RATE_LIMITS"):
+            # "sec.gov=8,clinicaltrials.gov=5"
+            for rule in filter(None, (r.strip() for r in v.split(","))):
+                domain, _, rate = (part.strip() for part in rule.partition("="))
+                try:
+                    per_s = float(rate) if domain else None
+                except ValueError:
+                    per_s = None
+                if per_s is None:
+                    raise ValueError(
+                        f"HELIOS_RATE_LIMITS: bad rule {rule!r}, expected DOMAIN=REQUESTS_PER_S"
+                    )
+                cfg.rate_limits_per_s[domain] = per_s
         return cfg
 
     def validate(self) -> None:
@@ -95,6 +157,18 @@ class SignalConfig:
             raise ValueError("min_enrollment must be at least 1")
         if self.max_market_cap_usd <= 0:
             raise ValueError("max_market_cap_usd must be positive")
+        if self.runway_fetch_workers < 1:
+            raise ValueError("runway_fetch_workers must be at least 1")
+        if self.runway_table_max_age_days < 0:
+            raise ValueError("runway_table_max_age_days must be non-negative")
+        if self.catalyst_full_refresh_days < 1:
+            raise ValueError("catalyst_full_refresh_days must be at least 1")
+        if any(rate <= 0 for rate in self.rate_limits_per_s.values()):
+            raise ValueError("rate_limits_per_s values must be positive")
+        if not 0 < self.rate_limits_per_s.get("sec.gov", 0) <= 10:
+            raise ValueError(
+                "rate_limits_per_s['sec.gov'] must be in (0, 10]: SEC fair-access limit"
+            )
 
 
 @dataclass
@@ -23,32 +23,102 @@ strictly more useful than a crash.
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Generator, List, Optional, Tuple, Union
 
 from .config import AccountConfig, SignalConfig
 from .knowledge import PhasePriors
 from .models import (
+    CashRunway,
     Catalyst,
     Decision,
     RunReport,
     ScreenResult,
     Signal,
     SourceReport,
+    VetoRecord,
+    VetoScreen,
     utcnow,
 )
 from .profiles import BIOTECH, SectorProfile
 from .screens import screen_catalyst_window, screen_dilution
+from .screens.batch import GATES, CatalystBatch, first_failures, sector_masks
 from .screens.biotech import screen_materiality
 from .sources.clinicaltrials import ClinicalTrialsSource
+from .sources.runway_table import RunwayTable
 from .sources.sec import CompanyFactsSource, TickerResolver
 
 logger = logging.getLogger(__name__)
 
 
+class _Unknown:
+    pass
+
+
+UNKNOWN = _Unknown()
+
+
+class _Candidate:
+    """An in-window catalyst after the checks that need no network.
+
+    When the batch gates have already decided the sector screens, their
+    `ScreenResult`s are only built if something reads them: the signal for a
+    survivor, or a human reading the veto for a rejection. Candidates past
+    `max_signals_per_run` are never looked at, so theirs never are.
+    """
+
+    __slots__ = ("catalyst", "timing", "resolved", "_profile", "_config", "_failed_at",
+                 "_results")
+
+    def __init__(
+        self,
+        catalyst: Catalyst,
+        timing: ScreenResult,
+        profile: SectorProfile,
+        config: SignalConfig,
+        failed_at: Union[int, None, _Unknown] = UNKNOWN,
+    ) -> None:
+        self.catalyst = catalyst
+        self.timing = timing
+        self.resolved: Optional[Tuple[str, str]] = None
+        self._profile = profile
+        self._config = config
+        # Position in profile.screens of the first screen the gates failed,
+        # None if they passed every one, UNKNOWN if there were no gates.
+        self._failed_at = failed_at
+        self._results: Optional[List[ScreenResult]] = None
+
+    @property
+    def sector_results(self) -> List[ScreenResult]:
+        if self._results is None:
+            self._results = self._profile.apply(self.catalyst, self._config)
+        return self._results
+
+    @property
+    def passes_sector_screens(self) -> bool:
+        """The gates' verdict if there is one, else the screens' (run now)."""
+        if self._failed_at is UNKNOWN:
+            return self._profile.first_failure(self.sector_results) is None
+        return self._failed_at is None
+
+    def sector_veto(self) -> VetoRecord:
+        if self._failed_at is UNKNOWN:
+            failure = self._profile.first_failure(self.sector_results)
+            return VetoRecord(VetoScreen.named(failure.name), self.catalyst, result=failure)
+        screen = self._profile.screens[self._failed_at]
+        return VetoRecord(
+            VetoScreen.named(GATES[screen][0]),
+            self.catalyst,
+            resolve=functools.partial(screen, self.catalyst, self._config),
+        )
+
+
 class SignalEngine:
     def __init__(
         self,
@@ -60,6 +130,7 @@ class SignalEngine:
         price_lookup=None,
         profile: SectorProfile = BIOTECH,
         market_cap_lookup=None,
+        runway_table: Optional[RunwayTable] = None,
     ) -> None:
         self.catalysts_source = catalysts_source
         self.resolver = resolver
@@ -76,87 +147,146 @@ class SignalEngine:
         # unavailable until a price source is wired; materiality annotates
         # rather than vetoes while it returns None.
         self.market_cap_lookup = market_cap_lookup
+        # Precomputed runway (sources.runway_table). CIKs it answers are not
+        # fetched; the rest still go to self.facts.
+        self.runway_table = runway_table
 
     def run(self, as_of: Optional[date] = None, dry_run: bool = True) -> RunReport:
         as_of = as_of or date.today()
+        report = self._start(as_of, dry_run)
+        if report.fatal_error:
+            return self._finish(report)
+
+        # The ticker index shares no data with the catalyst calendar, so it
+        # downloads on a worker thread while the calendar pages in here. Both
+        # are joined before anything is screened; each report times only its
+        # own source.
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="resolver") as pool:
+            resolver_future = pool.submit(self._load_resolver)
+            catalysts, catalysts_report = self._load_catalysts()
+            resolver_report = resolver_future.result()
+        report.sources.extend([catalysts_report, resolver_report])
+        if not report.healthy:
+            return self._finish(report)
+
+        catalysts = self._dedupe(catalysts)
+        report.catalysts_found = len(catalysts)
+        in_window = self._apply_timing(catalysts, as_of, report)
+        report.catalysts_in_window = len(in_window)
+
+        report.signals = self._build_signals(in_window, as_of, report)
+        return self._finish(report)
+
+    async def arun(self, as_of: Optional[date] = None, dry_run: bool = True) -> RunReport:
+        """`run` on asyncio. Sources must have been built on AsyncHttpJsonClient.
+
+        The catalyst calendar and the ticker index load concurrently, as in
+        `run`, and each window of runway fetches is in flight together.
+        Fail-closed behaviour and output order are identical to `run`.
+        """
+        as_of = as_of or date.today()
+        report = self._start(as_of, dry_run)
+        if report.fatal_error:
+            return self._finish(report)
+
+        (catalysts, catalysts_report), resolver_report = await asyncio.gather(
+            self._aload_catalysts(), self._aload_resolver()
+        )
+        report.sources.extend([catalysts_report, resolver_report])
+        if not report.healthy:
+            return self._finish(report)
+
+        catalysts = self._dedupe(catalysts)
+        report.catalysts_found = len(catalysts)
+        in_window = self._apply_timing(catalysts, as_of, report)
+        report.catalysts_in_window = len(in_window)
+
+        staged = self._stage(in_window)
+        self._record_memo(report)
+        precomputed = self._lookup_runways(self._distinct_ciks(staged), as_of, report)
+        if not report.healthy:
+            return self._finish(report)
+        loop = self._signals_from(staged, report, precomputed)
+        try:
+            window = next(loop)
+            while True:
+                window = loop.send(await self._afetch_runways(window))
+        except StopIteration as done:
+            report.signals = done.value
+        return self._finish(report)
+
+    def _start(self, as_of: date, dry_run: bool) -> RunReport:
         report = RunReport(
             run_id=f"{as_of.isoformat()}-{uuid.uuid4().hex[:8]}",
             started_at=utcnow().isoformat(),
             dry_run=dry_run,
         )
-
         try:
             self.config.validate()
             self.account.validate()
         except ValueError as exc:
             report.fatal_error = f"Invalid configuration: {exc}"
-            report.finished_at = utcnow().isoformat()
-            return report
-
-        catalysts = self._load_catalysts(report)
-        if not report.healthy:
-            report.finished_at = utcnow().isoformat()
-            return report
-
-        catalysts = self._dedupe(catalysts)
-        report.catalysts_found = len(catalysts)
-
-        if not self._load_resolver(report):
-            report.finished_at = utcnow().isoformat()
-            return report
-
-        in_window = self._apply_timing(catalysts, as_of, report)
-        report.catalysts_in_window = len(in_window)
+        return report
 
-        report.signals = self._build_signals(in_window, as_of, report)
+    @staticmethod
+    def _finish(report: RunReport) -> RunReport:
         report.finished_at = utcnow().isoformat()
         return report
 
     # ---------------------------------------------------------------- sources
 
-    def _load_catalysts(self, report: RunReport) -> List[Catalyst]:
+    @staticmethod
+    def _source_report(
+        source, ok: bool, records: int, started: float, error: Optional[str] = None
+    ) -> SourceReport:
+        stats = source.cache_stats() if hasattr(source, "cache_stats") else None
+        return SourceReport(
+            source.name, ok, records, int((time.monotonic() - started) * 1000), error,
+            cache_hits=stats.hits if stats else 0,
+            cache_misses=stats.misses if stats else 0,
+            cache_bytes_saved=stats.bytes_saved if stats else 0,
+        )
+
+    def _load_catalysts(self) -> Tuple[List[Catalyst], SourceReport]:
         started = time.monotonic()
         try:
             catalysts = self.catalysts_source.fetch(self.config.tracked_phases)
         except Exception as exc:  # noqa: BLE001 - see note below
-            report.sources.append(
-                SourceReport(
-                    self.catalysts_source.name, False, 0,
-                    int((time.monotonic() - started) * 1000), str(exc),
-                )
-            )
-            return []
+            return [], self._source_report(self.catalysts_source, False, 0, started, str(exc))
+        return catalysts, self._catalysts_loaded(catalysts, started)
 
-        elapsed = int((time.monotonic() - started) * 1000)
-        report.sources.append(
-            SourceReport(self.catalysts_source.name, True, len(catalysts), elapsed)
-        )
+    async def _aload_catalysts(self) -> Tuple[List[Catalyst], SourceReport]:
+        started = time.monotonic()
+        try:
+            catalysts = await self.catalysts_source.afetch(self.config.tracked_phases)
+        except Exception as exc:  # noqa: BLE001 - see _load_catalysts
+            return [], self._source_report(self.catalysts_source, False, 0, started, str(exc))
+        return catalysts, self._catalysts_loaded(catalysts, started)
+
+    def _catalysts_loaded(self, catalysts: List[Catalyst], started: float) -> SourceReport:
         if not catalysts:
             logger.warning(
                 "%s returned zero catalysts. This is unusual and may indicate a "
                 "schema change rather than a quiet calendar.",
                 self.catalysts_source.name,
             )
-        return catalysts
+        return self._source_report(self.catalysts_source, True, len(catalysts), started)
 
-    def _load_resolver(self, report: RunReport) -> bool:
+    def _load_resolver(self) -> SourceReport:
         started = time.monotonic()
         try:
             count = self.resolver.load()
         except Exception as exc:  # noqa: BLE001 - see _load_catalysts
-            report.sources.append(
-                SourceReport(
-                    self.resolver.name, False, 0,
-                    int((time.monotonic() - started) * 1000), str(exc),
-                )
-            )
-            return False
-        report.sources.append(
-            SourceReport(
-                self.resolver.name, True, count, int((time.monotonic() - started) * 1000)
-            )
-        )
-        return True
+            return self._source_report(self.resolver, False, 0, started, str(exc))
+        return self._source_report(self.resolver, True, count, started)
+
+    async def _aload_resolver(self) -> SourceReport:
+        started = time.monotonic()
+        try:
+            count = await self.resolver.aload()
+        except Exception as exc:  # noqa: BLE001 - see _load_catalysts
+            return self._source_report(self.resolver, False, 0, started, str(exc))
+        return self._source_report(self.resolver, True, count, started)
 
     @staticmethod
     def _dedupe(catalysts: List[Catalyst]) -> List[Catalyst]:
@@ -179,15 +309,112 @@ class SignalEngine:
     def _apply_timing(
         self, catalysts: List[Catalyst], as_of: date, report: RunReport
     ) -> List[Tuple[Catalyst, ScreenResult]]:
-        kept: List[Tuple[Catalyst, ScreenResult]] = []
-        for cat in catalysts:
-            result = screen_catalyst_window(cat, as_of, self.config)
-            if result.passed:
-                kept.append((cat, result))
-        # Soonest catalyst first: the exit deadline is nearest, so it is the
-        # most time-sensitive to act on.
-        kept.sort(key=lambda pair: pair[0].event_date)
-        return kept
+        """In-window catalysts, soonest first, each with its timing result.
+
+        The window is applied to the whole set as one batch gate, so a reject
+        costs no `ScreenResult`; only the survivors are screened in full.
+        Soonest first because the exit deadline is nearest, so it is the most
+        time-sensitive to act on.
+        """
+        batch = CatalystBatch(catalysts)
+        return [
+            (cat, screen_catalyst_window(cat, as_of, self.config))
+            for cat in batch.rows(batch.timing_mask(as_of, self.config))
+        ]
+
+    def _stage(self, in_window: List[Tuple[Catalyst, ScreenResult]]) -> List[_Candidate]:
+        """Run the network-free checks for every in-window catalyst.
+
+        Sector screens first: they are free (no network) and remove the bulk of
+        the candidates, so running them before ticker resolution and the runway
+        fetch saves the majority of API calls. When every screen in the profile
+        has a batch gate, pass/fail comes from the gates and the screens
+        themselves run only on demand; otherwise each catalyst is screened here.
+        """
+        batch = CatalystBatch(cat for cat, _ in in_window)
+        masks = sector_masks(batch, self.profile.screens, self.config)
+        failed_at = first_failures(batch, masks) if masks is not None else None
+
+        staged: List[_Candidate] = []
+        # in_window is in event-date order already, so its positions are the
+        # batch's row numbers.
+        for row, (catalyst, timing) in enumerate(in_window):
+            candidate = _Candidate(
+                catalyst,
+                timing,
+                self.profile,
+                self.config,
+                UNKNOWN if failed_at is None else failed_at[row],
+            )
+            if candidate.passes_sector_screens:
+                candidate.resolved = self.resolver.resolve(catalyst.sponsor)
+            staged.append(candidate)
+        return staged
+
+    def _record_memo(self, report: RunReport) -> None:
+        """Copy the resolver's memo counters onto its source report.
+
+        Resolution happens after the resolver's report is written, so the
+        counters are filled in once staging is done.
+        """
+        hits = getattr(self.resolver, "memo_hits", None)
+        if hits is None:
+            return
+        for source in report.sources:
+            if source.name == self.resolver.name:
+                source.memo_hits = hits
+                source.memo_misses = self.resolver.memo_misses
+
+    def _fetch_runways(
+        self, ciks: List[str]
+    ) -> Tuple[Dict[str, CashRunway], Optional[Exception]]:
+        """Fetch runway for every CIK concurrently, returned in input order.
+
+        Concurrency is bounded by worker count here; the request rate is held
+        to SEC's fair-access limit by the HTTP client's rate limiter, which the
+        ticker resolver shares. The first failure, in input order rather than
+        completion order, is returned alongside whatever succeeded before it so
+        the run can report it deterministically.
+        """
+        runways: Dict[str, CashRunway] = {}
+        if not ciks:
+            return runways, None
+
+        workers = min(self.config.runway_fetch_workers, len(ciks))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="runway") as pool:
+            futures = [(cik, pool.submit(self.facts.fetch, cik)) for cik in ciks]
+            for cik, future in futures:
+                try:
+                    runways[cik] = future.result()
+                except Exception as exc:  # noqa: BLE001 - see _load_catalysts
+                    for _, pending in futures:
+                        pending.cancel()
+                    logger.error("Runway fetch failed for CIK %s", cik, exc_info=exc)
+                    return runways, exc
+        return runways, None
+
+    async def _afetch_runways(
+        self, ciks: List[str]
+    ) -> Tuple[Dict[str, CashRunway], Optional[Exception]]:
+        """`_fetch_runways` on asyncio, with the same ordering guarantees."""
+        runways: Dict[str, CashRunway] = {}
+        slots = asyncio.Semaphore(self.config.runway_fetch_workers)
+
+        async def fetch(cik: str) -> CashRunway:
+            async with slots:
+                return await self.facts.afetch(cik)
+
+        tasks = [(cik, asyncio.ensure_future(fetch(cik))) for cik in ciks]
+        for cik, task in tasks:
+            try:
+                runways[cik] = await task
+            except Exception as exc:  # noqa: BLE001 - see _load_catalysts
+                for _, pending in tasks:
+                    pending.cancel()
+                await asyncio.gather(*(t for _, t in tasks), return_exceptions=True)
+                logger.error("Runway fetch failed for CIK %s", cik, exc_info=exc)
+                return runways, exc
+        return runways, None
 
     def _build_signals(
         self,
@@ -195,46 +422,103 @@ class SignalEngine:
         as_of: date,
         report: RunReport,
     ) -> List[Signal]:
+        staged = self._stage(in_window)
+        self._record_memo(report)
+        precomputed = self._lookup_runways(self._distinct_ciks(staged), as_of, report)
+        if not report.healthy:
+            return []
+        loop = self._signals_from(staged, report, precomputed)
+        try:
+            window = next(loop)
+            while True:
+                window = loop.send(self._fetch_runways(window))
+        except StopIteration as done:
+            return done.value
+
+    def _lookup_runways(
+        self, ciks: List[str], as_of: date, report: RunReport
+    ) -> Dict[str, CashRunway]:
+        """The runways the table answers for `ciks`; the rest are fetched."""
+        if self.runway_table is None or not ciks:
+            return {}
+        started = time.monotonic()
+        found: Dict[str, CashRunway] = {}
+        try:
+            for cik in ciks:
+                runway = self.runway_table.lookup(cik, as_of)
+                if runway is not None:
+                    found[cik] = runway
+        except Exception as exc:  # noqa: BLE001 - see _load_catalysts
+            report.sources.append(
+                self._source_report(
+                    self.runway_table, False, len(found), started,
+                    f"{type(exc).__name__}: {exc}",
+                )
+            )
+            return {}
+        report.sources.append(self._source_report(self.runway_table, True, len(found), started))
+        return found
+
+    @staticmethod
+    def _distinct_ciks(staged: List[_Candidate]) -> List[str]:
+        return list(dict.fromkeys(c.resolved[1] for c in staged if c.resolved))
+
+    def _runway_window(
+        self, staged: List[_Candidate], start: int, runways: Dict[str, CashRunway],
+        tickers_signalled: set, budget: int,
+    ) -> List[str]:
+        """The next `budget` distinct CIKs from `start` the loop will need.
+
+        Each can produce at most one signal, so with `budget` signals left the
+        loop reaches every one of them unless an earlier one fills the cap.
+        """
+        window: Dict[str, None] = {}
+        for candidate in staged[start:]:
+            if len(window) >= budget:
+                break
+            if not candidate.passes_sector_screens or candidate.resolved is None:
+                continue
+            ticker, cik = candidate.resolved
+            if ticker not in tickers_signalled and cik not in runways:
+                window[cik] = None
+        return list(window)
+
+    def _signals_from(
+        self,
+        staged: List[_Candidate],
+        report: RunReport,
+        precomputed: Dict[str, CashRunway],
+    ) -> Generator[List[str], Tuple[Dict[str, CashRunway], Optional[Exception]], List[Signal]]:
+        """The signal loop, as a generator that yields the CIKs it needs runway for.
+
+        The driver fetches each yielded window concurrently and sends back
+        `_fetch_runways`'s result. Windows are sized to the signals still
+        allowed, so runway is fetched only for CIKs the loop actually reaches
+        -- candidates past `max_signals_per_run` are never looked at, and a
+        failure on one of them cannot fail the run. Within a window, results
+        are read in staged order, so the outcome does not depend on which
+        fetch finished first.
+        """
+        runways = dict(precomputed)
+        fetched = 0
+        runway_started = time.monotonic()
         signals: List[Signal] = []
         tickers_signalled: set[str] = set()
-        runway_calls = 0
-        runway_started = time.monotonic()
 
-        for catalyst, timing in in_window:
+        for position, candidate in enumerate(staged):
             if len(signals) >= self.config.max_signals_per_run:
                 break
+            catalyst, timing = candidate.catalyst, candidate.timing
 
-            # Sector screens first: they are free (no network) and remove the
-            # bulk of the candidates, so running them before ticker resolution
-            # and the runway fetch saves the majority of API calls.
-            sector_results = self.profile.apply(catalyst, self.config)
-            sector_failure = self.profile.first_failure(sector_results)
-            if sector_failure is not None:
-                report.vetoes.append(
-                    {
-                        "sponsor": catalyst.sponsor,
-                        "external_id": catalyst.external_id,
-                        "screen": sector_failure.name,
-                        "reason": sector_failure.reason,
-                        "detail": sector_failure.detail,
-                    }
-                )
+            if not candidate.passes_sector_screens:
+                report.vetoes.append(candidate.sector_veto())
                 continue
 
-            resolved = self.resolver.resolve(catalyst.sponsor)
-            if resolved is None:
-                report.vetoes.append(
-                    {
-                        "sponsor": catalyst.sponsor,
-                        "external_id": catalyst.external_id,
-                        "screen": "ticker_resolution",
-                        "reason": "Sponsor name did not resolve to a listed ticker "
-                                  "(private, subsidiary, foreign, or renamed)",
-                    }
-                )
+            if candidate.resolved is None:
+                report.vetoes.append(VetoRecord(VetoScreen.TICKER_RESOLUTION, catalyst))
                 continue
 
-            ticker, cik = resolved
+            ticker, cik = candidate.resolved
             catalyst.ticker, catalyst.cik = ticker, cik
 
             # One position per name. A sponsor with three trials in the window
@@ -243,40 +527,31 @@ class SignalEngine:
             # small-cap biotech is the fastest route to a concentrated loss.
             if ticker in tickers_signalled:
                 report.vetoes.append(
-                    {
-                        "ticker": ticker,
-                        "external_id": catalyst.external_id,
-                        "screen": "one_position_per_ticker",
-                        "reason": f"A signal for {ticker} was already issued this run "
-                                  "from an earlier catalyst.",
-                    }
+                    VetoRecord(VetoScreen.ONE_POSITION_PER_TICKER, catalyst, ticker)
                 )
                 continue
 
-            try:
-                runway = self.facts.fetch(cik)
-            except Exception as exc:  # noqa: BLE001 - see _load_catalysts
-                logger.exception("Runway fetch failed for %s", ticker)
-                report.sources.append(
-                    SourceReport(
-                        self.facts.name, False, runway_calls,
-                        int((time.monotonic() - runway_started) * 1000),
-                        f"{type(exc).__name__}: {exc}",
-                    )
+            if cik not in runways:
+                window = self._runway_window(
+                    staged, position, runways, tickers_signalled,
+                    self.config.max_signals_per_run - len(signals),
                 )
-                return []
-            runway_calls += 1
-            dilution = screen_dilution(runway, self.config)
+                got, failure = yield window
+                runways.update(got)
+                fetched += len(got)
+                if failure is not None:
+                    report.sources.append(
+                        self._source_report(
+                            self.facts, False, fetched, runway_started,
+                            f"{type(failure).__name__}: {failure}",
+                        )
+                    )
+                    return []
+
+            dilution = screen_dilution(runways[cik], self.config)
             if not dilution.passed:
                 report.vetoes.append(
-                    {
-                        "ticker": ticker,
-                        "sponsor": catalyst.sponsor,
-                        "external_id": catalyst.external_id,
-                        "screen": dilution.name,
-                        "reason": dilution.reason,
-                        "detail": dilution.detail,
-                    }
+                    VetoRecord(VetoScreen.DILUTION, catalyst, ticker, result=dilution)
                 )
                 continue
 
@@ -285,18 +560,12 @@ class SignalEngine:
             )
             if not materiality.passed:
                 report.vetoes.append(
-                    {
-                        "ticker": ticker,
-                        "external_id": catalyst.external_id,
-                        "screen": materiality.name,
-                        "reason": materiality.reason,
-                        "detail": materiality.detail,
-                    }
+                    VetoRecord(VetoScreen.MATERIALITY, catalyst, ticker, result=materiality)
                 )
                 continue
 
             price = self._price(ticker)
-            screens = [timing, *sector_results, dilution, materiality]
+            screens = [timing, *candidate.sector_results, dilution, materiality]
 
             if price is None:
                 signals.append(
@@ -319,24 +588,19 @@ class SignalEngine:
 
             if not (self.config.min_price <= price <= self.config.max_price):
                 report.vetoes.append(
-                    {
-                        "ticker": ticker,
-                        "screen": "price_band",
-                        "reason": f"Price ${price:,.2f} outside "
-                                  f"${self.config.min_price:g}-${self.config.max_price:g}",
-                    }
+                    VetoRecord(
+                        VetoScreen.PRICE_BAND,
+                        catalyst,
+                        ticker,
+                        (price, self.config.min_price, self.config.max_price),
+                    )
                 )
                 continue
 
             qty, value, stop = self._size(price)
             if qty < 1:
                 report.vetoes.append(
-                    {
-                        "ticker": ticker,
-                        "screen": "sizing",
-                        "reason": f"Risk budget affords {qty:.2f} shares at ${price:,.2f}; "
-                                  "below one whole share.",
-                    }
+                    VetoRecord(VetoScreen.SIZING, catalyst, ticker, (qty, price))
                 )
                 continue
 
@@ -360,13 +624,8 @@ class SignalEngine:
             )
             tickers_signalled.add(ticker)
 
-        if runway_calls:
-            report.sources.append(
-                SourceReport(
-                    self.facts.name, True, runway_calls,
-                    int((time.monotonic() - runway_started) * 1000),
-                )
-            )
+        if fetched:
+            report.sources.append(self._source_report(self.facts, True, fetched, runway_started))
         return signals
 
     # ----------------------------------------------------------------- sizing
@@ -8,41 +8,460 @@ record that can be edited afterwards demonstrates nothing.
 
 JSONL rather than a database, deliberately: a database is mutable, lives
 somewhere else, and cannot be diffed by a human.
+
+Vetoes outnumber signals by two orders of magnitude and were most of every
+entry. With `veto_sidecar=True` a run's vetoes go to their own gzip file,
+`vetoes/<run_id>.jsonl.gz` beside the ledger, and the entry records their
+count per screen and the sidecar's SHA-256 instead. The hash keeps the
+sidecar as tamper-evident as the line that names it; `read_vetoes` checks it.
+
+Queries (`find`, `runs_between`, `get`) go through an index kept beside the
+ledger in `<ledger>.idx`: one small JSON line per run with the byte offset
+and length of its ledger line, a CRC of that line, and the keys it can be
+found by -- run ID, run date, healthy flag, and every ticker and NCT ID in
+its signals and vetoes. A query looks keys up in memory and then seeks to
+each matching line, so it reads only the runs it returns.
+
+The index is derived data and never trusted over the ledger. It is extended
+as runs are appended, caught up from the last indexed line when the ledger
+has grown without it, and rebuilt from scratch when its last entry no longer
+matches the ledger's bytes.
+
+One file that only ever grows is also one blob git rewrites in full on every
+run. With `segmented=True` runs are appended to a monthly segment,
+`runs-YYYY-MM.jsonl`, and the first append of a new month freezes the months
+before it: each is gzipped to `runs-YYYY-MM.jsonl.gz` and recorded in
+`runs.manifest.json` with its SHA-256 and a chain hash over every frozen
+segment before it, then the uncompressed file is removed. A frozen segment
+never changes again, so git stores it once; only the current month's file is
+rewritten nightly. `read` streams across all segments -- a pre-segmentation
+`runs.jsonl` first -- and refuses a frozen segment whose bytes no longer match
+the manifest. `verify` checks the whole chain, so removing, reordering or
+rewriting a past month is as visible as editing a line.
 """
 
 from __future__ import annotations
 
+import bisect
+import gzip
+import hashlib
+import io
 import json
 import logging
+import os
+import zlib
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .models import RunReport
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_LEDGER = Path("ledger/runs.jsonl")
+_MANIFEST_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class _Segment:
+    """One file of the ledger, in reading order.
+
+    `key` names the segment's uncompressed file and stays the same when the
+    segment is frozen, so the index's offsets -- into the uncompressed bytes
+    -- survive compression. `sha256` is set for frozen segments only.
+    """
+
+    key: str
+    path: Path
+    size: int
+    sha256: Optional[str] = None
 
 
 class RunLedger:
-    def __init__(self, path: Path = DEFAULT_LEDGER) -> None:
+    def __init__(
+        self,
+        path: Path = DEFAULT_LEDGER,
+        veto_sidecar: bool = False,
+        segmented: bool = False,
+        today: Callable[[], date] = date.today,
+    ) -> None:
         self.path = Path(path)
+        self.veto_sidecar = veto_sidecar
+        self.segmented = segmented
+        self._today = today
+        self.index_path = self.path.with_name(self.path.name + ".idx")
+        self.manifest_path = self.path.with_name(f"{self.path.stem}.manifest.json")
+        self._index: Optional[_LedgerIndex] = None
+
+    def _entry(self, report: RunReport) -> Dict[str, Any]:
+        if not self.veto_sidecar:
+            return report.to_dict()
+        entry = report.to_dict(include_vetoes=False)
+        entry["veto_sidecar"] = self._write_vetoes(report)
+        return entry
+
+    def _write_vetoes(self, report: RunReport) -> Dict[str, Any]:
+        """Write the sidecar (idempotently) and return its ledger summary.
+
+        The gzip header's timestamp is fixed, so the same vetoes always give
+        the same bytes and the same hash, however often this is called.
+        """
+        relative = Path("vetoes") / f"{report.run_id}.jsonl.gz"
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
+            for veto in report.vetoes:
+                line = json.dumps(veto.to_dict(), sort_keys=True, default=str)
+                gz.write(line.encode("utf-8") + b"\n")
+        data = buf.getvalue()
+        target = self.path.parent / relative
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+        return {
+            "path": relative.as_posix(),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "count": len(report.vetoes),
+            "by_screen": report.veto_counts(),
+        }
+
+    def read_vetoes(self, entry: Dict[str, Any]) -> Iterator[dict]:
+        """A ledger entry's vetoes, inline or from its sidecar.
+
+        Raises ValueError when the sidecar does not match the hash recorded
+        in the entry: it has been altered since the run, and its contents
+        cannot be trusted as the record of that run.
+        """
+        if "veto_sidecar" not in entry:
+            return iter(entry.get("vetoes") or ())
+        sidecar = entry["veto_sidecar"]
+        data = (self.path.parent / sidecar["path"]).read_bytes()
+        if hashlib.sha256(data).hexdigest() != sidecar["sha256"]:
+            raise ValueError(f"Veto sidecar {sidecar['path']} does not match its ledger hash")
+        return (json.loads(line) for line in gzip.decompress(data).splitlines() if line)
 
     def append(self, report: RunReport) -> Path:
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        line = json.dumps(report.to_dict(), sort_keys=True, default=str)
-        with self.path.open("a", encoding="utf-8") as fh:
-            fh.write(line + "\n")
-        logger.info("Ledger appended: %s (%s)", self.path, report.run_id)
-        return self.path
+        target = self.path
+        if self.segmented:
+            month = self._today().strftime("%Y-%m")
+            self._freeze_before(month)
+            target = self._segment_path(month)
+            if target.name in self._frozen():
+                raise ValueError(f"Ledger segment {target.name} is frozen; cannot append to it")
+        entry = self._entry(report)
+        line = (json.dumps(entry, sort_keys=True, default=str) + "\n").encode("utf-8")
+        with target.open("ab") as fh:
+            offset = fh.tell()
+            fh.write(line)
+        logger.info("Ledger appended: %s (%s)", target, report.run_id)
+
+        # The keys each veto writes, so this matches an index rebuilt from disk.
+        tickers = {s.ticker for s in report.signals} | {v.get("ticker") for v in report.vetoes}
+        ncts = {s.catalyst.external_id for s in report.signals} | {
+            v.get("external_id") for v in report.vetoes
+        }
+        self._extend_index(_IndexEntry.of(entry, target.name, offset, line, tickers, ncts))
+        return target
+
+    # ---------------------------------------------------------------- segments
+
+    def _segment_path(self, month: str) -> Path:
+        return self.path.with_name(f"{self.path.stem}-{month}{self.path.suffix}")
+
+    def _manifest(self) -> List[Dict[str, Any]]:
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return []
+        if data.get("format") != _MANIFEST_FORMAT:
+            raise ValueError(f"{self.manifest_path} is not a version {_MANIFEST_FORMAT} manifest")
+        return list(data.get("segments") or [])
+
+    def _frozen(self) -> Dict[str, Dict[str, Any]]:
+        return {record["segment"]: record for record in self._manifest()}
+
+    def _segments(self) -> List[_Segment]:
+        """Every ledger file in reading order.
+
+        A pre-segmentation `runs.jsonl` comes first, then frozen segments in
+        manifest order, then the open ones by month.
+        """
+        segments = []
+        if self.path.exists():
+            segments.append(_Segment(self.path.name, self.path, self.path.stat().st_size))
+        manifest = self._manifest()
+        for record in manifest:
+            segments.append(_Segment(
+                record["segment"], self.path.with_name(record["file"]),
+                record["bytes"], record["sha256"],
+            ))
+        frozen = {record["segment"] for record in manifest}
+        pattern = f"{self.path.stem}-[0-9][0-9][0-9][0-9]-[0-9][0-9]{self.path.suffix}"
+        for path in sorted(self.path.parent.glob(pattern)):
+            if path.name not in frozen:
+                segments.append(_Segment(path.name, path, path.stat().st_size))
+        return segments
+
+    def _freeze_before(self, month: str) -> None:
+        """Freeze every open segment from a month before `month`."""
+        frozen = self._frozen()
+        pattern = f"{self.path.stem}-[0-9][0-9][0-9][0-9]-[0-9][0-9]{self.path.suffix}"
+        for path in sorted(self.path.parent.glob(pattern)):
+            if path.name[len(self.path.stem) + 1:][:7] >= month:
+                continue
+            if path.name in frozen:
+                # Frozen by a run interrupted before it removed the original.
+                self._check_frozen(self._segment(frozen[path.name]))
+                path.unlink()
+                continue
+            self._freeze(path)
+
+    def _freeze(self, path: Path) -> None:
+        """Compress `path`, chain it into the manifest, then remove it.
+
+        Each step leaves a state the next append recovers from: the gzip file
+        is deterministic (fixed mtime) and simply rewritten if the manifest
+        never recorded it, and an original the manifest already records is
+        removed once its frozen copy is confirmed.
+        """
+        raw = path.read_bytes()
+        buf = io.BytesIO()
+        with gzip.GzipFile(fileobj=buf, mode="wb", mtime=0) as gz:
+            gz.write(raw)
+        data = buf.getvalue()
+        frozen = path.with_name(path.name + ".gz")
+        _write_atomic(frozen, data)
+
+        manifest = self._manifest()
+        digest = hashlib.sha256(data).hexdigest()
+        previous = manifest[-1]["chain"] if manifest else ""
+        manifest.append({
+            "segment": path.name,
+            "file": frozen.name,
+            "runs": sum(1 for line in raw.splitlines() if line.strip()),
+            "bytes": len(raw),
+            "sha256": digest,
+            "chain": _chain(previous, path.name, digest),
+        })
+        _write_atomic(
+            self.manifest_path,
+            json.dumps({"format": _MANIFEST_FORMAT, "segments": manifest}, indent=2).encode(),
+        )
+        path.unlink()
+        logger.info("Ledger segment frozen: %s (%d bytes -> %d)", frozen, len(raw), len(data))
+
+    def _segment(self, record: Dict[str, Any]) -> _Segment:
+        return _Segment(
+            record["segment"], self.path.with_name(record["file"]),
+            record["bytes"], record["sha256"],
+        )
+
+    def _check_frozen(self, segment: _Segment) -> None:
+        with segment.path.open("rb") as fh:
+            digest = hashlib.file_digest(fh, "sha256").hexdigest()
+        if digest != segment.sha256:
+            raise ValueError(f"Ledger segment {segment.path.name} does not match its manifest hash")
+
+    def verify(self) -> List[str]:
+        """Problems with the frozen segments; empty when the chain is intact.
+
+        Checks every frozen file against its manifest hash and recomputes the
+        chain, so a segment that was altered, removed, reordered or dropped
+        from the manifest is reported.
+        """
+        problems = []
+        previous = ""
+        for record in self._manifest():
+            segment = self._segment(record)
+            try:
+                self._check_frozen(segment)
+            except (OSError, ValueError) as exc:
+                problems.append(str(exc))
+            if record["chain"] != _chain(previous, record["segment"], record["sha256"]):
+                problems.append(f"Manifest chain breaks at {record['segment']}")
+            previous = record["chain"]
+        return problems
+
+    def _lines(self, segment: _Segment) -> Iterator[bytes]:
+        """A segment's raw lines. Frozen segments are checked before reading."""
+        if segment.sha256 is None:
+            with segment.path.open("rb") as fh:
+                yield from fh
+            return
+        self._check_frozen(segment)
+        with gzip.open(segment.path, "rb") as fh:
+            yield from fh
+
+    def _segment_bytes(self, segment: _Segment, offset: int, length: int) -> bytes:
+        if segment.sha256 is None:
+            with segment.path.open("rb") as fh:
+                fh.seek(offset)
+                return fh.read(length)
+        self._check_frozen(segment)
+        with gzip.open(segment.path, "rb") as fh:
+            fh.seek(offset)
+            return fh.read(length)
+
+    # ----------------------------------------------------------------- queries
+
+    def get(self, run_id: str) -> Optional[dict]:
+        """The entry for `run_id`, or None."""
+        return next(self.find(run_id=run_id), None)
 
-    def read(self) -> Iterator[dict]:
-        if not self.path.exists():
-            return iter(())
+    def runs_between(self, first: date, last: date) -> Iterator[dict]:
+        """Entries for runs dated `first` to `last` inclusive, in ledger order."""
+        return self.find(since=first, until=last)
+
+    def find(
+        self,
+        *,
+        run_id: Optional[str] = None,
+        ticker: Optional[str] = None,
+        nct_id: Optional[str] = None,
+        healthy: Optional[bool] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+    ) -> Iterator[dict]:
+        """Entries matching every criterion given, in ledger order.
+
+        `ticker` and `nct_id` match a run that signalled or vetoed them. The
+        run date is the as-of date in the run ID.
+        """
+        index = self._load_index()
+        positions = index.select(run_id, ticker, nct_id, healthy, since, until)
+        return self._read_at([index.entries[p] for p in positions])
+
+    def _read_at(self, entries: List["_IndexEntry"]) -> Iterator[dict]:
+        if not entries:
+            return
+        segments = {segment.key: segment for segment in self._segments()}
+        # A frozen segment is inflated once for all the entries read from it.
+        inflated: Dict[str, bytes] = {}
+        for entry in entries:
+            segment = segments[entry.segment]
+            if segment.sha256 is None:
+                yield json.loads(self._segment_bytes(segment, entry.offset, entry.length))
+                continue
+            if segment.key not in inflated:
+                inflated[segment.key] = self._segment_bytes(segment, 0, segment.size)
+            yield json.loads(inflated[segment.key][entry.offset:entry.offset + entry.length])
+
+    # ------------------------------------------------------------------- index
+
+    def _extend_index(self, entry: "_IndexEntry") -> None:
+        index = self._index
+        if index is not None and index.extent and index.extent[-1] == (entry.segment, entry.offset):
+            index.extent[-1] = (entry.segment, entry.offset + entry.length)
+        elif index is not None and entry.offset == 0 and entry.segment not in dict(index.extent):
+            index.extent.append((entry.segment, entry.length))
+        else:
+            # Not loaded yet, or another writer appended since: loading catches
+            # the index up through the line just written.
+            self._load_index()
+            return
+        index.add(entry)
+        with self.index_path.open("a", encoding="utf-8") as fh:
+            fh.write(entry.to_line())
+
+    def _load_index(self) -> "_LedgerIndex":
+        segments = self._segments()
+        extent = [(segment.key, segment.size) for segment in segments]
+        if self._index is not None and self._index.extent == extent:
+            return self._index
+        index, clean = _LedgerIndex.load(self.index_path)
+        by_key = {segment.key: segment for segment in segments}
+        if index.entries and not self._still_matches(index.entries[-1], by_key):
+            logger.warning("Ledger index %s is stale; rebuilding it", self.index_path)
+            index, clean = _LedgerIndex(), False
+
+        # Segments before the last indexed one are fully indexed already.
+        first = 0
+        if index.entries:
+            first = [segment.key for segment in segments].index(index.entries[-1].segment)
+        added = []
+        for segment in segments[first:]:
+            start = index.covered.get(segment.key, 0)
+            if start < segment.size:
+                added.extend(self._scan(segment, start))
+        for entry in added:
+            index.add(entry)
+        if clean:
+            with self.index_path.open("a", encoding="utf-8") as fh:
+                fh.writelines(entry.to_line() for entry in added)
+        else:
+            _write_atomic(
+                self.index_path, "".join(e.to_line() for e in index.entries).encode("utf-8")
+            )
+        index.extent = extent
+        self._index = index
+        return index
+
+    def _still_matches(self, entry: "_IndexEntry", segments: Dict[str, _Segment]) -> bool:
+        segment = segments.get(entry.segment)
+        if segment is None or entry.offset + entry.length > segment.size:
+            return False
+        try:
+            line = self._segment_bytes(segment, entry.offset, entry.length)
+        except (OSError, ValueError):
+            return False
+        return zlib.crc32(line) == entry.crc
+
+    def _scan(self, segment: _Segment, start: int) -> Iterator["_IndexEntry"]:
+        """Index entries for the lines of `segment` from byte `start` on."""
+        if segment.sha256 is None:
+            fh = segment.path.open("rb")
+        else:
+            self._check_frozen(segment)
+            fh = gzip.open(segment.path, "rb")
+        with fh:
+            fh.seek(start)
+            offset = start
+            for line in fh:
+                try:
+                    entry = json.loads(line) if line.strip() else None
+                except json.JSONDecodeError:
+                    logger.error(
+                        "Ledger %s line at byte %d is not valid JSON; not indexed",
+                        segment.key, offset,
+                    )
+                    entry = None
+                if isinstance(entry, dict):
+                    yield self._index_entry(entry, segment.key, offset, line)
+                offset += len(line)
+
+    def _index_entry(
+        self, entry: Dict[str, Any], segment: str, offset: int, line: bytes
+    ) -> "_IndexEntry":
+        tickers: Set[Optional[str]] = set()
+        ncts: Set[Optional[str]] = set()
+        for signal in entry.get("signals") or ():
+            tickers.add(signal.get("ticker"))
+            ncts.add((signal.get("catalyst") or {}).get("external_id"))
+        try:
+            vetoes = list(self.read_vetoes(entry))
+        except (OSError, ValueError) as exc:
+            logger.error("Vetoes of run %s not indexed: %s", entry.get("run_id"), exc)
+            vetoes = []
+        for veto in vetoes:
+            tickers.add(veto.get("ticker"))
+            ncts.add(veto.get("external_id"))
+        return _IndexEntry.of(entry, segment, offset, line, tickers, ncts)
+
+    def read(self, start: int = 0) -> Iterator[dict]:
+        """Every entry, across all segments, in the order appended.
+
+        With `start`, the entries from that position on (counting from 0),
+        reached through the index rather than by parsing the ones before it.
+        Raises ValueError on reaching a frozen segment that does not match its
+        manifest hash.
+        """
+        if start:
+            return self._read_at(self._load_index().entries[start:])
+        segments = self._segments()
 
         def _gen() -> Iterator[dict]:
-            with self.path.open("r", encoding="utf-8") as fh:
-                for num, raw in enumerate(fh, 1):
+            for segment in segments:
+                for num, raw in enumerate(self._lines(segment), 1):
                     raw = raw.strip()
                     if not raw:
                         continue
@@ -50,7 +469,8 @@ class RunLedger:
                         yield json.loads(raw)
                     except json.JSONDecodeError:
                         # Never let one corrupt line hide the rest of the record.
-                        logger.error("Ledger line %d is not valid JSON; skipping", num)
+                        logger.error("Ledger %s line %d is not valid JSON; skipping",
+                                     segment.key, num)
 
         return _gen()
 
@@ -58,7 +478,159 @@ class RunLedger:
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_text(
-            json.dumps(report.to_dict(), indent=2, sort_keys=True, default=str),
+            json.dumps(self._entry(report), indent=2, sort_keys=True, default=str),
             encoding="utf-8",
         )
         return path
+
+
+def _chain(previous: str, segment: str, sha256: str) -> str:
+    """The manifest chain value: each segment's hash bound to all before it."""
+    return hashlib.sha256(f"{previous}\n{segment}\n{sha256}".encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class _IndexEntry:
+    """Where one run sits in the ledger, and the keys it can be found by."""
+
+    __slots__ = (
+        "segment", "offset", "length", "crc", "run_id", "date", "healthy", "tickers", "ncts"
+    )
+
+    def __init__(self, segment, offset, length, crc, run_id, date, healthy, tickers, ncts) -> None:
+        self.segment = segment
+        self.offset = offset
+        self.length = length
+        self.crc = crc
+        self.run_id = run_id
+        self.date = date
+        self.healthy = healthy
+        self.tickers = tickers
+        self.ncts = ncts
+
+    @classmethod
+    def of(
+        cls,
+        entry: Dict[str, Any],
+        segment: str,
+        offset: int,
+        line: bytes,
+        tickers: Iterable[Optional[str]],
+        ncts: Iterable[Optional[str]],
+    ) -> "_IndexEntry":
+        run_id = str(entry.get("run_id") or "")
+        return cls(
+            segment,
+            offset,
+            len(line),
+            zlib.crc32(line),
+            run_id,
+            _run_date(run_id, entry.get("started_at")),
+            bool(entry.get("healthy")),
+            sorted(t for t in set(tickers) if t),
+            sorted(n for n in set(ncts) if n),
+        )
+
+    @classmethod
+    def from_line(cls, line: str) -> "_IndexEntry":
+        d = json.loads(line)
+        return cls(d["s"], d["o"], d["n"], d["c"], d["r"], d["d"], d["h"], d["t"], d["x"])
+
+    def to_line(self) -> str:
+        return json.dumps(
+            {"s": self.segment, "o": self.offset, "n": self.length, "c": self.crc, "r": self.run_id,
+             "d": self.date, "h": self.healthy, "t": self.tickers, "x": self.ncts},
+            separators=(",", ":"),
+        ) + "\n"
+
+
+class _LedgerIndex:
+    """In-memory lookup tables over the entries of a ledger index file."""
+
+    def __init__(self) -> None:
+        self.entries: List[_IndexEntry] = []
+        # Bytes indexed so far per segment, and the (segment, size) list the
+        # index was last brought up to date with.
+        self.covered: Dict[str, int] = {}
+        self.extent: List[Tuple[str, int]] = []
+        self._by_run: Dict[str, List[int]] = {}
+        self._by_ticker: Dict[str, List[int]] = {}
+        self._by_nct: Dict[str, List[int]] = {}
+        self._by_date: List[Tuple[str, int]] = []  # sorted (date, position)
+
+    @classmethod
+    def load(cls, path: Path) -> Tuple["_LedgerIndex", bool]:
+        """The index in `path`, and whether the file was read to its end.
+
+        Reading stops at the first unreadable line -- a torn append, or a file
+        from an older layout -- and the ledger lines after the last good entry
+        are rescanned; the caller then rewrites the file rather than append
+        after the bad line.
+        """
+        index = cls()
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return index, True
+        for num, line in enumerate(lines, 1):
+            try:
+                entry = _IndexEntry.from_line(line)
+            except (ValueError, KeyError, TypeError):
+                logger.warning("Ledger index %s line %d unreadable; ignoring the rest", path, num)
+                return index, False
+            index.add(entry)
+        return index, True
+
+    def add(self, entry: _IndexEntry) -> None:
+        position = len(self.entries)
+        self.entries.append(entry)
+        self.covered[entry.segment] = entry.offset + entry.length
+        self._by_run.setdefault(entry.run_id, []).append(position)
+        for ticker in entry.tickers:
+            self._by_ticker.setdefault(ticker, []).append(position)
+        for nct in entry.ncts:
+            self._by_nct.setdefault(nct, []).append(position)
+        bisect.insort(self._by_date, (entry.date, position))
+
+    def select(
+        self,
+        run_id: Optional[str],
+        ticker: Optional[str],
+        nct_id: Optional[str],
+        healthy: Optional[bool],
+        since: Optional[date],
+        until: Optional[date],
+    ) -> List[int]:
+        candidates: Optional[Set[int]] = None
+        for table, key in ((self._by_run, run_id), (self._by_ticker, ticker),
+                           (self._by_nct, nct_id)):
+            if key is not None:
+                hits = set(table.get(key, ()))
+                candidates = hits if candidates is None else candidates & hits
+        if since is not None or until is not None:
+            low = bisect.bisect_left(self._by_date, (since.isoformat() if since else "",))
+            high = bisect.bisect_right(
+                self._by_date, (until.isoformat() if until else "\uffff", float("inf"))
+            )
+            hits = {position for _, position in self._by_date[low:high]}
+            candidates = hits if candidates is None else candidates & hits
+        if candidates is None:
+            candidates = set(range(len(self.entries)))
+        if healthy is not None:
+            candidates = {p for p in candidates if self.entries[p].healthy is healthy}
+        return sorted(candidates)
+
+
+def _run_date(run_id: str, started_at: Any) -> str:
+    """The run's as-of date: the run ID's prefix, else the start timestamp's."""
+    for candidate in (run_id[:10], str(started_at or "")[:10]):
+        try:
+            return date.fromisoformat(candidate).isoformat()
+        except ValueError:
+            continue
+    return ""
@@ -12,7 +12,7 @@ import math
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 
 def utcnow() -> datetime:
@@ -94,7 +94,7 @@ class InterventionType(str, Enum):
         return {cls.DRUG, cls.BIOLOGICAL, cls.GENETIC, cls.COMBINATION, cls.DEVICE}
 
 
-@dataclass
+@dataclass(slots=True)
 class TrialDesign:
     """Design attributes that separate a real catalyst from a formality.
 
@@ -127,9 +127,14 @@ class Decision(str, Enum):
     NO_ACTION = "no_action"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Provenance:
-    """Where a fact came from."""
+    """Where a fact came from.
+
+    `url` is what an auditor can open to check the fact -- a study's public
+    page, say -- never a paged API request or a path on the machine that ran
+    the screen. Records from one response share its `retrieved_at` string.
+    """
 
     source: str
     url: Optional[str] = None
@@ -139,9 +144,15 @@ class Provenance:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Catalyst:
-    """A dated, forward-looking event for a single sponsor."""
+    """A dated, forward-looking event for a single sponsor.
+
+    Slotted: a full-registry screen holds tens of thousands of these at once,
+    and a per-instance `__dict__` was most of their footprint. Sources intern
+    the strings that repeat across records (sponsors, conditions, intervention
+    names and types) and share one `retrieved_at` string per response.
+    """
 
     event_type: EventType
     event_date: date
@@ -186,6 +197,12 @@ class CashRunway:
     quarterly_burn_usd: Optional[float]
     provenance: Provenance
     note: str = ""
+    # What the figures were read from: the XBRL tag and the period end date of
+    # the balance-sheet instant and of the cash-flow duration, respectively.
+    cash_tag: Optional[str] = None
+    cash_as_of: Optional[date] = None
+    burn_tag: Optional[str] = None
+    burn_period_end: Optional[date] = None
 
     @property
     def is_known(self) -> bool:
@@ -202,6 +219,146 @@ class ScreenResult:
     detail: Dict[str, Any] = field(default_factory=dict)
 
 
+class VetoScreen(str, Enum):
+    """Every screen that can veto a candidate, by the name the ledger records."""
+
+    SPONSOR_CLASS = "sponsor_class"
+    INTERVENTION_TYPE = "intervention_type"
+    TRIAL_QUALITY = "trial_quality"
+    TICKER_RESOLUTION = "ticker_resolution"
+    ONE_POSITION_PER_TICKER = "one_position_per_ticker"
+    DILUTION = "dilution"
+    MATERIALITY = "materiality"
+    PRICE_BAND = "price_band"
+    SIZING = "sizing"
+
+    @classmethod
+    def named(cls, name: str) -> Union["VetoScreen", str]:
+        """The member for `name`; a future sector's own screen stays a str."""
+        try:
+            return cls(name)
+        except ValueError:
+            return name
+
+
+# Reasons for the vetoes the engine decides itself, from VetoRecord.values.
+_ENGINE_REASONS: Dict[str, Callable[["VetoRecord"], str]] = {
+    VetoScreen.TICKER_RESOLUTION: lambda v: (
+        "Sponsor name did not resolve to a listed ticker "
+        "(private, subsidiary, foreign, or renamed)"
+    ),
+    VetoScreen.ONE_POSITION_PER_TICKER: lambda v: (
+        f"A signal for {v.ticker} was already issued this run from an earlier catalyst."
+    ),
+    VetoScreen.PRICE_BAND: lambda v: (
+        f"Price ${v.values[0]:,.2f} outside ${v.values[1]:g}-${v.values[2]:g}"
+    ),
+    VetoScreen.SIZING: lambda v: (
+        f"Risk budget affords {v.values[0]:.2f} shares at ${v.values[1]:,.2f}; "
+        "below one whole share."
+    ),
+}
+
+
+# The ledger fields of each veto, in the order the engine has always written
+# them, so entries from before and after VetoRecord compare like for like.
+# Screens not listed -- the sector screens -- are written as _SCREEN_FIELDS.
+_LEDGER_FIELDS: Dict[str, Tuple[str, ...]] = {
+    VetoScreen.TICKER_RESOLUTION: ("sponsor", "external_id", "screen", "reason"),
+    VetoScreen.ONE_POSITION_PER_TICKER: ("ticker", "external_id", "screen", "reason"),
+    VetoScreen.DILUTION: ("ticker", "sponsor", "external_id", "screen", "reason", "detail"),
+    VetoScreen.MATERIALITY: ("ticker", "external_id", "screen", "reason", "detail"),
+    VetoScreen.PRICE_BAND: ("ticker", "screen", "reason"),
+    VetoScreen.SIZING: ("ticker", "screen", "reason"),
+}
+_SCREEN_FIELDS = ("sponsor", "external_id", "screen", "reason", "detail")
+
+
+@dataclass(slots=True)
+class VetoRecord:
+    """One rejected candidate, held compactly until someone reads it.
+
+    A run vetoes far more candidates than it signals, and almost no veto is
+    ever looked at individually; most are only counted. So a record keeps
+    what identifies the veto -- the screen, a reference to the catalyst,
+    the ticker -- and the figures its reason is made from, and the reason
+    text and detail are produced when read:
+
+    - vetoes the engine decides itself render from `values` (a price and its
+      band, a share count);
+    - screen vetoes hold the `ScreenResult` when deciding needed one anyway,
+      or `resolve`, which runs the screen when the reason is first read.
+
+    Reading a record like the dict it replaces (`veto["screen"]`,
+    `veto["reason"]`) still works, and `to_dict` gives the ledger form, with
+    the same keys per screen as the dicts did.
+    """
+
+    screen: Union[VetoScreen, str]
+    catalyst: Optional[Catalyst] = None
+    ticker: Optional[str] = None
+    values: Tuple[float, ...] = ()
+    result: Optional[ScreenResult] = None
+    resolve: Optional[Callable[[], ScreenResult]] = field(
+        default=None, compare=False, repr=False
+    )
+
+    @property
+    def screen_name(self) -> str:
+        return self.screen.value if isinstance(self.screen, VetoScreen) else self.screen
+
+    def screen_result(self) -> Optional[ScreenResult]:
+        if self.result is None and self.resolve is not None:
+            self.result, self.resolve = self.resolve(), None
+        return self.result
+
+    @property
+    def reason(self) -> str:
+        result = self.screen_result()
+        if result is not None:
+            return result.reason
+        return _ENGINE_REASONS[self.screen](self)
+
+    @property
+    def detail(self) -> Optional[Dict[str, Any]]:
+        result = self.screen_result()
+        return result.detail if result is not None else None
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """The keys of `to_dict`, in order."""
+        return _LEDGER_FIELDS.get(self.screen, _SCREEN_FIELDS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: self._field(key) for key in self.fields}
+
+    def _field(self, key: str) -> Any:
+        if key == "screen":
+            return self.screen_name
+        if key == "ticker":
+            return self.ticker
+        if key == "sponsor":
+            return self.catalyst.sponsor if self.catalyst is not None else None
+        if key == "external_id":
+            return self.catalyst.external_id if self.catalyst is not None else None
+        if key == "reason":
+            return self.reason
+        return self.detail
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "screen":
+            return self.screen
+        if key not in self.fields:
+            raise KeyError(key)
+        return self._field(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 @dataclass
 class Signal:
     """An advisory recommendation. Helios never executes; Andrew does."""
@@ -252,6 +409,15 @@ class SourceReport:
     records: int
     elapsed_ms: int
     error: Optional[str] = None
+    # Conditional-GET outcomes: a hit is a 304 served from disk.
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_bytes_saved: int = 0
+    # Memo outcomes, for sources that keep one (the ticker resolver): a hit is
+    # a lookup answered by an identical one earlier in the run, or in an
+    # earlier run against the same compiled index.
+    memo_hits: int = 0
+    memo_misses: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -269,7 +435,7 @@ class RunReport:
     catalysts_found: int = 0
     catalysts_in_window: int = 0
     signals: List[Signal] = field(default_factory=list)
-    vetoes: List[Dict[str, Any]] = field(default_factory=list)
+    vetoes: List[VetoRecord] = field(default_factory=list)
     fatal_error: Optional[str] = None
 
     @property
@@ -277,7 +443,14 @@ class RunReport:
         """Fail closed: if any source failed, the run is not trustworthy."""
         return self.fatal_error is None and all(s.ok for s in self.sources)
 
-    def to_dict(self) -> Dict[str, Any]:
+    def veto_counts(self) -> Dict[str, int]:
+        counts: Dict[str, int] = {}
+        for veto in self.vetoes:
+            counts[veto.screen_name] = counts.get(veto.screen_name, 0) + 1
+        return dict(sorted(counts.items()))
+
+    def to_dict(self, include_vetoes: bool = True) -> Dict[str, Any]:
+        """The ledger form. Without vetoes, the caller records them elsewhere."""
         return {
             "run_id": self.run_id,
             "started_at": self.started_at,
@@ -288,6 +461,6 @@ class RunReport:
             "catalysts_found": self.catalysts_found,
             "catalysts_in_window": self.catalysts_in_window,
             "signals": [s.to_dict() for s in self.signals],
-            "vetoes": self.vetoes,
+            **({"vetoes": [v.to_dict() for v in self.vetoes]} if include_vetoes else {}),
             "fatal_error": self.fatal_error,
         }
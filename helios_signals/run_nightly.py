@@ -16,38 +16,142 @@ noticing, because the failure path was never exercised.
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import sys
 from datetime import date
 from pathlib import Path
+from typing import Optional
 
 from .config import AccountConfig, SignalConfig
 from .engine import SignalEngine
 from .ledger import RunLedger
 from .notify.telegram import TelegramNotifier
-from .sources.base import HttpJsonClient
-from .sources.clinicaltrials import ClinicalTrialsSource
+from .sources.aio import AsyncConnectionPool, AsyncHttpJsonClient
+from .sources.base import ConnectionPool, HttpJsonClient, SourceError
+from .sources.bulkfacts import FactsIndex
+from .sources.cache import ResponseCache
+from .sources.catalyst_store import CatalystStore
+from .sources.clinicaltrials import CatalystQuery, ClinicalTrialsSource
+from .sources.ratelimit import HostRateLimiter
+from .sources.recording import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    RecordingTransport,
+    ReplayTransport,
+    ResponseRecording,
+)
+from .sources.runway_table import RunwayTable
 from .sources.sec import CompanyFactsSource, TickerResolver
+from .sources.snapshots import record_sources
 
 logger = logging.getLogger("helios_signals")
 
 
-def build_engine(config: SignalConfig, account: AccountConfig) -> SignalEngine:
-    client = HttpJsonClient(
+def build_engine(
+    config: SignalConfig,
+    account: AccountConfig,
+    use_asyncio: bool = False,
+    as_of: Optional[date] = None,
+    record: Optional[ResponseRecording] = None,
+    replay: Optional[ResponseRecording] = None,
+) -> SignalEngine:
+    """The live engine, or one recording or replaying its HTTP traffic.
+
+    Recording and replaying both run without the response cache and the
+    catalyst store, whose state would make the requests differ between the
+    recorded run and its replay (see `sources.recording`).
+    """
+    client_cls = AsyncHttpJsonClient if use_asyncio else HttpJsonClient
+    cache = ResponseCache(Path(config.http_cache_dir)) if config.http_cache_dir else None
+    store = CatalystStore(Path(config.catalyst_store)) if config.catalyst_store else None
+    rate_limiter: Optional[HostRateLimiter] = HostRateLimiter(config.rate_limits_per_s)
+    transport = None
+    if record is not None or replay is not None:
+        cache = store = None
+    if replay is not None:
+        transport = AsyncReplayTransport(replay) if use_asyncio else ReplayTransport(replay)
+        rate_limiter = None  # nothing goes on the wire
+    elif record is not None:
+        transport = (
+            AsyncRecordingTransport(record, AsyncConnectionPool(timeout_s=config.request_timeout_s))
+            if use_asyncio
+            else RecordingTransport(record, ConnectionPool(timeout_s=config.request_timeout_s))
+        )
+    client = client_cls(
         user_agent=config.user_agent,
         timeout_s=config.request_timeout_s,
         max_retries=config.max_retries,
+        transport=transport,
+        cache=cache,
+        rate_limiter=rate_limiter,
     )
     return SignalEngine(
-        catalysts_source=ClinicalTrialsSource(client),
-        resolver=TickerResolver(client),
-        facts=CompanyFactsSource(client),
+        catalysts_source=ClinicalTrialsSource(
+            client,
+            concurrent=True,
+            store=store,
+            full_refresh_days=config.catalyst_full_refresh_days,
+            query=CatalystQuery.for_screens(config, as_of or date.today())
+            if config.catalyst_prefilter
+            else None,
+        ),
+        resolver=TickerResolver(
+            client, index_path=Path(config.ticker_index) if config.ticker_index else None
+        ),
+        facts=CompanyFactsSource(
+            client,
+            bulk_index=FactsIndex(Path(config.companyfacts_index))
+            if config.companyfacts_index
+            else None,
+        ),
         config=config,
         account=account,
         price_lookup=None,  # no free price source wired yet; see design doc
+        runway_table=RunwayTable(
+            Path(config.runway_table), max_age_days=config.runway_table_max_age_days
+        )
+        if config.runway_table
+        else None,
     )
 
 
+async def arun_and_close(engine: SignalEngine, as_of: date, dry_run: bool):
+    """`engine.arun`, then close the async client `build_engine` gave it.
+
+    Pooled TLS streams left open when `asyncio.run` closes the loop surface
+    as ResourceWarnings and "Event loop is closed" noise in the run log.
+    """
+    try:
+        return await engine.arun(as_of=as_of, dry_run=dry_run)
+    finally:
+        # One client is shared by every source build_engine makes.
+        await engine.catalysts_source.client.close()
+
+
+def verify_query(config: SignalConfig, as_of: date) -> int:
+    """Check the server-side catalyst filter against the unfiltered query.
+
+    Exit status 0 when every phase agrees, 1 when the filter would drop a
+    study the local screens might keep (or keeps one it should not).
+    """
+    engine = build_engine(config, AccountConfig(), as_of=as_of)
+    source = engine.catalysts_source
+    checks = source.verify_query(config.tracked_phases)
+    print(f"\nfilter.advanced: {source.query.advanced() or '(none)'}")
+    for check in checks:
+        print(
+            f"  {check.phase}: {'ok' if check.ok else 'MISMATCH'} -- "
+            f"{check.filtered} of {check.unfiltered} studies kept "
+            f"({check.kept_fraction:.0%}), {check.expected} expected"
+            + (" [truncated at max_pages]" if check.truncated else "")
+        )
+        for label, ids in (("missing", check.missing), ("unexpected", check.unexpected)):
+            if ids:
+                print(f"    {label}: {', '.join(ids[:20])}" + (" ..." if len(ids) > 20 else ""))
+    return 0 if all(check.ok for check in checks) else 1
+
+
 def main(argv=None) -> int:
     parser = argparse.ArgumentParser(description="Helios-X nightly signal run")
     parser.add_argument(
@@ -56,40 +160,175 @@ def main(argv=None) -> int:
         help="Render Telegram messages without sending. Implied when no bot token is set.",
     )
     parser.add_argument("--as-of", type=str, default=None, help="Override date (YYYY-MM-DD)")
-    parser.add_argument("--ledger", type=Path, default=Path("ledger/runs.jsonl"))
+    parser.add_argument(
+        "--ledger",
+        type=Path,
+        default=None,
+        help="Run ledger (default ledger/runs.jsonl; not written on --replay unless given)",
+    )
+    parser.add_argument(
+        "--veto-sidecar",
+        action="store_true",
+        help="Write vetoes to a compressed sidecar beside the ledger instead of inline",
+    )
+    parser.add_argument(
+        "--segmented-ledger",
+        action="store_true",
+        help="Append to monthly ledger segments, freezing past months as hash-chained gzip",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="Conditional-GET response cache directory (overrides HELIOS_HTTP_CACHE_DIR)",
+    )
+    parser.add_argument(
+        "--facts-index",
+        type=Path,
+        default=None,
+        help="Compute runway offline from a companyfacts.zip index "
+        "(overrides HELIOS_COMPANYFACTS_INDEX)",
+    )
+    parser.add_argument(
+        "--runway-table",
+        type=Path,
+        default=None,
+        help="Screen runway from a precomputed table first (overrides HELIOS_RUNWAY_TABLE)",
+    )
+    parser.add_argument(
+        "--catalyst-store",
+        type=Path,
+        default=None,
+        help="Delta-sync the catalyst calendar against this study store "
+        "(overrides HELIOS_CATALYST_STORE)",
+    )
+    parser.add_argument(
+        "--ticker-index",
+        type=Path,
+        default=None,
+        help="Reuse a compiled ticker index here while company_tickers.json is unchanged "
+        "(overrides HELIOS_TICKER_INDEX)",
+    )
+    parser.add_argument(
+        "--snapshot-archive",
+        type=Path,
+        default=None,
+        help="After a healthy run, record the catalyst store and ticker index here "
+        "for point-in-time replay (helios_signals.backtest)",
+    )
+    parser.add_argument(
+        "--verify-query",
+        action="store_true",
+        help="Compare the pre-filtered catalyst query with the unfiltered one and exit",
+    )
+    parser.add_argument(
+        "--asyncio",
+        action="store_true",
+        help="Run the sources on the asyncio client (SignalEngine.arun)",
+    )
+    traffic = parser.add_mutually_exclusive_group()
+    traffic.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Record every HTTP response of this run to DIR for --replay",
+    )
+    traffic.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Serve HTTP responses from a --record directory instead of the network. "
+        "Implies --dry-run; --as-of defaults to the recorded date",
+    )
     parser.add_argument("--verbose", action="store_true")
     args = parser.parse_args(argv)
+    if args.replay is not None and args.snapshot_archive is not None:
+        parser.error("--snapshot-archive cannot be combined with --replay: "
+                     "a replayed night is not a new capture")
 
     logging.basicConfig(
         level=logging.DEBUG if args.verbose else logging.INFO,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     )
 
-    as_of = date.fromisoformat(args.as_of) if args.as_of else date.today()
+    replay = record = None
+    if args.replay is not None:
+        try:
+            replay = ResponseRecording.open(args.replay)
+        except SourceError as exc:
+            print(f"\nFATAL: {exc}", file=sys.stderr)
+            return 2
+    # The catalyst query embeds the date, so a replay defaults to the one
+    # the recording was made for.
+    recorded_as_of = replay.meta.get("as_of") if replay is not None else None
+    as_of = date.fromisoformat(args.as_of or recorded_as_of or date.today().isoformat())
 
     config = SignalConfig.from_env()
+    if args.cache_dir is not None:
+        config.http_cache_dir = str(args.cache_dir)
+    if args.facts_index is not None:
+        config.companyfacts_index = str(args.facts_index)
+    if args.runway_table is not None:
+        config.runway_table = str(args.runway_table)
+    if args.catalyst_store is not None:
+        config.catalyst_store = str(args.catalyst_store)
+    if args.ticker_index is not None:
+        config.ticker_index = str(args.ticker_index)
     account = AccountConfig()
     notifier = TelegramNotifier()
 
-    dry_run = args.dry_run or not notifier.configured
+    dry_run = args.dry_run or not notifier.configured or replay is not None
     logger.info(
-        "Helios-X nightly | as_of=%s | telegram=%s | dry_run=%s",
+        "Helios-X nightly | as_of=%s | telegram=%s | dry_run=%s%s",
         as_of, notifier.mode, dry_run,
+        f" | recording to {args.record}" if args.record is not None
+        else f" | replaying {args.replay}" if replay is not None else "",
     )
 
+    if args.verify_query:
+        return verify_query(config, as_of)
+    if args.record is not None:
+        record = ResponseRecording.create(args.record, as_of=as_of.isoformat())
+
     try:
-        engine = build_engine(config, account)
-        report = engine.run(as_of=as_of, dry_run=dry_run)
+        engine = build_engine(
+            config, account, use_asyncio=args.asyncio, as_of=as_of, record=record, replay=replay
+        )
+        if args.asyncio:
+            report = asyncio.run(arun_and_close(engine, as_of, dry_run))
+        else:
+            report = engine.run(as_of=as_of, dry_run=dry_run)
     except Exception as exc:  # noqa: BLE001
         logger.exception("Fatal error during run")
         print(f"\nFATAL: {type(exc).__name__}: {exc}", file=sys.stderr)
         return 2
 
-    ledger = RunLedger(args.ledger)
-    ledger.append(report)
-    ledger.write_latest(report)
+    # A replayed night already has its ledger entry; a second one would
+    # count it twice in every analysis.
+    ledger_path = args.ledger or (None if replay is not None else Path("ledger/runs.jsonl"))
+    if ledger_path is not None:
+        ledger = RunLedger(
+            ledger_path, veto_sidecar=args.veto_sidecar, segmented=args.segmented_ledger
+        )
+        ledger.append(report)
+        ledger.write_latest(report)
+    if config.ticker_index and report.healthy:
+        try:
+            engine.resolver.save_outcomes()
+        except OSError as exc:
+            logger.warning("Resolver outcomes not saved: %s", exc)
+    if args.snapshot_archive is not None and report.healthy:
+        try:
+            record_sources(args.snapshot_archive, as_of, engine.catalysts_source, engine.resolver)
+        except (OSError, ValueError, SourceError) as exc:
+            # The run itself is sound; a missed capture is a gap in the
+            # replay record, which the replay reports as staleness.
+            logger.error("Snapshot not recorded: %s", exc)
 
-    deliveries = notifier.dispatch_run(report)
+    # A replay re-screens a past night; its messages were sent back then.
+    deliveries = notifier.dispatch_run(report) if replay is None else []
     failed = [d for d in deliveries if not d.ok]
 
     print("\n" + "=" * 68)
@@ -105,7 +344,17 @@ def main(argv=None) -> int:
     for s in report.sources:
         print(
             f"    - {s.name}: {'ok' if s.ok else 'FAIL'} "
-            f"({s.records} records, {s.elapsed_ms}ms)"
+            f"({s.records} records, {s.elapsed_ms}ms"
+            + (
+                f"; cache {s.cache_hits} hit / {s.cache_misses} miss, "
+                f"{s.cache_bytes_saved / 1e6:.1f}MB saved"
+                if s.cache_hits or s.cache_misses else ""
+            )
+            + (
+                f"; memo {s.memo_hits} hit / {s.memo_misses} miss"
+                if s.memo_hits or s.memo_misses else ""
+            )
+            + ")"
             + (f"\n        {s.error}" if s.error else "")
         )
     if failed:
@@ -9,6 +9,7 @@ Generic screens (timing, dilution) apply to any sector. The biotech module
 holds the sector-specific ones.
 """
 
+from .batch import CatalystBatch
 from .biotech import (
     screen_intervention_type,
     screen_materiality,
@@ -19,6 +20,7 @@ from .catalyst_window import screen_catalyst_window
 from .dilution import screen_dilution
 
 __all__ = [
+    "CatalystBatch",
     "screen_catalyst_window",
     "screen_dilution",
     "screen_sponsor_class",
@@ -0,0 +1,193 @@
+"""Columnar screening for large catalyst sets.
+
+The per-catalyst screens build a `ScreenResult`, reason string and detail dict
+for every catalyst they see, including the overwhelming majority they reject.
+At the size of the nightly calendar that is noise; across the full registry --
+hundreds of thousands of studies -- it is most of the run.
+
+`CatalystBatch` holds the fields the network-free gates read as columns and
+evaluates each gate over the whole batch at once. A gate's result is a *mask*:
+an int with one byte per row, 1 where the row passes and 0 where it fails.
+Masks combine with `&` and count with `int.bit_count`, both single C calls
+over the whole batch, and nothing is allocated per rejected row. Reasons are
+left to the ordinary screens, which the engine runs only for the rows that
+survive, or that reach the veto log.
+
+This is NumPy's boolean-mask idea on the standard library: columns are
+`array`s and byte strings, and each column-wide test is a `bytes.translate`,
+a `map` over a builtin comparison, or -- for the timing window, since rows
+are kept in event-date order -- a pair of binary searches.
+
+Every gate must agree exactly with the screen it stands in for. The tests
+check each against its screen row by row, and a screen without a gate here
+simply makes `sector_mask` return None, which sends the engine back to the
+per-catalyst path.
+"""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from datetime import date
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..config import SignalConfig
+from ..models import Catalyst, InterventionType, SponsorClass
+from .biotech import screen_intervention_type, screen_sponsor_class, screen_trial_quality
+
+_SPONSOR_CODES = {cls: code for code, cls in enumerate(SponsorClass)}
+# Intervention types as bit positions, split into two byte-wide lanes so that
+# each lane can be tested with a 256-entry translate table.
+_INTERVENTION_BITS = {t.value: 1 << bit for bit, t in enumerate(InterventionType)}
+assert len(_INTERVENTION_BITS) <= 16
+
+
+def _lane_table(predicate: Callable[[int], bool]) -> bytes:
+    return bytes(1 if predicate(value) else 0 for value in range(256))
+
+
+_INDUSTRY = _lane_table(lambda code: code == _SPONSOR_CODES[SponsorClass.INDUSTRY])
+_TRADEABLE = sum(_INTERVENTION_BITS[t.value] for t in InterventionType.tradeable())
+_TRADEABLE_LO = _lane_table(lambda bits: bool(bits & _TRADEABLE & 0xFF))
+_TRADEABLE_HI = _lane_table(lambda bits: bool(bits & (_TRADEABLE >> 8)))
+
+
+class CatalystBatch:
+    """A list of catalysts plus column views of the fields the gates read.
+
+    Rows are in event-date order, ties in input order -- the order the engine
+    screens in -- so a row index means the same thing in every mask.
+    """
+
+    def __init__(self, catalysts: Iterable[Catalyst]) -> None:
+        self.catalysts: List[Catalyst] = sorted(catalysts, key=lambda c: c.event_date)
+        n = len(self.catalysts)
+        self.event_day = array("l", [c.event_date.toordinal() for c in self.catalysts])
+        self.sponsor_class = bytes(_SPONSOR_CODES[c.sponsor_class] for c in self.catalysts)
+
+        lo, hi = bytearray(n), bytearray(n)
+        for row, catalyst in enumerate(self.catalysts):
+            bits = 0
+            for raw in catalyst.intervention_types:
+                bits |= _INTERVENTION_BITS.get(raw.upper(), 0)
+            lo[row], hi[row] = bits & 0xFF, bits >> 8
+        self.interventions_lo, self.interventions_hi = bytes(lo), bytes(hi)
+
+        enrollments = [c.design.enrollment for c in self.catalysts]
+        self.enrollment_known = bytes(e is not None for e in enrollments)
+        self.enrollment = array("q", [e if e is not None else 0 for e in enrollments])
+
+    def __len__(self) -> int:
+        return len(self.catalysts)
+
+    # ------------------------------------------------------------------ masks
+
+    def everything(self) -> int:
+        return self._mask(b"\x01" * len(self))
+
+    def timing_mask(self, as_of: date, config: SignalConfig) -> int:
+        """`screen_catalyst_window`: in the entry window, not past, not in the exit window.
+
+        With a validated config the last two are implied by the first, since
+        `entry_window_min_days` must exceed `hard_exit_days_before`; the bound
+        is clamped anyway so the gate matches the screen for any config.
+        """
+        nearest = max(config.entry_window_min_days, config.hard_exit_days_before + 1, 0)
+        first = as_of.toordinal() + nearest
+        last = as_of.toordinal() + config.entry_window_max_days
+        start = bisect.bisect_left(self.event_day, first)
+        stop = bisect.bisect_right(self.event_day, last)
+        if start >= stop:
+            return 0
+        return self._mask(b"\x01" * (stop - start)) << (8 * (len(self) - stop))
+
+    def sponsor_mask(self, config: SignalConfig) -> int:
+        """`screen_sponsor_class`: INDUSTRY only."""
+        return self._mask(self.sponsor_class.translate(_INDUSTRY))
+
+    def intervention_mask(self, config: SignalConfig) -> int:
+        """`screen_intervention_type`: at least one tradeable type recorded."""
+        return self._mask(self.interventions_lo.translate(_TRADEABLE_LO)) | self._mask(
+            self.interventions_hi.translate(_TRADEABLE_HI)
+        )
+
+    def quality_mask(self, config: SignalConfig) -> int:
+        """`screen_trial_quality`: enrollment at or above the floor.
+
+        Unknown enrollment passes only when the config disables its veto.
+        """
+        known = self._mask(self.enrollment_known)
+        enough = self._mask(bytes(map(config.min_enrollment.__le__, self.enrollment))) & known
+        if config.veto_on_unknown_enrollment:
+            return enough
+        return enough | (self.everything() & ~known)
+
+    # ------------------------------------------------------------------- rows
+
+    def indices(self, mask: int) -> Iterator[int]:
+        """Row numbers set in `mask`, in row order."""
+        flags = mask.to_bytes(len(self), "big")
+        row = flags.find(1)
+        while row != -1:
+            yield row
+            row = flags.find(1, row + 1)
+
+    def rows(self, mask: int) -> List[Catalyst]:
+        return [self.catalysts[row] for row in self.indices(mask)]
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return mask.bit_count()
+
+    @staticmethod
+    def _mask(flags: bytes) -> int:
+        # One byte per row, row 0 most significant, so `to_bytes` in `indices`
+        # gives the rows back in order.
+        return int.from_bytes(flags, "big")
+
+
+# The sector screens that have a column-wide equivalent, with the name each
+# screen's results carry.
+Gate = Callable[[CatalystBatch, SignalConfig], int]
+GATES: Dict[Callable, Tuple[str, Gate]] = {
+    screen_sponsor_class: ("sponsor_class", CatalystBatch.sponsor_mask),
+    screen_intervention_type: ("intervention_type", CatalystBatch.intervention_mask),
+    screen_trial_quality: ("trial_quality", CatalystBatch.quality_mask),
+}
+
+
+def sector_masks(
+    batch: CatalystBatch, screens: Sequence[Callable], config: SignalConfig
+) -> Optional[List[int]]:
+    """One mask per screen in `screens`, or None if one has no gate."""
+    if any(screen not in GATES for screen in screens):
+        return None
+    return [GATES[screen][1](batch, config) for screen in screens]
+
+
+def sector_mask(
+    batch: CatalystBatch, screens: Sequence[Callable], config: SignalConfig
+) -> Optional[int]:
+    """Rows passing every screen in `screens`, or None if one has no gate."""
+    masks = sector_masks(batch, screens, config)
+    if masks is None:
+        return None
+    combined = batch.everything()
+    for mask in masks:
+        combined &= mask
+    return combined
+
+
+def first_failures(batch: CatalystBatch, masks: Sequence[int]) -> List[Optional[int]]:
+    """Per row, the index of the first mask it fails, or None if it passes all.
+
+    The same screen `SectorProfile.first_failure` would name, found without
+    building any `ScreenResult`.
+    """
+    out: List[Optional[int]] = [None] * len(batch)
+    undecided = batch.everything()
+    for position, mask in enumerate(masks):
+        for row in batch.indices(undecided & ~mask):
+            out[row] = position
+        undecided &= mask
+    return out
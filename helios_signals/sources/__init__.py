@@ -1,13 +1,39 @@
 """Free, public data sources. No paid providers, no API keys."""
 
-from .base import HttpJsonClient, SourceError
-from .clinicaltrials import ClinicalTrialsSource
+from .aio import AsyncConnectionPool, AsyncHttpJsonClient
+from .base import ConnectionPool, HttpJsonClient, SourceError
+from .bulkfacts import FactsIndex, build_facts_index
+from .cache import CacheStats, ResponseCache
+from .catalyst_store import CatalystStore
+from .clinicaltrials import CatalystQuery, ClinicalTrialsSource
+from .ratelimit import HostRateLimiter, TokenBucket
+from .recording import RecordingTransport, ReplayTransport, ResponseRecording
+from .runway_table import RunwayTable, build_runway_table
 from .sec import CompanyFactsSource, TickerResolver
+from .ticker_index import TickerIndex, write_ticker_index
 
 __all__ = [
+    "AsyncConnectionPool",
+    "AsyncHttpJsonClient",
+    "CacheStats",
+    "CatalystQuery",
+    "CatalystStore",
+    "ConnectionPool",
+    "FactsIndex",
+    "HostRateLimiter",
     "HttpJsonClient",
+    "RecordingTransport",
+    "ReplayTransport",
+    "ResponseCache",
+    "ResponseRecording",
+    "RunwayTable",
     "SourceError",
     "ClinicalTrialsSource",
     "CompanyFactsSource",
+    "TickerIndex",
     "TickerResolver",
+    "TokenBucket",
+    "build_facts_index",
+    "build_runway_table",
+    "write_ticker_index",
 ]
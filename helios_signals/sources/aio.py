@@ -0,0 +1,299 @@
+"""asyncio variant of the HTTP client.
+
+The blocking client spends most of a nightly run waiting on sockets. This one
+lets the engine overlap the catalyst download, the ticker index and the runway
+fetches on a single event loop, still with the standard library only: HTTP/1.1
+is spoken directly over `asyncio.open_connection`, with TLS from `ssl`.
+
+Deliberately minimal. It speaks exactly the subset of HTTP/1.1 the two public
+APIs use -- GET, Content-Length or chunked bodies, keep-alive -- and relies on
+the shared client core for everything that decides what a response *means*:
+403/404/5xx handling, gzip/deflate decoding, conditional-GET caching and the
+per-host rate limit. A source gets identical answers from either client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import logging
+import random
+import ssl
+import urllib.parse
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .base import (
+    _MAX_REDIRECTS,
+    _TRANSIENT_ERRORS,
+    HttpResponse,
+    SourceError,
+    _ClientCore,
+    _decode_body,
+    _Decoder,
+    _members_decoder,
+    _parse_json,
+)
+from .cache import ResponseCache
+from .ratelimit import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+_PoolKey = Tuple[str, str, int]
+_Stream = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+# A reused connection the server has already closed fails on first use in one
+# of these ways. None of them mean the request was processed.
+# (asyncio.IncompleteReadError is an EOFError.)
+_STALE_STREAM_ERRORS = (ConnectionError, EOFError)
+
+_MAX_HEADER_LINES = 200
+
+
+class AsyncConnectionPool:
+    """Keep-alive HTTP(S) streams, pooled per (scheme, host, port).
+
+    The asyncio counterpart of `ConnectionPool`, with the same contract: a
+    stream is checked out for one request and returned only once its response
+    has been read in full, and a stale stream is replaced transparently, once.
+    """
+
+    def __init__(
+        self,
+        timeout_s: float = 30,
+        max_idle_per_host: int = 4,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        opener: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        self.timeout_s = timeout_s
+        self.max_idle_per_host = max_idle_per_host
+        self._ssl = ssl_context or ssl.create_default_context()
+        self._open = opener or asyncio.open_connection
+        self._idle: Dict[_PoolKey, List[_Stream]] = {}
+
+    async def request(self, method: str, url: str, headers: Dict[str, str]) -> HttpResponse:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL {url!r}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        raw = _encode_request(method, target, key, headers)
+
+        stream, reused = await self._acquire(key)
+        try:
+            resp, reusable = await self._exchange(stream, raw, method)
+        except _STALE_STREAM_ERRORS as exc:
+            _close(stream)
+            if not reused:
+                raise
+            logger.debug(
+                "Stale keep-alive stream to %s (%s); reconnecting", key[1], type(exc).__name__
+            )
+            stream = await self._connect(key)
+            try:
+                resp, reusable = await self._exchange(stream, raw, method)
+            except BaseException:
+                _close(stream)
+                raise
+        except BaseException:
+            _close(stream)
+            raise
+
+        self._release(key, stream, reusable)
+        return resp
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, {}
+        for streams in idle.values():
+            for stream in streams:
+                _close(stream)
+
+    async def _exchange(self, stream: _Stream, raw: bytes, method: str):
+        reader, writer = stream
+        writer.write(raw)
+        await writer.drain()
+        return await asyncio.wait_for(read_response(reader, method), self.timeout_s)
+
+    async def _acquire(self, key: _PoolKey) -> Tuple[_Stream, bool]:
+        idle = self._idle.get(key)
+        while idle:
+            stream = idle.pop()
+            if not stream[0].at_eof():
+                return stream, True
+            _close(stream)
+        return await self._connect(key), False
+
+    async def _connect(self, key: _PoolKey) -> _Stream:
+        scheme, host, port = key
+        tls = {"ssl": self._ssl, "server_hostname": host} if scheme == "https" else {}
+        return await asyncio.wait_for(self._open(host, port, **tls), self.timeout_s)
+
+    def _release(self, key: _PoolKey, stream: _Stream, reusable: bool) -> None:
+        idle = self._idle.setdefault(key, [])
+        if reusable and len(idle) < self.max_idle_per_host:
+            idle.append(stream)
+        else:
+            _close(stream)
+
+
+def _encode_request(method: str, target: str, key: _PoolKey, headers: Dict[str, str]) -> bytes:
+    scheme, host, port = key
+    default_port = 443 if scheme == "https" else 80
+    lines = [
+        f"{method} {target} HTTP/1.1",
+        f"Host: {host}" if port == default_port else f"Host: {host}:{port}",
+        "Connection: keep-alive",
+    ]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def read_response(reader: asyncio.StreamReader, method: str = "GET"):
+    """Read one HTTP/1.1 response. Returns (response, connection_reusable)."""
+    while True:
+        status_line = await reader.readline()
+        if not status_line:
+            raise EOFError("connection closed before a status line was received")
+        version, _, rest = status_line.decode("latin-1").strip().partition(" ")
+        try:
+            status = int(rest.split(" ", 1)[0])
+        except ValueError:
+            raise http.client.BadStatusLine(status_line[:80].decode("latin-1")) from None
+
+        headers: Dict[str, str] = {}
+        for _ in range(_MAX_HEADER_LINES):
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            name, value = name.strip().lower(), value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+        else:
+            raise http.client.HTTPException("Too many HTTP header lines")
+
+        if 100 <= status < 200:
+            continue  # interim response; the real one follows
+        break
+
+    keep_alive = version.upper() == "HTTP/1.1" and "close" not in headers.get(
+        "connection", ""
+    ).lower()
+
+    if method == "HEAD" or status in (204, 304):
+        body = b""
+    elif "chunked" in headers.get("transfer-encoding", "").lower():
+        body = await _read_chunked(reader)
+    elif "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        # No framing: the body runs to the end of the connection.
+        body = await reader.read()
+        keep_alive = False
+
+    return HttpResponse(status=status, headers=headers, body=body), keep_alive
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b"".join(chunks), None)
+        size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+        if size == 0:
+            # Trailers, if any, end with a blank line.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)  # CRLF after each chunk
+
+
+def _close(stream: _Stream) -> None:
+    stream[1].close()
+
+
+class AsyncHttpJsonClient(_ClientCore):
+    """asyncio JSON-over-HTTP client with the same semantics as HttpJsonClient.
+
+    Retries, backoff, caching and rate limiting are shared with the blocking
+    client; only the socket handling differs. `sleep` must be a coroutine
+    function.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout_s: int = 30,
+        max_retries: int = 4,
+        base_delay_s: float = 1.5,
+        sleep=asyncio.sleep,
+        rng: Optional[random.Random] = None,
+        transport: Optional[AsyncConnectionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+    ) -> None:
+        super().__init__(
+            user_agent, timeout_s, max_retries, base_delay_s, sleep, rng, cache, rate_limiter
+        )
+        self._transport = transport or AsyncConnectionPool(timeout_s=timeout_s)
+
+    async def close(self) -> None:
+        await self._transport.close()
+
+    async def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+        return await self._fetch(url, headers, _parse_json)
+
+    async def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """As `HttpJsonClient.get_text`."""
+        return await self._fetch(url, headers, _decode_body)
+
+    async def get_json_members(
+        self,
+        url: str,
+        section: str,
+        keys: Sequence[str],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """As `HttpJsonClient.get_json_members`."""
+        return await self._fetch(url, headers, _members_decoder(section, keys))
+
+    async def _fetch(self, url: str, headers: Optional[Dict[str, str]], decode: _Decoder) -> Any:
+        hdrs = self._headers(headers)
+        last_error: Optional[Exception] = None
+
+        for attempt in range(1, self.max_retries + 1):
+            cached, request_headers = await self._off_loop(self._lookup, url, hdrs)
+            try:
+                resp = await self._get(url, request_headers)
+                return await self._off_loop(self._accept, url, resp, cached, decode)
+            except (*_TRANSIENT_ERRORS, EOFError) as exc:
+                last_error = exc
+                await self._off_loop(self._failed_attempt, url, exc, cached, attempt)
+
+            if attempt < self.max_retries:
+                await self._sleep(self._backoff(url, attempt))
+
+        raise self._exhausted(url, last_error) from last_error
+
+    async def _off_loop(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """`fn(*args)`, in a worker thread when it may touch the disk cache.
+
+        Cache reads and atomic writes of a large companyfacts body would
+        otherwise stall every other request in flight on the loop. Without a
+        cache there is no disk I/O and a thread hop would only add latency.
+        """
+        if self.cache is None:
+            return fn(*args)
+        return await asyncio.to_thread(fn, *args)
+
+    async def _get(self, url: str, headers: Dict[str, str]) -> HttpResponse:
+        for _ in range(_MAX_REDIRECTS + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(url)
+            resp = await self._transport.request("GET", url, headers)
+            location = self._redirect(url, resp)
+            if location is None:
+                return resp
+            url = location
+        raise SourceError(f"Too many redirects for {url}")
@@ -0,0 +1,56 @@
+"""Curated sponsor aliases: registry sponsor name -> EDGAR CIK.
+
+Exact matching on normalised names (`sec.normalise_company_name`) is right for
+most sponsors and wrong for a known few. Large sponsors register trials under
+subsidiaries ("Janssen Research & Development", "Genzyme, a Sanofi Company")
+or under a name EDGAR spells differently ("Eli Lilly and Company" against
+"LILLY ELI & CO"). Fuzzy matching would paper over that and mis-resolve
+smaller names; a short list of reviewed aliases fixes exactly these cases.
+
+A CIK of None records a sponsor known to have no SEC-registered parent --
+Roche and Boehringer Ingelheim, for instance -- so that no EDGAR registrant
+that happens to normalise to the same name can claim its trials.
+
+An alias resolves to whichever ticker the ticker file lists first for that
+CIK, its primary listing. An alias whose CIK the ticker file does not list is
+a miss, never a fall-through to exact matching: the table says whose trial it
+is, and that company has no ticker tonight.
+
+Entries are matched after normalisation, so suffix and punctuation variants of
+a listed name need no entry of their own. The table is compiled into the
+persisted ticker index (`ticker_index`); `aliases_version` keys the index, so
+editing the table recompiles it on the next run.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Dict, Mapping, Optional
+
+SPONSOR_ALIASES: Dict[str, Optional[int]] = {
+    # Spelled differently in EDGAR.
+    "Eli Lilly and Company": 59478,
+    "GlaxoSmithKline": 1131399,
+    "Novo Nordisk A/S": 353278,
+    # Subsidiaries that sponsor under their own name.
+    "Janssen Research & Development, LLC": 200406,
+    "Janssen Biotech, Inc.": 200406,
+    "Merck Sharp & Dohme LLC": 310158,
+    "Genzyme, a Sanofi Company": 1121404,
+    "Sanofi Pasteur, a Sanofi Company": 1121404,
+    "ViiV Healthcare": 1131399,
+    "MedImmune LLC": 901832,
+    "Takeda Development Center Americas, Inc.": 1395064,
+    # No SEC-registered parent.
+    "Hoffmann-La Roche": None,
+    "Genentech, Inc.": None,
+    "Boehringer Ingelheim": None,
+    "Bayer": None,
+}
+
+
+def aliases_version(aliases: Mapping[str, Optional[int]]) -> str:
+    """A digest of the table's content, for keying compiled indexes."""
+    canonical = json.dumps(sorted(aliases.items()), separators=(",", ":"))
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
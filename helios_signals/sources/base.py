@@ -4,43 +4,191 @@ Standard-library only. The SEC mandates a descriptive User-Agent and returns
 403 without one; both SEC and clinicaltrials.gov rate-limit, so retries use
 exponential backoff with jitter to avoid a thundering herd against public
 infrastructure.
+
+Connections are kept alive and pooled per host. A nightly run makes dozens of
+small SEC requests and up to forty clinicaltrials.gov pages; paying a fresh
+TCP and TLS handshake for each one made the handshakes, not the payloads, the
+dominant cost of the run.
 """
 
 from __future__ import annotations
 
 import gzip
+import http.client
 import json
 import logging
 import random
+import threading
 import time
-import urllib.error
-import urllib.request
+import urllib.parse
 import zlib
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .cache import CacheStats, ResponseCache
+from .ratelimit import HostRateLimiter
+from .selective import extract_members
 
 logger = logging.getLogger(__name__)
 
+# (body, content_encoding) -> payload
+_Decoder = Callable[[bytes, str], Any]
+
 
 class SourceError(RuntimeError):
     """A data source could not be read. Callers must fail closed on this."""
 
 
-class HttpJsonClient:
-    """Minimal JSON-over-HTTP client with backoff.
+@dataclass
+class HttpResponse:
+    """A fully read HTTP response. Header names are lower-cased."""
 
-    Deliberately not the requests library: every dependency added to a job that
-    produces trade recommendations is a dependency that can break the job or be
-    compromised. The standard library covers this need.
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+# A keep-alive socket the server has already closed only reveals itself when
+# it is next used. These are the ways that shows up; none of them mean the
+# request reached the server, so a GET can be resent on a fresh connection.
+_STALE_SOCKET_ERRORS = (ConnectionError, http.client.BadStatusLine)
+
+_REDIRECTS = (301, 302, 303, 307, 308)
+_MAX_REDIRECTS = 5
+
+_PoolKey = Tuple[str, str, int]
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, pooled per (scheme, host, port).
+
+    Thread-safe: a connection is checked out for exactly one request and only
+    returned to the pool once its response has been read in full. A socket
+    that turns out to be stale on reuse is replaced transparently, once; a
+    failure on a fresh connection is a real failure and propagates to the
+    client's retry loop.
+    """
+
+    def __init__(
+        self,
+        timeout_s: float = 30,
+        max_idle_per_host: int = 4,
+        connection_factory: Optional[Callable[[str, str, int, float], Any]] = None,
+    ) -> None:
+        self.timeout_s = timeout_s
+        self.max_idle_per_host = max_idle_per_host
+        self._factory = connection_factory or _default_connection
+        self._idle: Dict[_PoolKey, List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def request(self, method: str, url: str, headers: Dict[str, str]) -> HttpResponse:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL {url!r}")
+        key = (scheme, parts.hostname, parts.port or (443 if scheme == "https" else 80))
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+        conn, reused = self._acquire(key)
+        try:
+            resp, body = self._send(conn, method, target, headers)
+        except _STALE_SOCKET_ERRORS as exc:
+            conn.close()
+            if not reused:
+                raise
+            logger.debug(
+                "Stale keep-alive connection to %s (%s); reconnecting", key[1], type(exc).__name__
+            )
+            conn = self._factory(*key, self.timeout_s)
+            try:
+                resp, body = self._send(conn, method, target, headers)
+            except BaseException:
+                conn.close()
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+        self._release(key, conn, reusable=not resp.will_close)
+        return HttpResponse(
+            status=resp.status,
+            headers={k.lower(): v for k, v in resp.getheaders()},
+            body=body,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    @staticmethod
+    def _send(conn: Any, method: str, target: str, headers: Dict[str, str]):
+        conn.request(method, target, headers=headers)
+        resp = conn.getresponse()
+        # Read to the end before anything else: a keep-alive connection can
+        # only carry the next request once this response is fully consumed.
+        return resp, resp.read()
+
+    def _acquire(self, key: _PoolKey) -> Tuple[Any, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._factory(*key, self.timeout_s), False
+
+    def _release(self, key: _PoolKey, conn: Any, reusable: bool) -> None:
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self.max_idle_per_host:
+                    idle.append(conn)
+                    return
+        conn.close()
+
+
+def _default_connection(scheme: str, host: str, port: int, timeout_s: float):
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, port, timeout=timeout_s)
+    return http.client.HTTPConnection(host, port, timeout=timeout_s)
+
+
+class _TransientStatusError(SourceError):
+    """A retryable HTTP status. Never escapes the client's retry loop."""
+
+
+# Failures that say nothing permanent about the URL. Anything else -- above
+# all a SourceError for 403/404 -- propagates on the first attempt.
+_TRANSIENT_ERRORS = (
+    _TransientStatusError,
+    http.client.HTTPException,
+    TimeoutError,
+    json.JSONDecodeError,
+    UnicodeDecodeError,
+    zlib.error,
+    OSError,
+)
+
+
+class _ClientCore:
+    """Everything the blocking and asyncio clients share except the I/O.
+
+    Identity, status handling, conditional-GET caching, throttling and backoff
+    must behave identically whichever client a source is handed, so they live
+    here once rather than drifting apart in two copies.
     """
 
     def __init__(
         self,
         user_agent: str,
-        timeout_s: int = 30,
-        max_retries: int = 4,
-        base_delay_s: float = 1.5,
-        sleep=time.sleep,
-        rng: Optional[random.Random] = None,
+        timeout_s: int,
+        max_retries: int,
+        base_delay_s: float,
+        sleep,
+        rng: Optional[random.Random],
+        cache: Optional[ResponseCache],
+        rate_limiter: Optional[HostRateLimiter],
     ) -> None:
         if not user_agent or "@" not in user_agent:
             # SEC's fair-access policy requires a contactable identity.
@@ -51,82 +199,191 @@ class HttpJsonClient:
         self.base_delay_s = base_delay_s
         self._sleep = sleep
         self._rng = rng or random.Random()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
 
-    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+    def cache_stats(self, url: str) -> CacheStats:
+        """Cache counters for the host serving `url`; zeros when uncached."""
+        return self.cache.stats_for(url) if self.cache is not None else CacheStats()
+
+    def _headers(self, extra: Optional[Dict[str, str]]) -> Dict[str, str]:
         hdrs = {
             "User-Agent": self.user_agent,
             "Accept": "application/json",
             "Accept-Encoding": "gzip, deflate",
         }
-        if headers:
-            hdrs.update(headers)
+        if extra:
+            hdrs.update(extra)
+        return hdrs
 
+    def _lookup(self, url: str, hdrs: Dict[str, str]):
+        """The cached copy of `url`, if any, and the headers to revalidate it."""
+        cached = self.cache.lookup(url) if self.cache is not None else None
+        return cached, ({**hdrs, **cached.validators()} if cached else hdrs)
+
+    def _accept(
+        self, url: str, resp: HttpResponse, cached, decode: Optional[_Decoder] = None
+    ) -> Any:
+        """Turn one response into a payload, or raise.
+
+        `decode(body, content_encoding)` builds the payload; by default the
+        whole body is parsed as JSON.
+        """
+        decode = decode or _parse_json
+        if resp.status == 304 and cached is not None:
+            self.cache.record_hit(url, len(cached.body))
+            return decode(cached.body, cached.content_encoding)
+        if 200 <= resp.status < 300:
+            encoding = resp.headers.get("content-encoding", "")
+            payload = decode(resp.body, encoding)
+            if self.cache is not None:
+                # Only a body that decoded is worth revalidating later.
+                self.cache.record_miss(url)
+                self.cache.store(url, resp.body, resp.headers)
+            return payload
+        if resp.status == 403:
+            # Not transient. Retrying a 403 just burns the rate limit
+            # and risks an IP block.
+            raise SourceError(
+                f"403 Forbidden for {url}. The SEC requires a descriptive "
+                f"User-Agent with contact details; current value is "
+                f"{self.user_agent!r}."
+            )
+        if resp.status == 404:
+            raise SourceError(f"404 Not Found for {url}")
+        if resp.status not in (429, 500, 502, 503, 504):
+            raise SourceError(f"HTTP {resp.status} for {url}")
+        raise _TransientStatusError(f"HTTP {resp.status} for {url}")
+
+    def _failed_attempt(self, url: str, exc: Exception, cached, attempt: int) -> None:
+        if isinstance(exc, _TransientStatusError):
+            logger.warning("%s (attempt %d/%d)", exc, attempt, self.max_retries)
+            return
+        if cached is not None and self.cache is not None:
+            # Whatever went wrong, the next attempt should not lean
+            # on a copy that may be the cause of it.
+            self.cache.invalidate(url)
+        logger.warning(
+            "%s reading %s (attempt %d/%d)",
+            type(exc).__name__,
+            url,
+            attempt,
+            self.max_retries,
+        )
+
+    def _backoff(self, url: str, attempt: int) -> float:
+        delay = min(self.base_delay_s * (2 ** (attempt - 1)), 60.0)
+        delay *= self._rng.uniform(0.5, 1.5)  # jitter
+        logger.info("Retrying %s in %.1fs", url, delay)
+        return delay
+
+    def _exhausted(self, url: str, last_error: Optional[Exception]) -> SourceError:
+        return SourceError(
+            f"Failed to read {url} after {self.max_retries} attempts: {last_error}"
+        )
+
+    @staticmethod
+    def _redirect(url: str, resp: HttpResponse) -> Optional[str]:
+        location = resp.headers.get("location")
+        if resp.status not in _REDIRECTS or not location:
+            return None
+        return urllib.parse.urljoin(url, location)
+
+
+class HttpJsonClient(_ClientCore):
+    """Minimal JSON-over-HTTP client with backoff.
+
+    Deliberately not the requests library: every dependency added to a job that
+    produces trade recommendations is a dependency that can break the job or be
+    compromised. The standard library covers this need.
+    """
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout_s: int = 30,
+        max_retries: int = 4,
+        base_delay_s: float = 1.5,
+        sleep=time.sleep,
+        rng: Optional[random.Random] = None,
+        transport: Optional[ConnectionPool] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[HostRateLimiter] = None,
+    ) -> None:
+        super().__init__(
+            user_agent, timeout_s, max_retries, base_delay_s, sleep, rng, cache, rate_limiter
+        )
+        # Anything with ConnectionPool's request() signature will do; tests
+        # substitute one that never opens a socket.
+        self._transport = transport or ConnectionPool(timeout_s=timeout_s)
+
+    def close(self) -> None:
+        """Close pooled connections. Safe to call more than once."""
+        self._transport.close()
+
+    def get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Any:
+        return self._fetch(url, headers, _parse_json)
+
+    def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """The decoded body of `url`, for a caller that parses it only if needed."""
+        return self._fetch(url, headers, _decode_body)
+
+    def get_json_members(
+        self,
+        url: str,
+        section: str,
+        keys: Sequence[str],
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """`get_json` for an XBRL companyfacts document, decoding only `keys`.
+
+        Returns `{"facts": {section: {key: ...}}}` with just the keys present,
+        or the full document if its layout is not recognised. See `selective`.
+        """
+        return self._fetch(url, headers, _members_decoder(section, keys))
+
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]], decode: _Decoder) -> Any:
+        hdrs = self._headers(headers)
         last_error: Optional[Exception] = None
 
         for attempt in range(1, self.max_retries + 1):
+            cached, request_headers = self._lookup(url, hdrs)
             try:
-                req = urllib.request.Request(url, headers=hdrs)
-                with urllib.request.urlopen(req, timeout=self.timeout_s) as resp:
-                    raw = resp.read()
-                    encoding = resp.headers.get("Content-Encoding", "")
-                return json.loads(_decode_body(raw, encoding))
-
-            except urllib.error.HTTPError as exc:
+                return self._accept(url, self._get(url, request_headers), cached, decode)
+            except _TRANSIENT_ERRORS as exc:
                 last_error = exc
-                if exc.code == 403:
-                    # Not transient. Retrying a 403 just burns the rate limit
-                    # and risks an IP block.
-                    raise SourceError(
-                        f"403 Forbidden for {url}. The SEC requires a descriptive "
-                        f"User-Agent with contact details; current value is "
-                        f"{self.user_agent!r}."
-                    ) from exc
-                if exc.code == 404:
-                    raise SourceError(f"404 Not Found for {url}") from exc
-                if exc.code not in (429, 500, 502, 503, 504):
-                    raise SourceError(f"HTTP {exc.code} for {url}") from exc
-                logger.warning(
-                    "HTTP %s from %s (attempt %d/%d)", exc.code, url, attempt, self.max_retries
-                )
-
-            except (
-                urllib.error.URLError,
-                TimeoutError,
-                json.JSONDecodeError,
-                UnicodeDecodeError,
-                zlib.error,
-                OSError,
-            ) as exc:
-                last_error = exc
-                logger.warning(
-                    "%s reading %s (attempt %d/%d)",
-                    type(exc).__name__,
-                    url,
-                    attempt,
-                    self.max_retries,
-                )
+                self._failed_attempt(url, exc, cached, attempt)
 
             if attempt < self.max_retries:
-                delay = min(self.base_delay_s * (2 ** (attempt - 1)), 60.0)
-                delay *= self._rng.uniform(0.5, 1.5)  # jitter
-                logger.info("Retrying %s in %.1fs", url, delay)
-                self._sleep(delay)
+                self._sleep(self._backoff(url, attempt))
 
-        raise SourceError(
-            f"Failed to read {url} after {self.max_retries} attempts: {last_error}"
-        ) from last_error
+        raise self._exhausted(url, last_error) from last_error
+
+    def _get(self, url: str, headers: Dict[str, str]) -> HttpResponse:
+        """One GET, following redirects as urllib used to do for us."""
+        for _ in range(_MAX_REDIRECTS + 1):
+            # Every request on the wire draws a token, retries and redirect
+            # hops included: the server counts them all.
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            resp = self._transport.request("GET", url, headers)
+            location = self._redirect(url, resp)
+            if location is None:
+                return resp
+            url = location
+        raise SourceError(f"Too many redirects for {url}")
 
 
 def _decode_body(raw: bytes, content_encoding: str) -> str:
     """Decode a response body, honouring Content-Encoding.
 
     The client advertises `Accept-Encoding: gzip, deflate` because these are
-    large JSON payloads over public infrastructure and it is rude not to. urllib
-    does not decompress for you, so without this the first byte of a gzip stream
-    (0x1f 0x8b) reaches json.loads and the run dies with a UnicodeDecodeError
-    that names neither gzip nor the URL. That is exactly what happened on the
-    first live run: clinicaltrials.gov honoured the header and the pipeline
-    crashed before it could write a ledger entry.
+    large JSON payloads over public infrastructure and it is rude not to.
+    Neither urllib nor http.client decompresses for you, so without this the
+    first byte of a gzip stream (0x1f 0x8b) reaches json.loads and the run dies
+    with a UnicodeDecodeError that names neither gzip nor the URL. That is
+    exactly what happened on the first live run: clinicaltrials.gov honoured
+    the header and the pipeline crashed before it could write a ledger entry.
 
     Some servers gzip regardless of the header, so the magic-number check runs
     even when Content-Encoding is absent.
@@ -143,6 +400,26 @@ def _decode_body(raw: bytes, content_encoding: str) -> str:
     return raw.decode("utf-8")
 
 
+def _parse_json(raw: bytes, content_encoding: str) -> Any:
+    return json.loads(_decode_body(raw, content_encoding))
+
+
+def _members_decoder(section: str, keys: Sequence[str]) -> _Decoder:
+    keys = tuple(keys)
+
+    def decode(raw: bytes, content_encoding: str) -> Any:
+        doc = extract_members(raw, content_encoding, section, keys)
+        return doc if doc is not None else _parse_json(raw, content_encoding)
+
+    return decode
+
+
+def cache_stats_for(client: Any, url: str) -> CacheStats:
+    """Cache counters for `url` from any client, including test doubles."""
+    stats = getattr(client, "cache_stats", None)
+    return stats(url) if callable(stats) else CacheStats()
+
+
 def dig(obj: Any, *path: str, default: Any = None) -> Any:
     """Walk a nested dict safely.
 
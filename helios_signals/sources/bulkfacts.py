@@ -0,0 +1,216 @@
+"""Offline company facts from SEC's bulk `companyfacts.zip` archive.
+
+SEC republishes every filer's XBRL facts nightly as one archive
+(https://www.sec.gov/Archives/edgar/daily-index/xbrl/companyfacts.zip), a few
+gigabytes of JSON with one member per CIK. Fetching the same data one CIK at a
+time over HTTP caps a screen at the fair-access rate, which is tolerable for a
+nightly handful of sponsors but rules out screening the whole universe or
+replaying history.
+
+`build_facts_index` reads a local copy of the archive once and keeps only what
+the runway calculation reads: the USD series of the cash and operating cash
+flow tags in `sec._CASH_TAGS` / `sec._BURN_TAGS`. Everything else -- thousands
+of tags per filer -- is dropped. The result is a single file that
+`FactsIndex` memory-maps, so a lookup is a binary search over a sorted table
+plus one small JSON decode, with no network I/O and no per-process load time.
+
+File layout, all integers little-endian:
+
+    [blob]*                      reduced companyfacts JSON, one per CIK
+    [cik u32 | offset u64 | length u32]*   sorted by cik
+    trailer: magic "HXFI" | version u16 | pad | count u32 | table offset u64
+
+The trailer sits at the end so the builder can stream blobs to disk without
+knowing in advance how many members will survive.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import mmap
+import os
+import re
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .base import SourceError
+from .sec import _RUNWAY_TAGS
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"HXFI"
+_VERSION = 1
+_TRAILER = struct.Struct("<4sHxxIQ")
+_RECORD = struct.Struct("<IQI")
+
+_MEMBER = re.compile(r"CIK(\d{10})\.json$")
+# The fields runway reads, plus `filed` and `form` so a later point-in-time
+# screen can tell what was public on a given date.
+_FACT_FIELDS = ("start", "end", "val", "filed", "form")
+
+
+def reduce_companyfacts(
+    payload: Any, tags: Sequence[str] = _RUNWAY_TAGS
+) -> Optional[Dict[str, Any]]:
+    """Strip a companyfacts document down to the USD series of `tags`.
+
+    The result has the same shape as the API response, so it parses through
+    the same code. Returns None when none of the tags is present.
+    """
+    if not isinstance(payload, dict):
+        return None
+    gaap = (payload.get("facts") or {}).get("us-gaap") or {}
+    kept: Dict[str, Any] = {}
+    for tag in tags:
+        usd = (((gaap.get(tag) or {}).get("units") or {}).get("USD")) or []
+        facts = [
+            {k: fact[k] for k in _FACT_FIELDS if k in fact}
+            for fact in usd
+            if isinstance(fact, dict)
+        ]
+        if facts:
+            kept[tag] = {"units": {"USD": facts}}
+    if not kept:
+        return None
+    return {
+        "cik": payload.get("cik"),
+        "entityName": payload.get("entityName"),
+        "facts": {"us-gaap": kept},
+    }
+
+
+def build_facts_index(archive: Path, index_path: Path) -> int:
+    """Build a `FactsIndex` file from a local `companyfacts.zip`.
+
+    Returns the number of CIKs indexed. Members that are not per-CIK JSON,
+    fail to parse, or carry none of the runway tags are skipped and counted in
+    the log; a damaged member must not cost every other filer its entry. The
+    index is written to a temporary file and renamed into place, so a reader
+    never sees a half-built one.
+    """
+    index_path = Path(index_path)
+    tmp = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    records: List[Tuple[int, int, int]] = []
+    skipped = unreadable = 0
+
+    with zipfile.ZipFile(archive) as zf, open(tmp, "wb") as out:
+        for info in zf.infolist():
+            match = _MEMBER.search(info.filename)
+            if not match:
+                continue
+            try:
+                with zf.open(info) as member:
+                    payload = json.load(member)
+            except (ValueError, zipfile.BadZipFile, OSError) as exc:
+                unreadable += 1
+                logger.warning("Skipping unreadable member %s: %s", info.filename, exc)
+                continue
+            reduced = reduce_companyfacts(payload)
+            if reduced is None:
+                skipped += 1
+                continue
+            blob = json.dumps(reduced, separators=(",", ":")).encode("utf-8")
+            records.append((int(match.group(1)), out.tell(), len(blob)))
+            out.write(blob)
+
+        records.sort()
+        table_offset = out.tell()
+        for record in records:
+            out.write(_RECORD.pack(*record))
+        out.write(_TRAILER.pack(_MAGIC, _VERSION, len(records), table_offset))
+
+    os.replace(tmp, index_path)
+    logger.info(
+        "Indexed %d CIKs from %s (%d without runway tags, %d unreadable)",
+        len(records), archive, skipped, unreadable,
+    )
+    return len(records)
+
+
+class FactsIndex:
+    """Read-only, memory-mapped view of a file built by `build_facts_index`.
+
+    Safe to share between threads: lookups only read the mapping.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        try:
+            with open(self.path, "rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise SourceError(f"Cannot open facts index {self.path}: {exc}") from exc
+
+        size = len(self._mm)
+        if size < _TRAILER.size:
+            self.close()
+            raise SourceError(f"{self.path} is not a facts index")
+        magic, version, count, table = _TRAILER.unpack_from(self._mm, size - _TRAILER.size)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise SourceError(f"{self.path} is not a version {_VERSION} facts index")
+        if table + count * _RECORD.size != size - _TRAILER.size:
+            self.close()
+            raise SourceError(f"{self.path} is truncated or corrupt")
+        self._count = count
+        self._table = table
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, cik: object) -> bool:
+        return self._find(int(cik)) is not None  # type: ignore[arg-type]
+
+    def __enter__(self) -> "FactsIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def ciks(self) -> Iterator[int]:
+        for i in range(self._count):
+            yield _RECORD.unpack_from(self._mm, self._table + i * _RECORD.size)[0]
+
+    def get(self, cik: int) -> Optional[Dict[str, Any]]:
+        """The reduced companyfacts document for `cik`, or None if absent."""
+        hit = self._find(int(cik))
+        if hit is None:
+            return None
+        offset, length = hit
+        return json.loads(self._mm[offset:offset + length])
+
+    def _find(self, cik: int) -> Optional[Tuple[int, int]]:
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key, offset, length = _RECORD.unpack_from(self._mm, self._table + mid * _RECORD.size)
+            if key < cik:
+                lo = mid + 1
+            elif key > cik:
+                hi = mid
+            else:
+                return offset, length
+        return None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build a runway facts index from SEC's companyfacts.zip"
+    )
+    parser.add_argument("archive", type=Path, help="Local copy of companyfacts.zip")
+    parser.add_argument("index", type=Path, help="Index file to write")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    build_facts_index(args.archive, args.index)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
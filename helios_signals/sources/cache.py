@@ -0,0 +1,156 @@
+"""On-disk HTTP response cache with conditional revalidation.
+
+SEC's `company_tickers.json` and the per-CIK `companyfacts` documents barely
+change from one night to the next, yet without this every run downloads all of
+them in full. The cache stores each body alongside its `ETag` and
+`Last-Modified` validators; the next request for the same URL sends
+`If-None-Match` / `If-Modified-Since`, and a `304 Not Modified` is served from
+disk. An unchanged multi-megabyte file then costs one round trip and no
+transfer.
+
+This is revalidation, never expiry. Every read still asks the server whether
+the copy is current, so the cache cannot serve stale data on a night when a
+filing did change -- the pipeline would rather pay for the download than
+screen against last week's balance sheet.
+
+Bodies are stored exactly as received, still compressed, together with their
+`Content-Encoding`, so a hit decodes through the same path as a live response.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import urllib.parse
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Revalidation outcomes for one host."""
+
+    hits: int = 0
+    misses: int = 0
+    bytes_saved: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    body: bytes
+    content_encoding: str = ""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """URL-keyed response store. Thread-safe.
+
+    Statistics are kept per host rather than per URL: each source in this
+    pipeline talks to exactly one host, so the host is what lets the run report
+    attribute hits and savings to the source that earned them.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._stats: Dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            # A damaged entry is just a miss; the next 200 overwrites it.
+            logger.warning("Ignoring unreadable cache entry for %s: %s", url, exc)
+            return None
+        if meta.get("url") != url or meta.get("size") != len(body):
+            return None
+        return CachedResponse(
+            url=url,
+            body=body,
+            content_encoding=meta.get("content_encoding") or "",
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def store(self, url: str, body: bytes, headers: Dict[str, str]) -> bool:
+        """Persist a 200 response. Returns False when it carries no validators.
+
+        A response without `ETag` or `Last-Modified` cannot be revalidated, so
+        storing it would only cost disk.
+        """
+        etag, last_modified = headers.get("etag"), headers.get("last-modified")
+        if not (etag or last_modified):
+            return False
+        meta = {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "content_encoding": headers.get("content-encoding", ""),
+            "size": len(body),
+        }
+        meta_path, body_path = self._paths(url)
+        # Body first, then metadata, each via an atomic rename: a crash between
+        # the two leaves a size mismatch that lookup() treats as a miss.
+        _atomic_write(body_path, body)
+        _atomic_write(meta_path, json.dumps(meta, sort_keys=True).encode("utf-8"))
+        return True
+
+    def invalidate(self, url: str) -> None:
+        for path in self._paths(url):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def record_hit(self, url: str, bytes_saved: int) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(_host(url), CacheStats())
+            stats.hits += 1
+            stats.bytes_saved += bytes_saved
+
+    def record_miss(self, url: str) -> None:
+        with self._lock:
+            self._stats.setdefault(_host(url), CacheStats()).misses += 1
+
+    def stats_for(self, url: str) -> CacheStats:
+        """A snapshot of the counters for the host serving `url`."""
+        with self._lock:
+            return CacheStats(**asdict(self._stats.get(_host(url), CacheStats())))
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+
+def _host(url: str) -> str:
+    return (urllib.parse.urlsplit(url).hostname or "").lower()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
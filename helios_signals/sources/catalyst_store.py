@@ -0,0 +1,110 @@
+"""Local store of ClinicalTrials.gov study records, for delta sync.
+
+Each night the tracked phases come to a few thousand studies, of which a few
+dozen changed since the night before. The store keeps the raw study records
+from the last successful sync so `ClinicalTrialsSource` can ask the API only
+for what moved (see `ClinicalTrialsSource` for the sync rules).
+
+Raw records, not parsed catalysts, are what is stored. Parsing is this
+project's code and changes with it; a fix to `parse_study` should apply to
+every stored study on the next run, not only to those that happen to change.
+
+The store is one JSON file, replaced atomically. It carries a signature of the
+requested field list, and a store written under a different one is ignored
+rather than trusted: records missing a newly requested field would otherwise
+parse as if the field were empty.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+_FORMAT = 1
+# Tombstones are an audit trail, not state the sync needs; a quarter is plenty.
+TOMBSTONE_RETENTION = timedelta(days=90)
+
+
+@dataclass
+class PhaseState:
+    """Everything known about one tracked phase as of its last sync."""
+
+    studies: Dict[str, Any] = field(default_factory=dict)  # NCT ID -> raw study
+    # NCT ID -> {"status": overallStatus, "on": ISO date} for studies that
+    # left the tracked statuses.
+    tombstones: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    synced_on: Optional[date] = None
+    full_refresh_on: Optional[date] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "studies": self.studies,
+            "tombstones": self.tombstones,
+            "synced_on": self.synced_on.isoformat() if self.synced_on else None,
+            "full_refresh_on": self.full_refresh_on.isoformat() if self.full_refresh_on else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PhaseState":
+        return cls(
+            studies=dict(data.get("studies") or {}),
+            tombstones=dict(data.get("tombstones") or {}),
+            synced_on=_date(data.get("synced_on")),
+            full_refresh_on=_date(data.get("full_refresh_on")),
+        )
+
+    def prune_tombstones(self, today: date) -> None:
+        cutoff = today - TOMBSTONE_RETENTION
+        self.tombstones = {
+            nct: stone for nct, stone in self.tombstones.items()
+            if (_date(stone.get("on")) or today) >= cutoff
+        }
+
+
+class CatalystStore:
+    """JSON-file persistence for per-phase `PhaseState`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def load(self, signature: str) -> Dict[str, PhaseState]:
+        """Stored states, or {} when absent, unreadable, or from other fields."""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable catalyst store %s: %s", self.path, exc)
+            return {}
+        if data.get("format") != _FORMAT or data.get("signature") != signature:
+            logger.info("Catalyst store %s was written for another query; ignoring it", self.path)
+            return {}
+        return {
+            phase: PhaseState.from_dict(state)
+            for phase, state in (data.get("phases") or {}).items()
+        }
+
+    def save(self, signature: str, states: Dict[str, PhaseState]) -> None:
+        data = {
+            "format": _FORMAT,
+            "signature": signature,
+            "phases": {phase: state.to_dict() for phase, state in sorted(states.items())},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def _date(value: Any) -> Optional[date]:
+    try:
+        return date.fromisoformat(value) if isinstance(value, str) else None
+    except ValueError:
+        return None
@@ -17,14 +17,31 @@ recorded in the project design doc.
 
 from __future__ import annotations
 
+import asyncio
 import calendar
+import functools
+import hashlib
 import logging
+import sys
 import urllib.parse
-from datetime import date, datetime
-from typing import Any, Dict, Iterable, List, Optional
-
-from ..models import Catalyst, EventType, Provenance, SponsorClass, TrialDesign
-from .base import HttpJsonClient, SourceError, dig
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import SignalConfig
+from ..models import (
+    Catalyst,
+    EventType,
+    InterventionType,
+    Provenance,
+    SponsorClass,
+    TrialDesign,
+    utcnow,
+)
+from .base import HttpJsonClient, SourceError, cache_stats_for, dig
+from .cache import CacheStats
+from .catalyst_store import CatalystStore, PhaseState
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +53,7 @@ _FIELDS = ",".join(
         "protocolSection.identificationModule.briefTitle",
         "protocolSection.statusModule.overallStatus",
         "protocolSection.statusModule.primaryCompletionDateStruct",
+        "protocolSection.statusModule.lastUpdatePostDateStruct",
         "protocolSection.sponsorCollaboratorsModule.leadSponsor",
         "protocolSection.armsInterventionsModule.interventions",
         "protocolSection.conditionsModule.conditions",
@@ -45,12 +63,155 @@ _FIELDS = ",".join(
     ]
 )
 
+_TRACKED_STATUSES = ("RECRUITING", "ACTIVE_NOT_RECRUITING", "ENROLLING_BY_INVITATION")
+
+
+# on_page(studies, url) for _page_through.
+_PageHandler = Callable[[List[Any], str], None]
+
 _PHASE_TO_EVENT = {
     "PHASE3": EventType.PHASE_3_COMPLETION,
     "PHASE2": EventType.PHASE_2_COMPLETION,
 }
 
 
+def _study_key(study: Any) -> Tuple[Optional[str], Optional[str]]:
+    """(NCT ID, overall status) of a raw study record."""
+    proto = study.get("protocolSection", {}) if isinstance(study, dict) else {}
+    nct_id = dig(proto, "identificationModule", "nctId")
+    status = dig(proto, "statusModule", "overallStatus")
+    return (str(nct_id) if nct_id else None), (str(status).upper() if status else None)
+
+
+def _store_signature(advanced: str) -> str:
+    """Identifies the query a catalyst store was built from.
+
+    A store written for a different field list, status filter or server-side
+    filter holds a different set of studies and cannot be delta-synced safely.
+    """
+    key = f"{_FIELDS}|{'|'.join(_TRACKED_STATUSES)}|{advanced}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CatalystQuery:
+    """Screens pushed down into the registry query as a `filter.advanced` term.
+
+    Most of the registry is academic, government and behavioural research that
+    `screen_sponsor_class` and `screen_intervention_type` throw away, and most
+    of what is left completes far outside the entry window. Asking the server
+    not to send those records saves their transfer and parse time. The local
+    screens still run afterwards, so a filter that is looser than they are
+    costs bandwidth, never correctness; one that is *tighter* would drop real
+    catalysts silently, which is what `ClinicalTrialsSource.verify_query`
+    exists to catch.
+
+    An empty field means no constraint on it.
+    """
+
+    sponsor_classes: Tuple[str, ...] = ()
+    intervention_types: Tuple[str, ...] = ()
+    completion_from: Optional[date] = None
+    completion_to: Optional[date] = None
+
+    @classmethod
+    def for_screens(cls, config: SignalConfig, as_of: date) -> "CatalystQuery":
+        """The query implied by the biotech screens and timing window on `as_of`.
+
+        The completion range opens on the first of `as_of`'s month, because a
+        month-only registry date is read locally as the end of its month (see
+        `parse_ct_date`) while the server may compare it as the first. The
+        range closes at the far edge of the entry window; nearer events are
+        still fetched so the timing screen can report them.
+        """
+        industry = (SponsorClass.INDUSTRY.value,)
+        return cls(
+            sponsor_classes=industry if config.require_industry_sponsor else (),
+            intervention_types=tuple(sorted(t.value for t in InterventionType.tradeable())),
+            completion_from=as_of.replace(day=1),
+            completion_to=as_of + timedelta(days=config.entry_window_max_days),
+        )
+
+    def without_dates(self) -> "CatalystQuery":
+        return replace(self, completion_from=None, completion_to=None)
+
+    def advanced(self) -> str:
+        """The Essie expression for `filter.advanced`; empty when unconstrained."""
+        terms = []
+        if self.sponsor_classes:
+            terms.append(f"AREA[LeadSponsorClass]{_any_of(self.sponsor_classes)}")
+        if self.intervention_types:
+            terms.append(f"AREA[InterventionType]{_any_of(self.intervention_types)}")
+        if self.completion_from or self.completion_to:
+            low = self.completion_from.isoformat() if self.completion_from else "MIN"
+            high = self.completion_to.isoformat() if self.completion_to else "MAX"
+            terms.append(f"AREA[PrimaryCompletionDate]RANGE[{low},{high}]")
+        return " AND ".join(terms)
+
+    def matches(self, study: Any) -> bool:
+        """Whether the server should return `study` for this query.
+
+        Evaluated on the same raw record the server filters, so that
+        `verify_query` compares like with like. A month-only date matches if
+        any day of that month is in range.
+        """
+        proto = study.get("protocolSection", {}) if isinstance(study, dict) else {}
+        if self.sponsor_classes:
+            lead = dig(proto, "sponsorCollaboratorsModule", "leadSponsor", "class")
+            if str(lead or "").upper() not in self.sponsor_classes:
+                return False
+        if self.intervention_types:
+            interventions = dig(proto, "armsInterventionsModule", "interventions") or []
+            types = {
+                str(iv.get("type") or "").upper() for iv in interventions if isinstance(iv, dict)
+            }
+            if not types & set(self.intervention_types):
+                return False
+        if self.completion_from or self.completion_to:
+            raw = dig(proto, "statusModule", "primaryCompletionDateStruct", "date")
+            last = parse_ct_date(raw)
+            if last is None:
+                return False
+            first = last.replace(day=1) if len(str(raw).strip()) == 7 else last
+            if self.completion_from and last < self.completion_from:
+                return False
+            if self.completion_to and first > self.completion_to:
+                return False
+        return True
+
+
+def _any_of(values: Tuple[str, ...]) -> str:
+    return values[0] if len(values) == 1 else f"({' OR '.join(values)})"
+
+
+@dataclass
+class QueryCheck:
+    """One phase of `ClinicalTrialsSource.verify_query`.
+
+    `expected` are the unfiltered query's studies that the pushed-down filter
+    should keep, judged locally by `CatalystQuery.matches`. `missing` are
+    those the filtered query did not return -- real catalysts the filter would
+    lose -- and `unexpected` the reverse.
+    """
+
+    phase: str
+    advanced: str
+    unfiltered: int
+    filtered: int
+    expected: int
+    missing: List[str] = field(default_factory=list)
+    unexpected: List[str] = field(default_factory=list)
+    truncated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and not self.unexpected and not self.truncated
+
+    @property
+    def kept_fraction(self) -> float:
+        return self.filtered / self.unfiltered if self.unfiltered else 1.0
+
+
 def parse_ct_date(value: Optional[str]) -> Optional[date]:
     """Parse a ClinicalTrials.gov date.
 
@@ -62,7 +223,18 @@ def parse_ct_date(value: Optional[str]) -> Optional[date]:
     """
     if not value or not isinstance(value, str):
         return None
-    value = value.strip()
+    return _parse_ct_date(value.strip())
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_ct_date(value: str) -> Optional[date]:
+    # A registry page repeats a few hundred distinct dates across thousands
+    # of trials, and strptime was the largest single cost of parsing one.
+    if len(value) == 10:
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d", "%Y-%m"):
         try:
             parsed = datetime.strptime(value, fmt).date()
@@ -76,138 +248,512 @@ def parse_ct_date(value: Optional[str]) -> Optional[date]:
 
 
 class ClinicalTrialsSource:
-    """Fetches trials whose primary completion falls in a forward window."""
+    """Fetches trials whose primary completion falls in a forward window.
+
+    With `concurrent=True` the tracked phases are fetched in parallel, and
+    within a phase the request for the next page is put in flight as soon as
+    its `nextPageToken` is known, so parsing one page overlaps the network wait
+    for the next. Pages are still requested strictly in token order -- the API
+    offers no other way to reach them -- and results come back in the same
+    order as a sequential fetch.
+
+    With a `store`, each phase is delta-synced instead of downloaded whole:
+
+    - Only studies whose `LastUpdatePostDate` is on or after the previous sync
+      (less a day, since the filter has day granularity) are requested, with
+      no status filter, so that studies which left the tracked statuses come
+      back too. Those are tombstoned; the rest are upserted.
+    - The merged set is then checked against `totalCount` for the full query.
+      Any disagreement -- a missed update, a phase relabelled, a status filter
+      change upstream -- triggers a full refresh of the phase, as does a
+      missing or foreign store, a delta too large for `max_pages`, and the
+      passing of `full_refresh_days` since the last full download.
+    - The store is saved only after every phase has synced. A failed night
+      leaves it as it was, and the next delta starts from the last good sync.
+
+    Any request that fails still raises, exactly as without a store, so the
+    engine's fail-closed contract is unchanged.
+
+    With a `query`, its screens are applied server-side as well (see
+    `CatalystQuery`). A store is kept for the query's sponsor and intervention
+    terms only: a completion window that moves every day would change the
+    result set without changing any study, which a delta cannot see. The
+    timing screen applies the window locally instead.
+    """
 
     name = "clinicaltrials.gov"
 
-    def __init__(self, client: HttpJsonClient, page_size: int = 100, max_pages: int = 20) -> None:
+    def __init__(
+        self,
+        client: HttpJsonClient,
+        page_size: int = 100,
+        max_pages: int = 20,
+        concurrent: bool = False,
+        store: Optional[CatalystStore] = None,
+        full_refresh_days: int = 7,
+        today: Callable[[], date] = date.today,
+        query: Optional[CatalystQuery] = None,
+    ) -> None:
         self.client = client
         self.page_size = page_size
         self.max_pages = max_pages
-
-    def _build_url(self, phase: str, page_token: Optional[str]) -> str:
+        self.concurrent = concurrent
+        self.store = store
+        self.full_refresh_days = full_refresh_days
+        self._today = today
+        query = query or CatalystQuery()
+        self.query = query.without_dates() if store is not None else query
+
+    def cache_stats(self) -> CacheStats:
+        return cache_stats_for(self.client, API_ROOT)
+
+    def _build_url(
+        self,
+        phase: str,
+        page_token: Optional[str],
+        updated_since: Optional[date] = None,
+        page_size: Optional[int] = None,
+        filtered: bool = True,
+    ) -> str:
         params = {
             "query.term": f"AREA[Phase]{phase}",
-            "filter.overallStatus": "RECRUITING|ACTIVE_NOT_RECRUITING|ENROLLING_BY_INVITATION",
-            "pageSize": str(self.page_size),
+            "pageSize": str(page_size or self.page_size),
             "fields": _FIELDS,
             "countTotal": "true",
         }
+        terms = [self.query.advanced()] if filtered else []
+        if updated_since is None:
+            params["filter.overallStatus"] = "|".join(_TRACKED_STATUSES)
+        else:
+            # A study that stops matching the query's own terms is not in the
+            # delta; the count check afterwards notices it is gone.
+            terms.insert(0, f"AREA[LastUpdatePostDate]RANGE[{updated_since.isoformat()},MAX]")
+        if advanced := " AND ".join(t for t in terms if t):
+            params["filter.advanced"] = advanced
         if page_token:
             params["pageToken"] = page_token
         return f"{API_ROOT}?{urllib.parse.urlencode(params, safe='[]|')}"
 
     def fetch(self, phases: Iterable[str]) -> List[Catalyst]:
-        catalysts: List[Catalyst] = []
+        phases = list(phases)
+        work = self._fetch_phase if self.store is None else self._sync_phase
+        states = self.store.load(self._signature()) if self.store is not None else {}
+        if self.concurrent and len(phases) > 1:
+            with ThreadPoolExecutor(
+                max_workers=len(phases), thread_name_prefix="ctgov-phase"
+            ) as pool:
+                per_phase = list(pool.map(lambda ph: work(ph, states), phases))
+        else:
+            per_phase = [work(phase, states) for phase in phases]
+        return self._finish_fetch(phases, per_phase, states)
+
+    async def afetch(self, phases: Iterable[str]) -> List[Catalyst]:
+        """`fetch` over an AsyncHttpJsonClient; always concurrent."""
+        phases = list(phases)
+        work = self._afetch_phase if self.store is None else self._async_sync_phase
+        states = self.store.load(self._signature()) if self.store is not None else {}
+        per_phase = await asyncio.gather(*(work(phase, states) for phase in phases))
+        return self._finish_fetch(phases, per_phase, states)
+
+    def _signature(self) -> str:
+        return _store_signature(self.query.advanced())
+
+    def verify_query(self, phases: Iterable[str]) -> List[QueryCheck]:
+        """Compare the pushed-down query with the unfiltered one, per phase.
+
+        Downloads each phase twice, with and without the query's filter, so
+        it costs more than a normal fetch and belongs in a diagnostic run,
+        not the nightly one. The unfiltered result is judged locally with
+        `CatalystQuery.matches`; any disagreement with what the server's
+        filter returned is listed by NCT ID.
+        """
+        checks = []
         for phase in phases:
-            catalysts.extend(self._fetch_phase(phase))
-        return catalysts
+            unfiltered: List[Any] = []
+            filtered: List[Any] = []
+            complete = self._page_through(
+                lambda token: self._build_url(phase, token, filtered=False), _into(unfiltered)
+            )
+            complete &= self._page_through(
+                lambda token: self._build_url(phase, token), _into(filtered)
+            )
+            expected = {
+                nct for study in unfiltered
+                if self.query.matches(study) and (nct := _study_key(study)[0])
+            }
+            returned = {nct for study in filtered if (nct := _study_key(study)[0])}
+            checks.append(QueryCheck(
+                phase=phase,
+                advanced=self.query.advanced(),
+                unfiltered=len(unfiltered),
+                filtered=len(filtered),
+                expected=len(expected),
+                missing=sorted(expected - returned),
+                unexpected=sorted(returned - expected),
+                truncated=not complete,
+            ))
+            logger.info(
+                "%s: %s query keeps %d of %d studies (%.0f%%); %d missing, %d unexpected",
+                self.name, phase, len(filtered), len(unfiltered),
+                100 * checks[-1].kept_fraction, len(checks[-1].missing),
+                len(checks[-1].unexpected),
+            )
+        return checks
+
+    def _finish_fetch(
+        self, phases: List[str], per_phase: List[Any], states: Dict[str, PhaseState]
+    ) -> List[Catalyst]:
+        if self.store is None:
+            return [catalyst for batch in per_phase for catalyst in batch]
+        for phase, state in zip(phases, per_phase):
+            state.prune_tombstones(self._today())
+            states[phase] = state
+        self.store.save(self._signature(), states)
+        out: List[Catalyst] = []
+        retrieved_at = utcnow().isoformat()
+        for phase, state in zip(phases, per_phase):
+            studies = [state.studies[nct] for nct in sorted(state.studies)]
+            self._collect(studies, phase, out, retrieved_at)
+        return out
 
-    def _fetch_phase(self, phase: str) -> List[Catalyst]:
+    # ------------------------------------------------------------ full fetch
+
+    def _fetch_phase(self, phase: str, _states=None) -> List[Catalyst]:
         out: List[Catalyst] = []
-        token: Optional[str] = None
+        complete = self._page_through(
+            lambda token: self._build_url(phase, token),
+            lambda studies, url: self._collect(studies, phase, out, utcnow().isoformat()),
+        )
+        if not complete:
+            self._warn_truncated(phase)
+        return out
 
-        for page in range(self.max_pages):
-            url = self._build_url(phase, token)
-            payload = self.client.get_json(url)
+    async def _afetch_phase(self, phase: str, _states=None) -> List[Catalyst]:
+        out: List[Catalyst] = []
+        complete = await self._apage_through(
+            lambda token: self._build_url(phase, token),
+            lambda studies, url: self._collect(studies, phase, out, utcnow().isoformat()),
+        )
+        if not complete:
+            self._warn_truncated(phase)
+        return out
 
-            studies = payload.get("studies") if isinstance(payload, dict) else None
-            if not isinstance(studies, list):
-                raise SourceError(
-                    f"Unexpected response shape from {self.name}: "
-                    f"expected 'studies' list, got {type(studies).__name__}"
-                )
+    def _page_through(
+        self, make_url: Callable[[Optional[str]], str], on_page: _PageHandler
+    ) -> bool:
+        """Request every page, in token order. False if max_pages cut it short.
+
+        `on_page` gets each page's studies and the URL they were requested by.
+        """
+        token: Optional[str] = None
+        prefetch = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="ctgov-page")
+            if self.concurrent else None
+        )
+        pending: Optional[Future] = None
+        url = make_url(None)
 
-            for study in studies:
-                catalyst = self._parse_study(study, phase)
-                if catalyst is not None:
-                    out.append(catalyst)
+        try:
+            for page in range(self.max_pages):
+                if pending is not None:
+                    payload, pending = pending.result(), None
+                else:
+                    payload = self.client.get_json(url)
+
+                studies = self._page_studies(payload)
+                token = payload.get("nextPageToken")
+                page_url, url = url, make_url(token) if token else url
+                if token and prefetch is not None and page + 1 < self.max_pages:
+                    pending = prefetch.submit(self.client.get_json, url)
+
+                on_page(studies, page_url)
+                if not token:
+                    return True
+            return False
+        finally:
+            if prefetch is not None:
+                prefetch.shutdown(wait=True, cancel_futures=True)
+
+    async def _apage_through(
+        self, make_url: Callable[[Optional[str]], str], on_page: _PageHandler
+    ) -> bool:
+        token: Optional[str] = None
+        pending: Optional[asyncio.Future] = None
+        url = make_url(None)
 
-            token = payload.get("nextPageToken")
-            if not token:
-                break
-        else:
-            # Loop exhausted without exhausting the result set. Say so rather
-            # than silently truncating -- a quiet cap reads as full coverage.
-            logger.warning(
-                "%s: hit max_pages=%d for %s; results truncated",
-                self.name,
-                self.max_pages,
-                phase,
+        try:
+            for page in range(self.max_pages):
+                if pending is not None:
+                    payload, pending = await pending, None
+                else:
+                    payload = await self.client.get_json(url)
+
+                studies = self._page_studies(payload)
+                token = payload.get("nextPageToken")
+                page_url, url = url, make_url(token) if token else url
+                if token and page + 1 < self.max_pages:
+                    pending = asyncio.ensure_future(self.client.get_json(url))
+                    # Let the next request reach the wire before parsing,
+                    # which holds the loop, starts.
+                    await asyncio.sleep(0)
+
+                on_page(studies, page_url)
+                if not token:
+                    return True
+            return False
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    # ------------------------------------------------------------ delta sync
+
+    def _sync_phase(self, phase: str, states: Dict[str, PhaseState]) -> PhaseState:
+        today = self._today()
+        previous = states.get(phase)
+        reason = self._full_refresh_reason(previous, today)
+        if reason is None:
+            changed: List[Any] = []
+            complete = self._page_through(
+                lambda token: self._build_url(phase, token, self._delta_since(previous)),
+                _into(changed),
+            )
+            if complete:
+                state = self._merge(phase, previous, changed, today)
+                reason = self._inconsistency(
+                    phase, state, self.client.get_json(self._count_url(phase))
+                )
+                if reason is None:
+                    return state
+            else:
+                reason = f"delta exceeded max_pages={self.max_pages}"
+
+        logger.info("%s: full refresh of %s (%s)", self.name, phase, reason)
+        fetched: List[Any] = []
+        if not self._page_through(lambda token: self._build_url(phase, token), _into(fetched)):
+            self._warn_truncated(phase)
+        return self._replace(fetched, today)
+
+    async def _async_sync_phase(self, phase: str, states: Dict[str, PhaseState]) -> PhaseState:
+        today = self._today()
+        previous = states.get(phase)
+        reason = self._full_refresh_reason(previous, today)
+        if reason is None:
+            changed: List[Any] = []
+            complete = await self._apage_through(
+                lambda token: self._build_url(phase, token, self._delta_since(previous)),
+                _into(changed),
             )
+            if complete:
+                state = self._merge(phase, previous, changed, today)
+                reason = self._inconsistency(
+                    phase, state, await self.client.get_json(self._count_url(phase))
+                )
+                if reason is None:
+                    return state
+            else:
+                reason = f"delta exceeded max_pages={self.max_pages}"
+
+        logger.info("%s: full refresh of %s (%s)", self.name, phase, reason)
+        fetched: List[Any] = []
+        if not await self._apage_through(
+            lambda token: self._build_url(phase, token), _into(fetched)
+        ):
+            self._warn_truncated(phase)
+        return self._replace(fetched, today)
+
+    def _full_refresh_reason(self, state: Optional[PhaseState], today: date) -> Optional[str]:
+        if state is None or state.synced_on is None or state.full_refresh_on is None:
+            return "no usable stored state"
+        if state.synced_on > today:
+            return f"store claims a sync on {state.synced_on}, after today"
+        if (today - state.full_refresh_on).days >= self.full_refresh_days:
+            return f"last full refresh was {state.full_refresh_on}"
+        return None
 
-        return out
+    @staticmethod
+    def _delta_since(state: PhaseState) -> date:
+        # LastUpdatePostDate has day granularity and a record can be posted
+        # later on the day of the last sync; re-reading that day is harmless.
+        return state.synced_on - timedelta(days=1)
+
+    def _count_url(self, phase: str) -> str:
+        return self._build_url(phase, None, page_size=1)
+
+    def _merge(
+        self, phase: str, previous: PhaseState, changed: List[Any], today: date
+    ) -> PhaseState:
+        studies = dict(previous.studies)
+        tombstones = dict(previous.tombstones)
+        upserted = retired = 0
+        for study in changed:
+            nct_id, status = _study_key(study)
+            if not nct_id:
+                continue
+            if status in _TRACKED_STATUSES:
+                studies[nct_id] = study
+                tombstones.pop(nct_id, None)
+                upserted += 1
+            elif nct_id in studies:
+                del studies[nct_id]
+                tombstones[nct_id] = {"status": status or "UNKNOWN", "on": today.isoformat()}
+                retired += 1
+        logger.info(
+            "%s: %s delta sync: %d changed, %d upserted, %d tombstoned",
+            self.name, phase, len(changed), upserted, retired,
+        )
+        return PhaseState(
+            studies=studies,
+            tombstones=tombstones,
+            synced_on=today,
+            full_refresh_on=previous.full_refresh_on,
+        )
 
-    def _parse_study(self, study: Dict[str, Any], phase: str) -> Optional[Catalyst]:
-        proto = study.get("protocolSection", {}) if isinstance(study, dict) else {}
+    def _inconsistency(self, phase: str, state: PhaseState, payload: Any) -> Optional[str]:
+        total = payload.get("totalCount") if isinstance(payload, dict) else None
+        if not isinstance(total, int):
+            return "API did not report totalCount"
+        if total != len(state.studies):
+            return f"store holds {len(state.studies)} {phase} studies, API reports {total}"
+        return None
+
+    @staticmethod
+    def _replace(fetched: List[Any], today: date) -> PhaseState:
+        studies: Dict[str, Any] = {}
+        for study in fetched:
+            nct_id, _ = _study_key(study)
+            if nct_id:
+                studies[nct_id] = study
+        return PhaseState(studies=studies, synced_on=today, full_refresh_on=today)
+
+    def _collect(
+        self, studies: List[Any], phase: str, out: List[Catalyst], retrieved_at: str
+    ) -> None:
+        for study in studies:
+            catalyst = parse_study(study, phase, self.name, retrieved_at)
+            if catalyst is not None:
+                out.append(catalyst)
+
+    def _warn_truncated(self, phase: str) -> None:
+        # Loop exhausted without exhausting the result set. Say so rather
+        # than silently truncating -- a quiet cap reads as full coverage.
+        logger.warning(
+            "%s: hit max_pages=%d for %s; results truncated",
+            self.name,
+            self.max_pages,
+            phase,
+        )
 
-        nct_id = dig(proto, "identificationModule", "nctId")
-        if not nct_id:
-            return None
+    def _page_studies(self, payload: Any) -> List[Any]:
+        studies = payload.get("studies") if isinstance(payload, dict) else None
+        if not isinstance(studies, list):
+            raise SourceError(
+                f"Unexpected response shape from {self.name}: "
+                f"expected 'studies' list, got {type(studies).__name__}"
+            )
+        return studies
+
+
+def parse_study(
+    study: Dict[str, Any],
+    phase: str,
+    source: str = ClinicalTrialsSource.name,
+    retrieved_at: Optional[str] = None,
+) -> Optional[Catalyst]:
+    """One registry record as a Catalyst, or None if it is not a catalyst.
+
+    Strings that repeat across the registry are interned, so ten thousand
+    trials from forty sponsors hold forty sponsor names. `retrieved_at` is
+    normally the page's, one string shared by its records; the provenance
+    url is always the study's public page, which anyone can check -- never
+    the paged API request or a local store path. `source` names whoever
+    held the record: the live source, or a snapshot replaying it.
+    """
+    proto = study.get("protocolSection", {}) if isinstance(study, dict) else {}
 
-        pcd = dig(proto, "statusModule", "primaryCompletionDateStruct", default={})
-        event_date = parse_ct_date(pcd.get("date") if isinstance(pcd, dict) else None)
-        if event_date is None:
-            return None
+    nct_id = dig(proto, "identificationModule", "nctId")
+    if not nct_id:
+        return None
 
-        # "ACTUAL" means the date has already happened; only "ESTIMATED"
-        # dates are forward-looking catalysts.
-        date_type = (pcd.get("type") or "").upper() if isinstance(pcd, dict) else ""
-        if date_type == "ACTUAL":
-            return None
+    status = proto.get("statusModule") or {}
+    pcd = status.get("primaryCompletionDateStruct") if isinstance(status, dict) else None
+    if not isinstance(pcd, dict):
+        pcd = {}
+    event_date = parse_ct_date(pcd.get("date"))
+    if event_date is None:
+        return None
 
-        lead = dig(proto, "sponsorCollaboratorsModule", "leadSponsor", default={}) or {}
-        sponsor = lead.get("name") or ""
-        if not sponsor:
-            return None
+    # "ACTUAL" means the date has already happened; only "ESTIMATED"
+    # dates are forward-looking catalysts.
+    if (pcd.get("type") or "").upper() == "ACTUAL":
+        return None
 
-        try:
-            sponsor_class = SponsorClass((lead.get("class") or "UNKNOWN").upper())
-        except ValueError:
-            sponsor_class = SponsorClass.UNKNOWN
-
-        interventions = dig(proto, "armsInterventionsModule", "interventions", default=[]) or []
-        names, types = [], []
-        for iv in interventions:
-            if isinstance(iv, dict):
-                if iv.get("name"):
-                    names.append(str(iv["name"]))
-                if iv.get("type"):
-                    types.append(str(iv["type"]).upper())
-
-        phases = dig(proto, "designModule", "phases", default=[]) or []
-        phase_key = phase
-        for p in phases:
-            if isinstance(p, str) and p.upper() in _PHASE_TO_EVENT:
-                phase_key = p.upper()
-                break
-
-        enrol = dig(proto, "designModule", "enrollmentInfo", default={}) or {}
-        design_info = dig(proto, "designModule", "designInfo", default={}) or {}
-        enrollment = enrol.get("count")
-        design = TrialDesign(
-            enrollment=int(enrollment) if isinstance(enrollment, (int, float)) else None,
-            enrollment_is_estimated=(enrol.get("type") or "").upper() != "ACTUAL",
-            allocation=design_info.get("allocation"),
-            masking=dig(design_info, "maskingInfo", "masking"),
-            primary_purpose=design_info.get("primaryPurpose"),
-        )
+    lead = dig(proto, "sponsorCollaboratorsModule", "leadSponsor", default={}) or {}
+    sponsor = lead.get("name") or ""
+    if not sponsor:
+        return None
 
-        return Catalyst(
-            event_type=_PHASE_TO_EVENT.get(phase_key, EventType.PHASE_3_COMPLETION),
-            event_date=event_date,
-            sponsor=sponsor,
-            title=dig(proto, "identificationModule", "briefTitle", default="") or "",
-            external_id=str(nct_id),
-            intervention_names=names,
-            intervention_types=types,
-            conditions=list(dig(proto, "conditionsModule", "conditions", default=[]) or []),
-            date_is_estimated=True,
-            sponsor_class=sponsor_class,
-            design=design,
-            phase_label=phase_key,
-            provenance=Provenance(
-                source=self.name,
-                url=f"https://clinicaltrials.gov/study/{nct_id}",
-            ),
-        )
+    try:
+        sponsor_class = SponsorClass((lead.get("class") or "UNKNOWN").upper())
+    except ValueError:
+        sponsor_class = SponsorClass.UNKNOWN
+
+    interventions = dig(proto, "armsInterventionsModule", "interventions", default=[]) or []
+    names, types = [], []
+    for iv in interventions:
+        if isinstance(iv, dict):
+            if iv.get("name"):
+                names.append(_intern(iv["name"]))
+            if iv.get("type"):
+                types.append(_intern(str(iv["type"]).upper()))
+
+    design_module = proto.get("designModule") or {}
+    phases = design_module.get("phases") or []
+    phase_key = phase
+    for p in phases:
+        if isinstance(p, str) and p.upper() in _PHASE_TO_EVENT:
+            phase_key = p.upper()
+            break
+
+    enrol = design_module.get("enrollmentInfo") or {}
+    design_info = design_module.get("designInfo") or {}
+    enrollment = enrol.get("count")
+    design = TrialDesign(
+        enrollment=int(enrollment) if isinstance(enrollment, (int, float)) else None,
+        enrollment_is_estimated=(enrol.get("type") or "").upper() != "ACTUAL",
+        allocation=_intern(design_info.get("allocation")),
+        masking=_intern(dig(design_info, "maskingInfo", "masking")),
+        primary_purpose=_intern(design_info.get("primaryPurpose")),
+    )
+
+    return Catalyst(
+        event_type=_PHASE_TO_EVENT.get(phase_key, EventType.PHASE_3_COMPLETION),
+        event_date=event_date,
+        sponsor=_intern(sponsor),
+        title=dig(proto, "identificationModule", "briefTitle", default="") or "",
+        external_id=str(nct_id),
+        intervention_names=names,
+        intervention_types=types,
+        conditions=[
+            _intern(c) for c in dig(proto, "conditionsModule", "conditions", default=[]) or []
+        ],
+        date_is_estimated=True,
+        sponsor_class=sponsor_class,
+        design=design,
+        phase_label=_intern(phase_key),
+        provenance=Provenance(
+            source=source,
+            url=f"https://clinicaltrials.gov/study/{nct_id}",
+            retrieved_at=retrieved_at or utcnow().isoformat(),
+        ),
+    )
+
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern for strings; anything else (None, a stray number) as is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _into(studies: List[Any]) -> "_PageHandler":
+    """A page handler that accumulates raw studies."""
+    return lambda page, _url: studies.extend(page)
@@ -0,0 +1,116 @@
+"""Client-side request throttling.
+
+SEC's fair-access policy caps automated clients at 10 requests per second and
+enforces it by blocking the offending IP. Exponential backoff only reacts after
+a request has already been refused; once requests run concurrently, staying
+under the limit has to be arranged up front.
+
+The limiter lives inside the HTTP client, so every source sharing a client
+shares its budget. `TickerResolver` and `CompanyFactsSource` both talk to SEC
+and must be throttled as one caller, because that is how SEC counts them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import urllib.parse
+from typing import Callable, Dict, Mapping, Optional
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at `rate_per_s` up to `burst`. A caller that
+    finds the bucket empty reserves the next token anyway and sleeps until it
+    is due, so waiting threads are served in the order they asked rather than
+    racing each other on wake-up.
+
+    `burst` defaults to one token. A bucket that starts full of `rate_per_s`
+    tokens lets a spent burst and a second's refill through in the same
+    second -- twice the rate -- and SEC counts requests per second.
+    """
+
+    def __init__(
+        self,
+        rate_per_s: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_s <= 0:
+            raise ValueError("rate_per_s must be positive")
+        self.rate_per_s = rate_per_s
+        self.burst = burst if burst is not None else 1.0
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token; return how many seconds the caller must wait for it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_s)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_s
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """As `acquire`, but yields to the event loop instead of blocking it.
+
+        Reservations are shared with `acquire`, so threads and coroutines can
+        draw on the same bucket without exceeding its rate between them.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """One token bucket per rate rule, selected by request host.
+
+    Rules are keyed by domain and match the domain itself and every subdomain,
+    so a single `"sec.gov"` rule covers both `www.sec.gov` and `data.sec.gov`
+    with one shared bucket. The most specific matching rule wins. Hosts that
+    match no rule are not throttled.
+    """
+
+    def __init__(
+        self,
+        rates_per_s: Mapping[str, float],
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self._buckets: Dict[str, TokenBucket] = {
+            domain.lower().lstrip("."): TokenBucket(rate, clock=clock, sleep=sleep)
+            for domain, rate in rates_per_s.items()
+        }
+        # Longest first, so the most specific rule is found first.
+        self._domains = sorted(self._buckets, key=len, reverse=True)
+
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        host = (urllib.parse.urlsplit(url).hostname or "").lower()
+        for domain in self._domains:
+            if host == domain or host.endswith("." + domain):
+                return self._buckets[domain]
+        return None
+
+    def acquire(self, url: str) -> None:
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        bucket = self.bucket_for(url)
+        if bucket is not None:
+            await bucket.acquire_async()
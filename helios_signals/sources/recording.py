@@ -0,0 +1,200 @@
+"""Record a run's HTTP responses to disk and replay them without a network.
+
+Profiling, benchmarking or debugging the pipeline against the live APIs is
+neither repeatable nor fast: the registry changes under you, the rate limits
+pace every request, and a bug seen last night may not reproduce tonight. A
+recording captures every response one run received; a replay serves exactly
+those responses back, in the same order per URL, at local-disk speed.
+
+Both sit underneath the client as its transport, so everything above -- status
+handling, retries, decoding, redirects -- runs exactly as it did live. Only
+responses are recorded. A request that failed at the socket was retried by the
+client and its successful retry is what the recording holds, so a replay takes
+the happy path through transient failures it never sees.
+
+Directory layout:
+
+    manifest.jsonl    a header line {"format", "recorded_at", "meta"}, then
+                      one line per response: method, url, status, headers,
+                      body file
+    bodies/<sha256>.gz   each distinct body once, gzip-compressed
+
+The manifest is appended to as responses arrive, so a run that dies midway
+still leaves a usable recording of everything up to that point.
+
+A recording is only as replayable as the requests are repeatable. The
+conditional-GET cache and the catalyst store both make tonight's requests
+depend on earlier nights, so `run_nightly` turns both off when recording or
+replaying; the recorded `as_of` becomes the replay's default date, since the
+catalyst query embeds it.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..models import utcnow
+from .base import HttpResponse, SourceError
+
+logger = logging.getLogger(__name__)
+
+_FORMAT = 1
+_MANIFEST = "manifest.jsonl"
+_BODIES = "bodies"
+
+_Key = Tuple[str, str]  # (method, url)
+
+
+class ResponseRecording:
+    """One recorded run on disk. Thread-safe.
+
+    Use `create` to start a recording and `open` to replay one.
+    """
+
+    def __init__(self, directory: Path, meta: Dict[str, Any]) -> None:
+        self.directory = Path(directory)
+        self.meta = meta
+        self._entries: Dict[_Key, List[Dict[str, Any]]] = {}
+        self._cursors: Dict[_Key, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, directory: Path, **meta: Any) -> "ResponseRecording":
+        """Start a new recording in `directory`, replacing any manifest there.
+
+        Bodies already in the directory are kept; identical ones are reused.
+        """
+        recording = cls(directory, meta)
+        (recording.directory / _BODIES).mkdir(parents=True, exist_ok=True)
+        header = {"format": _FORMAT, "recorded_at": utcnow().isoformat(), "meta": meta}
+        (recording.directory / _MANIFEST).write_text(
+            json.dumps(header, sort_keys=True) + "\n", encoding="utf-8"
+        )
+        return recording
+
+    @classmethod
+    def open(cls, directory: Path) -> "ResponseRecording":
+        """A recording made by `create`, ready to replay."""
+        path = Path(directory) / _MANIFEST
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+            header = json.loads(lines[0])
+            entries = [json.loads(line) for line in lines[1:] if line.strip()]
+        except FileNotFoundError:
+            raise SourceError(f"No recording at {directory}") from None
+        except (OSError, ValueError, IndexError) as exc:
+            raise SourceError(f"Cannot read recording manifest {path}: {exc}") from exc
+        if header.get("format") != _FORMAT:
+            raise SourceError(f"{path} is not a version {_FORMAT} recording")
+        recording = cls(directory, dict(header.get("meta") or {}))
+        for entry in entries:
+            recording._entries.setdefault((entry["method"], entry["url"]), []).append(entry)
+        logger.info(
+            "Replaying %d responses for %d URLs from %s",
+            len(entries), len(recording._entries), recording.directory,
+        )
+        return recording
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def store(self, method: str, url: str, resp: HttpResponse) -> None:
+        """Append one response to the recording."""
+        digest = hashlib.sha256(resp.body).hexdigest()
+        body_path = self.directory / _BODIES / f"{digest}.gz"
+        if not body_path.exists():
+            tmp = body_path.with_name(f"{body_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(resp.body, mtime=0))
+            os.replace(tmp, body_path)
+        entry = {
+            "method": method,
+            "url": url,
+            "status": resp.status,
+            "headers": resp.headers,
+            "body": digest,
+        }
+        line = json.dumps(entry, sort_keys=True) + "\n"
+        with self._lock:
+            with open(self.directory / _MANIFEST, "a", encoding="utf-8") as fh:
+                fh.write(line)
+            self._entries.setdefault((method, url), []).append(entry)
+
+    def replay(self, method: str, url: str) -> HttpResponse:
+        """The next recorded response for (method, url).
+
+        Repeated requests get the recorded responses in order, and the last
+        one again once they run out. An unrecorded URL is a SourceError, not
+        a network fallback: a replay that quietly went live would not be one.
+        """
+        key = (method, url)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                raise SourceError(f"{method} {url} is not in the recording at {self.directory}")
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = position + 1
+            entry = entries[min(position, len(entries) - 1)]
+        body_path = self.directory / _BODIES / f"{entry['body']}.gz"
+        try:
+            body = gzip.decompress(body_path.read_bytes())
+        except (OSError, EOFError) as exc:
+            raise SourceError(f"Recorded body for {url} is unreadable: {exc}") from exc
+        return HttpResponse(entry["status"], dict(entry["headers"]), body)
+
+
+class RecordingTransport:
+    """Passes requests to `inner` and records every response."""
+
+    def __init__(self, recording: ResponseRecording, inner: Any) -> None:
+        self.recording = recording
+        self._inner = inner
+
+    def request(self, method: str, url: str, headers: Dict[str, str]) -> HttpResponse:
+        resp = self._inner.request(method, url, headers)
+        self.recording.store(method, url, resp)
+        return resp
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class ReplayTransport:
+    """Serves a recording; never opens a socket."""
+
+    def __init__(self, recording: ResponseRecording) -> None:
+        self.recording = recording
+
+    def request(self, method: str, url: str, headers: Dict[str, str]) -> HttpResponse:
+        return self.recording.replay(method, url)
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncRecordingTransport(RecordingTransport):
+    """`RecordingTransport` around an AsyncConnectionPool."""
+
+    async def request(self, method: str, url: str, headers: Dict[str, str]) -> HttpResponse:
+        resp = await self._inner.request(method, url, headers)
+        self.recording.store(method, url, resp)
+        return resp
+
+    async def close(self) -> None:
+        await self._inner.close()
+
+
+class AsyncReplayTransport(ReplayTransport):
+    """`ReplayTransport` for AsyncHttpJsonClient."""
+
+    async def request(self, method: str, url: str, headers: Dict[str, str]) -> HttpResponse:
+        return self.recording.replay(method, url)
+
+    async def close(self) -> None:
+        pass
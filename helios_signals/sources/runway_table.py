@@ -0,0 +1,247 @@
+"""Precomputed cash runway for every filer, keyed by CIK and as-of date.
+
+Computing runway means walking a filer's cash and cash-flow series and parsing
+every period date in them. That is cheap for the handful of sponsors a nightly
+run screens, and wasteful for the whole EDGAR universe or for re-screening past
+dates, where the same filings are walked again for every question asked.
+
+`build_runway_table` walks a bulk facts index (see `bulkfacts`) once and
+records the runway each filer had on each requested as-of date, using only
+facts filed by then -- what the screen could actually have known, not what
+later amendments say. The result is a columnar table (`helios_signals.columnar`)
+sorted by (cik, as_of). `RunwayTable.lookup` answers from it with a dict probe
+and a bisect over one filer's dates; the engine consults it before fetching
+anything.
+
+A table is a snapshot, so staleness is the lookup's problem: a row older than
+`max_age_days` is a miss, and the engine falls back to a live fetch.
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import bisect
+import logging
+import math
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..columnar import ColumnarTable, write_table
+from ..models import CashRunway, Provenance, utcnow
+from .bulkfacts import FactsIndex
+from .sec import _BURN_TAGS, _CASH_TAGS, CompanyFactsSource
+
+logger = logging.getLogger(__name__)
+
+_KIND = "helios.runway"
+_TAGS = list(_CASH_TAGS) + list(_BURN_TAGS)
+_NAN = float("nan")
+_NO_DATE = 0
+
+
+def build_runway_table(index: FactsIndex, as_of_dates: Sequence[date], path: Path) -> int:
+    """Compute point-in-time runway for every CIK in `index` on every date.
+
+    Returns the number of rows written. A filer with nothing filed by a given
+    date gets no row for it, so a lookup on that date falls through to the
+    filer's live data rather than reading an empty computation as an answer.
+    """
+    dates = sorted(set(as_of_dates))
+    if not dates:
+        raise ValueError("at least one as-of date is required")
+    facts = CompanyFactsSource(client=None)
+    notes: Dict[str, int] = {}
+    cols = {
+        "cik": array.array("I"),
+        "as_of": array.array("i"),
+        "cash_usd": array.array("d"),
+        "burn_usd": array.array("d"),
+        "months": array.array("d"),
+        "cash_tag": array.array("b"),
+        "burn_tag": array.array("b"),
+        "cash_as_of": array.array("i"),
+        "burn_period_end": array.array("i"),
+        "note": array.array("h"),
+    }
+
+    for cik in index.ciks():  # ascending, so rows come out sorted
+        payload = index.get(cik)
+        for as_of in dates:
+            runway = facts.runway_from_facts(f"{cik:010d}", payload, filed_by=as_of)
+            if runway.cash_tag is None and runway.burn_tag is None:
+                continue  # nothing public yet
+            cols["cik"].append(cik)
+            cols["as_of"].append(as_of.toordinal())
+            cols["cash_usd"].append(_num(runway.cash_usd))
+            cols["burn_usd"].append(_num(runway.quarterly_burn_usd))
+            cols["months"].append(_num(runway.months))
+            cols["cash_tag"].append(_code(runway.cash_tag))
+            cols["burn_tag"].append(_code(runway.burn_tag))
+            cols["cash_as_of"].append(_ordinal(runway.cash_as_of))
+            cols["burn_period_end"].append(_ordinal(runway.burn_period_end))
+            cols["note"].append(notes.setdefault(runway.note, len(notes)))
+
+    write_table(
+        path,
+        cols,
+        meta={
+            "kind": _KIND,
+            "built_at": utcnow().isoformat(),
+            "facts_index": str(index.path),
+            "as_of_dates": [d.isoformat() for d in dates],
+            "tags": _TAGS,
+            "notes": sorted(notes, key=notes.__getitem__),
+        },
+    )
+    rows = len(cols["cik"])
+    logger.info("Wrote %d runway rows (%d dates) to %s", rows, len(dates), path)
+    return rows
+
+
+class RunwayTable:
+    """Lookup side of `build_runway_table`. Safe to share between threads."""
+
+    name = "runway_table"
+
+    def __init__(self, path: Path, max_age_days: Optional[int] = None) -> None:
+        self._table = ColumnarTable(path)
+        if self._table.meta.get("kind") != _KIND:
+            self._table.close()
+            raise ValueError(f"{path} is not a runway table")
+        self.path = self._table.path
+        self.max_age_days = max_age_days
+        self.meta = self._table.meta
+        self._tags: List[str] = self.meta["tags"]
+        self._notes: List[str] = self.meta["notes"]
+        self._cols = {name: self._table.column(name) for name in self._table.names}
+        # One pass to find each filer's row range; lookups never scan again.
+        self._ranges: Dict[int, Tuple[int, int]] = {}
+        ciks = self._cols["cik"]
+        start = 0
+        for i in range(1, len(ciks) + 1):
+            if i == len(ciks) or ciks[i] != ciks[start]:
+                self._ranges[ciks[start]] = (start, i)
+                start = i
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __enter__(self) -> "RunwayTable":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._cols.clear()
+        self._table.close()
+
+    def lookup(self, cik: str, as_of: date) -> Optional[CashRunway]:
+        """Runway as of the latest table date on or before `as_of`.
+
+        None when the filer is absent, every row postdates `as_of`, or the
+        newest usable row is older than `max_age_days`.
+        """
+        span = self._ranges.get(int(cik))
+        if span is None:
+            return None
+        lo, hi = span
+        target = as_of.toordinal()
+        row = bisect.bisect_right(self._cols["as_of"], target, lo, hi) - 1
+        if row < lo:
+            return None
+        row_date = self._cols["as_of"][row]
+        if self.max_age_days is not None and target - row_date > self.max_age_days:
+            return None
+        return self._runway(cik, row)
+
+    def _runway(self, cik: str, row: int) -> CashRunway:
+        c = self._cols
+        as_of = date.fromordinal(c["as_of"][row])
+        return CashRunway(
+            cik=cik,
+            months=_opt(c["months"][row]),
+            cash_usd=_opt(c["cash_usd"][row]),
+            quarterly_burn_usd=_opt(c["burn_usd"][row]),
+            provenance=Provenance(
+                source=self.name,
+                # The table's file name, not its path: see CompanyFactsSource._from_index.
+                url=f"{self.path.name}#CIK{int(cik):010d}@{as_of.isoformat()}",
+                retrieved_at=self.meta["built_at"],
+            ),
+            note=self._notes[c["note"][row]],
+            cash_tag=self._tag(c["cash_tag"][row]),
+            cash_as_of=_from_ordinal(c["cash_as_of"][row]),
+            burn_tag=self._tag(c["burn_tag"][row]),
+            burn_period_end=_from_ordinal(c["burn_period_end"][row]),
+        )
+
+    def _tag(self, code: int) -> Optional[str]:
+        return self._tags[code] if code >= 0 else None
+
+
+def _num(value: Optional[float]) -> float:
+    return _NAN if value is None else float(value)
+
+
+def _opt(value: float) -> Optional[float]:
+    # NaN encodes "unknown"; infinity ("not burning") is a real value and stays.
+    return None if math.isnan(value) else value
+
+
+def _code(tag: Optional[str]) -> int:
+    return _TAGS.index(tag) if tag is not None else -1
+
+
+def _ordinal(day: Optional[date]) -> int:
+    return day.toordinal() if day is not None else _NO_DATE
+
+
+def _from_ordinal(value: int) -> Optional[date]:
+    return date.fromordinal(value) if value != _NO_DATE else None
+
+
+def month_ends(start: date, end: date) -> List[date]:
+    """Every calendar month end from `start` to `end`, inclusive."""
+    out = []
+    year, month = start.year, start.month
+    while True:
+        following = date(year + month // 12, month % 12 + 1, 1)
+        last = following - timedelta(days=1)
+        if last > end:
+            return out
+        if last >= start:
+            out.append(last)
+        year, month = following.year, following.month
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Precompute cash runway for every filer in a facts index"
+    )
+    parser.add_argument("index", type=Path, help="Facts index from sources.bulkfacts")
+    parser.add_argument("table", type=Path, help="Runway table to write")
+    parser.add_argument(
+        "--as-of", action="append", default=[], metavar="YYYY-MM-DD",
+        help="As-of date to compute (repeatable). Defaults to today.",
+    )
+    parser.add_argument(
+        "--month-ends-since", metavar="YYYY-MM-DD", default=None,
+        help="Also compute every month end from this date to today",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    today = date.today()
+    dates = [date.fromisoformat(d) for d in args.as_of] or [today]
+    if args.month_ends_since:
+        dates += month_ends(date.fromisoformat(args.month_ends_since), today)
+    with FactsIndex(args.index) as index:
+        build_runway_table(index, dates, args.table)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -19,13 +19,23 @@ unavoidable without paying.
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
 from ..models import CashRunway, Provenance
-from .base import HttpJsonClient, SourceError
+from .aliases import SPONSOR_ALIASES, aliases_version
+from .base import HttpJsonClient, SourceError, cache_stats_for
+from .cache import CacheStats
+from .ticker_index import TickerIndex, open_ticker_index, payload_version, write_ticker_index
+
+if TYPE_CHECKING:
+    from .bulkfacts import FactsIndex
 
 logger = logging.getLogger(__name__)
 
@@ -35,14 +45,14 @@ FACTS_URL = "https://data.sec.gov/api/xbrl/companyfacts/CIK{cik:010d}.json"
 # Corporate suffixes and filler stripped before matching. Sponsor names in
 # ClinicalTrials.gov and company names in EDGAR are entered by different people
 # for different purposes and rarely agree on punctuation or suffix.
-_SUFFIXES = {
+_SUFFIXES = frozenset({
     "inc", "incorporated", "corp", "corporation", "co", "company", "ltd",
     "limited", "llc", "lp", "plc", "sa", "nv", "ag", "gmbh", "as", "ab",
     "holdings", "holding", "group", "the", "pharmaceuticals", "pharmaceutical",
     "pharma", "therapeutics", "biosciences", "bioscience", "biotech",
     "biopharma", "biopharmaceuticals", "laboratories", "labs", "sciences",
     "science", "medical", "health", "healthcare", "technologies", "technology",
-}
+})
 
 _CASH_TAGS = [
     "CashAndCashEquivalentsAtCarryingValue",
@@ -53,17 +63,90 @@ _BURN_TAGS = [
     "NetCashProvidedByUsedInOperatingActivities",
     "NetCashProvidedByUsedInOperatingActivitiesContinuingOperations",
 ]
+_RUNWAY_TAGS = tuple(_CASH_TAGS + _BURN_TAGS)
+
 
+_PUNCTUATION = re.compile(r"[^a-z0-9\s]")
+# The same substitution as a str.translate table, valid for ASCII input only.
+# Nearly every name is ASCII, and translate is several times faster than sub.
+_ASCII_PUNCTUATION = str.maketrans(
+    {chr(i): " " for i in range(128) if _PUNCTUATION.match(chr(i))}
+)
 
+
+@lru_cache(maxsize=16384)
 def normalise_company_name(name: str) -> str:
-    """Reduce a company name to comparable tokens."""
+    """Reduce a company name to comparable tokens.
+
+    Memoised: the same sponsors recur across trials and across the ticker
+    file's titles, and the answer never changes within a process.
+    """
     if not name:
         return ""
-    lowered = re.sub(r"[^a-z0-9\s]", " ", name.lower())
-    tokens = [t for t in lowered.split() if t and t not in _SUFFIXES]
+    lowered = name.lower()
+    if lowered.isascii():
+        lowered = lowered.translate(_ASCII_PUNCTUATION)
+    else:
+        lowered = _PUNCTUATION.sub(" ", lowered)
+    tokens = [t for t in lowered.split() if t not in _SUFFIXES]
     return " ".join(tokens)
 
 
+def compile_tickers(
+    payload: Any, aliases: Mapping[str, Optional[int]] = SPONSOR_ALIASES
+) -> Tuple[Dict[str, Tuple[str, int]], set]:
+    """`company_tickers.json` -> (normalised name -> (ticker, CIK), ambiguous names).
+
+    A name two distinct companies normalise to is left out of the map and
+    listed as ambiguous instead. `aliases` (see `aliases`) are compiled in
+    over the exact matches: a curated name overrides whatever EDGAR title
+    normalises to it, ambiguous or not.
+    """
+    if not isinstance(payload, dict):
+        raise SourceError(f"Unexpected shape from {TICKER_URL}")
+
+    by_name: Dict[str, Tuple[str, int]] = {}
+    ambiguous: set[str] = set()
+    primary: Dict[int, str] = {}  # CIK -> first-listed ticker
+    for entry in payload.values():
+        if not isinstance(entry, dict):
+            continue
+        ticker = entry.get("ticker")
+        cik = entry.get("cik_str")
+        title = entry.get("title")
+        if not (ticker and cik and title):
+            continue
+        primary.setdefault(int(cik), str(ticker))
+        key = normalise_company_name(str(title))
+        if not key:
+            continue
+        if key in by_name and by_name[key] != (str(ticker), int(cik)):
+            # Two distinct companies normalise to the same key. Refuse
+            # both rather than guessing.
+            ambiguous.add(key)
+            continue
+        by_name[key] = (str(ticker), int(cik))
+
+    for key in ambiguous:
+        by_name.pop(key, None)
+
+    for alias, cik in aliases.items():
+        key = normalise_company_name(alias)
+        if not key:
+            continue
+        ambiguous.discard(key)
+        if cik is not None and cik in primary:
+            by_name[key] = (primary[cik], cik)
+        else:
+            by_name.pop(key, None)
+    return by_name, ambiguous
+
+
+def index_version(text: str, aliases: Mapping[str, Optional[int]] = SPONSOR_ALIASES) -> str:
+    """Key for a ticker index compiled from `text` with `aliases`."""
+    return f"{payload_version(text)}|aliases:{aliases_version(aliases)}"
+
+
 class TickerResolver:
     """Resolves sponsor names to (ticker, CIK).
 
@@ -72,55 +155,203 @@ class TickerResolver:
     companies, and a near-match that silently picks the wrong one produces a
     buy recommendation for a company with no catalyst at all. An unresolved
     catalyst is dropped and counted; a mis-resolved one becomes a bad trade.
+
+    Curated `aliases` (see `aliases`) are compiled into the same map, so a
+    subsidiary or a differently spelled sponsor costs one dict probe like any
+    other name.
+
+    With an `index_path`, the compiled map is persisted there (see
+    `ticker_index`) and reused while `company_tickers.json` and the aliases
+    are unchanged, so a quiet night costs a revalidation and a file map
+    instead of re-normalising every title. Each sponsor's outcome -- hit,
+    miss or ambiguous -- is kept beside it by `save_outcomes`, and the next
+    run on the same index answers those sponsors without normalising them.
     """
 
     name = "sec.company_tickers"
 
-    def __init__(self, client: HttpJsonClient) -> None:
+    def __init__(
+        self,
+        client: HttpJsonClient,
+        index_path: Optional[Path] = None,
+        aliases: Mapping[str, Optional[int]] = SPONSOR_ALIASES,
+    ) -> None:
         self.client = client
-        self._by_name: Dict[str, Tuple[str, int]] = {}
+        self.index_path = Path(index_path) if index_path is not None else None
+        self.aliases = aliases
+        self._version: Optional[str] = None
+        # A freshly compiled dict, or the persisted TickerIndex itself, which
+        # answers from its mapped file and is kept open until the next load.
+        self._by_name: Mapping[str, Tuple[str, int]] = {}
         self._ambiguous: set[str] = set()
         self._loaded = False
+        # Whether the last load came from the persisted index.
+        self.index_hit = False
+        # Sponsor -> answer for this load. Sponsors recur across trials, so
+        # most lookups in a run repeat one already made.
+        self._resolved: Dict[str, Optional[Tuple[str, str]]] = {}
+        self.memo_hits = 0
+        self.memo_misses = 0
+
+    def cache_stats(self) -> CacheStats:
+        return cache_stats_for(self.client, TICKER_URL)
 
     def load(self) -> int:
-        payload = self.client.get_json(TICKER_URL)
-        if not isinstance(payload, dict):
-            raise SourceError(f"Unexpected shape from {TICKER_URL}")
-
-        for entry in payload.values():
-            if not isinstance(entry, dict):
-                continue
-            ticker = entry.get("ticker")
-            cik = entry.get("cik_str")
-            title = entry.get("title")
-            if not (ticker and cik and title):
-                continue
-            key = normalise_company_name(str(title))
-            if not key:
-                continue
-            if key in self._by_name and self._by_name[key] != (str(ticker), int(cik)):
-                # Two distinct companies normalise to the same key. Refuse
-                # both rather than guessing.
-                self._ambiguous.add(key)
-                continue
-            self._by_name[key] = (str(ticker), int(cik))
-
-        for key in self._ambiguous:
-            self._by_name.pop(key, None)
+        if self.index_path is None:
+            return self._index(self.client.get_json(TICKER_URL))
+        get_text = getattr(self.client, "get_text", None)
+        if get_text is None:
+            return self._from_payload(self.client.get_json(TICKER_URL))
+        return self._from_text(get_text(TICKER_URL))
+
+    async def aload(self) -> int:
+        """`load` over an AsyncHttpJsonClient."""
+        if self.index_path is None:
+            return self._index(await self.client.get_json(TICKER_URL))
+        return self._from_text(await self.client.get_text(TICKER_URL))
+
+    def _from_text(self, text: str) -> int:
+        version = index_version(text, self.aliases)
+        if self._from_persisted(version):
+            return len(self._by_name)
+        try:
+            payload = json.loads(text)
+        except ValueError as exc:
+            # The body was never parsed on the way in, so the response cache
+            # may hold it; drop it so the next run downloads afresh.
+            cache = getattr(self.client, "cache", None)
+            if cache is not None:
+                cache.invalidate(TICKER_URL)
+            raise SourceError(f"Unparseable JSON from {TICKER_URL}: {exc}") from exc
+        return self._index(payload, version)
+
+    def _from_payload(self, payload: Any) -> int:
+        # Clients without get_text hand over parsed JSON; key it by its
+        # canonical text instead.
+        version = index_version(json.dumps(payload, sort_keys=True), self.aliases)
+        if self._from_persisted(version):
+            return len(self._by_name)
+        return self._index(payload, version)
+
+    def _from_persisted(self, version: str) -> bool:
+        index = open_ticker_index(self.index_path, version)
+        if index is None:
+            return False
+        self._release_index()
+        self._by_name = index
+        self._ambiguous = set(index.ambiguous)
+        self._mark_loaded(version, index_hit=True)
+        logger.info(
+            "%s: %d names from %s, %d dropped as ambiguous",
+            self.name,
+            len(self._by_name),
+            self.index_path,
+            len(self._ambiguous),
+        )
+        return True
 
+    def _mark_loaded(self, version: Optional[str], index_hit: bool) -> None:
+        # New names can change any answer, so the memo starts over -- from
+        # the saved outcomes when they were made against this same index.
         self._loaded = True
+        self._version = version
+        self.index_hit = index_hit
+        self._resolved = self._saved_outcomes(version)
+        self.memo_hits = self.memo_misses = 0
+
+    def _outcomes_path(self) -> Optional[Path]:
+        if self.index_path is None:
+            return None
+        return self.index_path.with_name(self.index_path.name + ".outcomes.json")
+
+    def _saved_outcomes(self, version: Optional[str]) -> Dict[str, Optional[Tuple[str, str]]]:
+        path = self._outcomes_path()
+        if path is None or version is None:
+            return {}
+        try:
+            saved = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable resolver outcomes %s: %s", path, exc)
+            return {}
+        if not isinstance(saved, dict) or saved.get("version") != version:
+            return {}
+        return {
+            sponsor: tuple(outcome) if isinstance(outcome, list) else None
+            for sponsor, outcome in (saved.get("outcomes") or {}).items()
+        }
+
+    def outcome(self, sponsor: str) -> str:
+        """"hit", "miss" or "ambiguous" for `sponsor`."""
+        if self.resolve(sponsor) is not None:
+            return "hit"
+        return "ambiguous" if normalise_company_name(sponsor) in self._ambiguous else "miss"
+
+    def save_outcomes(self) -> int:
+        """Persist this load's sponsor outcomes beside the index.
+
+        Returns how many were written; none without an index. Outcomes are
+        only reused by a load of the same index version.
+        """
+        path = self._outcomes_path()
+        if path is None or self._version is None:
+            return 0
+        outcomes = {
+            sponsor: list(hit) if hit is not None else self.outcome(sponsor)
+            for sponsor, hit in sorted(self._resolved.items())
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(
+            json.dumps({"version": self._version, "outcomes": outcomes}, sort_keys=True),
+            encoding="utf-8",
+        )
+        os.replace(tmp, path)
+        return len(outcomes)
+
+    def _release_index(self) -> None:
+        if isinstance(self._by_name, TickerIndex):
+            self._by_name.close()
+        self._by_name = {}
+
+    def _index(self, payload: Any, version: Optional[str] = None) -> int:
+        self._release_index()
+        self._by_name, self._ambiguous = compile_tickers(payload, self.aliases)
+        self._mark_loaded(version, index_hit=False)
         logger.info(
             "%s: %d names indexed, %d dropped as ambiguous",
             self.name,
             len(self._by_name),
             len(self._ambiguous),
         )
+        if self.index_path is not None and version is not None:
+            try:
+                write_ticker_index(self.index_path, self._by_name, self._ambiguous, version)
+            except (OSError, ValueError) as exc:
+                # The names are loaded; only tomorrow's shortcut is lost.
+                logger.warning("Ticker index not written to %s: %s", self.index_path, exc)
         return len(self._by_name)
 
+    def mapping(self) -> Dict[str, Tuple[str, int]]:
+        """Normalised name -> (ticker, CIK) as loaded, ambiguous names excluded."""
+        return dict(self._by_name)
+
     def resolve(self, sponsor: str) -> Optional[Tuple[str, str]]:
         """Return (ticker, zero-padded CIK) or None."""
         if not self._loaded:
             raise SourceError("TickerResolver.load() must be called before resolve()")
+        try:
+            hit = self._resolved[sponsor]
+        except KeyError:
+            pass
+        else:
+            self.memo_hits += 1
+            return hit
+        self.memo_misses += 1
+        hit = self._resolved[sponsor] = self._lookup(sponsor)
+        return hit
+
+    def _lookup(self, sponsor: str) -> Optional[Tuple[str, str]]:
         key = normalise_company_name(sponsor)
         if not key:
             return None
@@ -139,45 +370,114 @@ class CompanyFactsSource:
     Returns a CashRunway with months=None when it cannot be computed. The
     caller must treat unknown as a veto, not as a pass -- a company whose
     filings cannot be parsed is not thereby safe.
+
+    With a `bulk_index` (see `bulkfacts`), facts come from the local index
+    instead and no request is made. A CIK missing from the index is unknown
+    runway, not a cue to fall back to the network: a bulk run is offline by
+    construction, and an index that silently tops itself up over HTTP would
+    hide how stale it is.
+
+    With `as_of`, only facts filed by that date count, so a replay of a past
+    date sees the runway that was public then (see `runway_from_facts`).
     """
 
     name = "sec.companyfacts"
 
-    def __init__(self, client: HttpJsonClient) -> None:
+    def __init__(
+        self,
+        client: HttpJsonClient,
+        bulk_index: Optional["FactsIndex"] = None,
+        as_of: Optional[date] = None,
+    ) -> None:
         self.client = client
+        self.bulk_index = bulk_index
+        self.as_of = as_of
 
-    def fetch(self, cik: str) -> CashRunway:
-        cik_int = int(cik)
-        url = FACTS_URL.format(cik=cik_int)
-        prov = Provenance(source=self.name, url=url)
+    def cache_stats(self) -> CacheStats:
+        return cache_stats_for(self.client, FACTS_URL)
 
+    def fetch(self, cik: str) -> CashRunway:
+        if self.bulk_index is not None:
+            return self._from_index(cik)
+        url = FACTS_URL.format(cik=int(cik))
+        # A large filer's document is tens of MB, nearly all of it tags runway
+        # never reads. Clients that can decode selectively are asked to.
+        members = getattr(self.client, "get_json_members", None)
         try:
-            payload = self.client.get_json(url)
+            if members is not None:
+                payload = members(url, "us-gaap", _RUNWAY_TAGS)
+            else:
+                payload = self.client.get_json(url)
         except SourceError as exc:
-            return CashRunway(
-                cik=cik, months=None, cash_usd=None, quarterly_burn_usd=None,
-                provenance=prov, note=f"facts unavailable: {exc}",
+            return self._unavailable(cik, url, exc)
+        return self.runway_from_facts(cik, payload, url, filed_by=self.as_of)
+
+    async def afetch(self, cik: str) -> CashRunway:
+        """`fetch` over an AsyncHttpJsonClient."""
+        if self.bulk_index is not None:
+            return self._from_index(cik)
+        url = FACTS_URL.format(cik=int(cik))
+        members = getattr(self.client, "get_json_members", None)
+        try:
+            if members is not None:
+                payload = await members(url, "us-gaap", _RUNWAY_TAGS)
+            else:
+                payload = await self.client.get_json(url)
+        except SourceError as exc:
+            return self._unavailable(cik, url, exc)
+        return self.runway_from_facts(cik, payload, url, filed_by=self.as_of)
+
+    def _from_index(self, cik: str) -> CashRunway:
+        # Provenance names the index, not the API: that is where the numbers
+        # came from, and the index is only as current as the archive behind it.
+        # Its file name only: runways reach the committed ledger, and the
+        # runner's filesystem layout must not.
+        url = f"{self.bulk_index.path.name}#CIK{int(cik):010d}"
+        payload = self.bulk_index.get(int(cik))
+        if payload is None:
+            return self._unavailable(
+                cik, url, SourceError(f"CIK {cik} not in {self.bulk_index.path.name}")
             )
+        return self.runway_from_facts(cik, payload, url, filed_by=self.as_of)
+
+    def _unavailable(self, cik: str, url: str, exc: SourceError) -> CashRunway:
+        return CashRunway(
+            cik=cik, months=None, cash_usd=None, quarterly_burn_usd=None,
+            provenance=Provenance(source=self.name, url=url), note=f"facts unavailable: {exc}",
+        )
 
-        gaap = (payload.get("facts") or {}).get("us-gaap") or {}
+    def runway_from_facts(
+        self, cik: str, payload: Any, url: Optional[str] = None, filed_by: Optional[date] = None
+    ) -> CashRunway:
+        """Runway from a companyfacts document already in hand.
+
+        With `filed_by`, only facts filed on or before that date count, so the
+        result is what could have been known then. Facts without a `filed`
+        date are excluded in that mode, since they cannot be placed in time.
+        """
+        prov = Provenance(source=self.name, url=url)
+        gaap = ((payload or {}).get("facts") or {}).get("us-gaap") or {}
         if not gaap:
             return CashRunway(
                 cik=cik, months=None, cash_usd=None, quarterly_burn_usd=None,
                 provenance=prov, note="no us-gaap facts present",
             )
 
-        cash = self._latest_instant(gaap, _CASH_TAGS)
-        burn = self._quarterly_burn(gaap)
+        cash, cash_tag, cash_as_of = self._latest_instant(gaap, _CASH_TAGS, filed_by)
+        burn, burn_tag, burn_end = self._quarterly_burn(gaap, filed_by)
+        basis = dict(
+            cash_tag=cash_tag, cash_as_of=cash_as_of, burn_tag=burn_tag, burn_period_end=burn_end
+        )
 
         if cash is None:
             return CashRunway(
                 cik=cik, months=None, cash_usd=None, quarterly_burn_usd=burn,
-                provenance=prov, note="no cash tag found",
+                provenance=prov, note="no cash tag found", **basis,
             )
         if burn is None:
             return CashRunway(
                 cik=cik, months=None, cash_usd=cash, quarterly_burn_usd=None,
-                provenance=prov, note="no operating cash flow tag found",
+                provenance=prov, note="no operating cash flow tag found", **basis,
             )
         if burn <= 0:
             # Operating cash flow positive: the company funds itself and the
@@ -185,56 +485,60 @@ class CompanyFactsSource:
             # about the future, just "not burning right now".
             return CashRunway(
                 cik=cik, months=float("inf"), cash_usd=cash, quarterly_burn_usd=burn,
-                provenance=prov, note="operating cash flow non-negative",
+                provenance=prov, note="operating cash flow non-negative", **basis,
             )
 
         months = (cash / burn) * 3.0
         return CashRunway(
             cik=cik, months=months, cash_usd=cash, quarterly_burn_usd=burn, provenance=prov,
+            **basis,
         )
 
     @staticmethod
-    def _usd_facts(gaap: Dict[str, Any], tag: str) -> List[Dict[str, Any]]:
+    def _usd_facts(
+        gaap: Dict[str, Any], tag: str, filed_by: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
         units = ((gaap.get(tag) or {}).get("units") or {})
         facts = units.get("USD") or []
-        return [f for f in facts if isinstance(f, dict) and isinstance(f.get("val"), (int, float))]
-
-    def _latest_instant(self, gaap: Dict[str, Any], tags: List[str]) -> Optional[float]:
-        best_date, best_val = None, None
+        facts = [f for f in facts if isinstance(f, dict) and isinstance(f.get("val"), (int, float))]
+        if filed_by is not None:
+            facts = [f for f in facts if (_parse_date(f.get("filed")) or date.max) <= filed_by]
+        return facts
+
+    def _latest_instant(
+        self, gaap: Dict[str, Any], tags: List[str], filed_by: Optional[date] = None
+    ) -> Tuple[Optional[float], Optional[str], Optional[date]]:
+        """Latest value of the first tag that has one, with that tag and date."""
         for tag in tags:
-            for fact in self._usd_facts(gaap, tag):
-                end = fact.get("end")
-                if not isinstance(end, str):
-                    continue
-                try:
-                    parsed = datetime.strptime(end, "%Y-%m-%d").date()
-                except ValueError:
+            best_date, best_val = None, None
+            for fact in self._usd_facts(gaap, tag, filed_by):
+                parsed = _parse_date(fact.get("end"))
+                if parsed is None:
                     continue
                 if best_date is None or parsed > best_date:
                     best_date, best_val = parsed, float(fact["val"])
             if best_val is not None:
-                break  # prefer the earlier (more specific) tag
-        return best_val
+                return best_val, tag, best_date  # prefer the earlier (more specific) tag
+        return None, None, None
 
-    def _quarterly_burn(self, gaap: Dict[str, Any]) -> Optional[float]:
+    def _quarterly_burn(
+        self, gaap: Dict[str, Any], filed_by: Optional[date] = None
+    ) -> Tuple[Optional[float], Optional[str], Optional[date]]:
         """Most recent quarterly operating cash outflow, as a positive number.
 
         Operating cash flow is a duration fact, so a 10-K value covers a year
         and a 10-Q value covers a quarter. Mixing them silently would overstate
         runway by 4x -- exactly the direction that lets a dilution risk through
         the veto. Annual figures are therefore divided by four.
-        """
-        best_end, best_val = None, None
 
+        Returns (burn, tag, period end), all None when no usable fact exists.
+        """
         for tag in _BURN_TAGS:
-            for fact in self._usd_facts(gaap, tag):
-                start, end = fact.get("start"), fact.get("end")
-                if not (isinstance(start, str) and isinstance(end, str)):
-                    continue
-                try:
-                    s = datetime.strptime(start, "%Y-%m-%d").date()
-                    e = datetime.strptime(end, "%Y-%m-%d").date()
-                except ValueError:
+            best_end, best_val = None, None
+            for fact in self._usd_facts(gaap, tag, filed_by):
+                s = _parse_date(fact.get("start"))
+                e = _parse_date(fact.get("end"))
+                if s is None or e is None:
                     continue
 
                 span_days = (e - s).days
@@ -253,11 +557,26 @@ class CompanyFactsSource:
                     best_end, best_val = e, quarterly
 
             if best_val is not None:
-                break
-
-        if best_val is None:
-            return None
-        # XBRL reports an operating outflow as negative. Flip the sign so that
-        # a burning company yields a positive burn, and a cash-generative one
-        # yields a non-positive burn (handled as "not diluting" by the caller).
-        return -best_val
+                # XBRL reports an operating outflow as negative. Flip the sign
+                # so that a burning company yields a positive burn, and a
+                # cash-generative one yields a non-positive burn (handled as
+                # "not diluting" by the caller).
+                return -best_val, tag, best_end
+        return None, None, None
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """Parse an XBRL `YYYY-MM-DD` date; None for anything else."""
+    if not isinstance(value, str) or len(value) != 10:
+        return None
+    return _iso_date(value)
+
+
+@lru_cache(maxsize=8192)
+def _iso_date(value: str) -> Optional[date]:
+    # Cached because a filer's facts repeat the same handful of period dates
+    # across every tag, and a universe-wide batch parses millions of them.
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return None
@@ -0,0 +1,156 @@
+"""Selective decoding of large XBRL `companyfacts` documents.
+
+A large filer's companyfacts document is tens of megabytes of JSON once
+decompressed, almost all of it tags runway never reads. Decoding it the
+ordinary way holds the compressed body, the decompressed bytes, a `str` copy
+of them and the full object tree -- millions of small dicts -- all at once,
+to look at two or three tags.
+
+`extract_members` instead inflates the body a chunk at a time with
+`zlib.decompressobj` and scans each chunk for tag entries. Only the entries
+asked for are ever decoded; everything else is discarded as soon as the
+scanner has moved past it. Peak memory is the compressed body plus one chunk
+plus the wanted subtrees, and the scan runs inside the `re` engine, not a
+Python loop.
+
+The scan relies on how SEC lays the document out:
+
+    {"cik": ..., "entityName": ...,
+     "facts": {"<taxonomy>": {"<Tag>": {"label": ..., "description": ...,
+                                        "units": {...}}, ...}, ...}}
+
+A tag entry is therefore a key whose value is an object that opens with
+`label`, `description` or `units`, and a taxonomy is a key whose value opens
+with such an entry. Neither pattern can occur inside a JSON string, where
+every quote is escaped. If the layout ever changes so that no taxonomy is
+recognised at all, `extract_members` returns None and the caller decodes the
+document in full, trading the savings for correctness.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import zlib
+from typing import Any, Collection, Dict, Iterator, Optional
+
+# Decompressed bytes handed to the scanner per step.
+_CHUNK = 256 * 1024
+# Bytes kept behind the scan position while skipping an unwanted entry, so a
+# key split across two chunks is still recognised. Far longer than any tag.
+_TAIL = 4096
+# How far back from an entry's opening brace its key may start.
+_KEY_WINDOW = 512
+
+# The opening of a tag entry's value. `{` is rare enough in this data that the
+# regex engine skips to each candidate at close to memchr speed; anchoring on
+# the key instead would make it walk every string in the document.
+_OPENING = re.compile(rb'\{\s*"(?:label|description|units)"\s*:')
+# What precedes an opening: the tag's key, itself preceded by the taxonomy's
+# key when the tag is the taxonomy's first entry.
+_KEY_BEFORE = re.compile(
+    rb'"(?P<key>[^"\\]+)"\s*:\s*(?:\{\s*"(?P<first>[^"\\]+)"\s*:\s*)?\Z'
+)
+_DECODER = json.JSONDecoder()
+
+
+def extract_members(
+    raw: bytes, content_encoding: str, section: str, wanted: Collection[str]
+) -> Optional[Dict[str, Any]]:
+    """Decode only `facts[section][tag]` for each tag in `wanted`.
+
+    Returns a document shaped like the original, holding just those entries
+    (`{"facts": {section: {...}}}`), or None when the layout is not
+    recognised. Raises `zlib.error` for a corrupt or truncated body and
+    `ValueError` for malformed JSON inside a wanted entry -- the same families
+    a full decode raises, so retry handling is unchanged.
+    """
+    wanted = frozenset(wanted)
+    found: Dict[str, Any] = {}
+    seen_taxonomy = False
+
+    buf = bytearray()
+    scan_from = 0
+    # The entry currently being read: its taxonomy, tag, and where its value
+    # starts in buf.
+    taxonomy: Optional[str] = None
+    open_tag: Optional[str] = None
+    open_at = 0
+
+    def close_entry(end: int) -> None:
+        if taxonomy == section and open_tag in wanted:
+            text = bytes(buf[open_at:end]).decode("utf-8")
+            found[open_tag], _ = _DECODER.raw_decode(text)
+
+    for chunk in _inflate(raw, content_encoding):
+        buf += chunk
+        for m in _OPENING.finditer(buf, scan_from):
+            scan_from = m.end()
+            start = m.start()
+            window = max(0, start - _KEY_WINDOW)
+            keys = _KEY_BEFORE.search(bytes(buf[window:start]))
+            if keys is None:
+                continue  # an object that merely looks like an entry, not one
+            if open_tag is not None:
+                # The previous entry ends where this one's key begins.
+                close_entry(window + keys.start())
+            if keys.group("first") is not None:
+                seen_taxonomy = True
+                taxonomy = keys.group("key").decode("utf-8")
+                open_tag = keys.group("first").decode("utf-8")
+            else:
+                open_tag = keys.group("key").decode("utf-8")
+            open_at = start
+
+        # Drop what the scanner is finished with. A wanted entry is kept whole
+        # until the next entry closes it. Otherwise every opening before the
+        # last _TAIL bytes would already have been found, so only that tail
+        # can still hold one, or the key in front of one.
+        if taxonomy == section and open_tag in wanted:
+            cut = open_at
+        else:
+            cut = max(len(buf) - _TAIL, 0)
+        if cut:
+            del buf[:cut]
+            scan_from = max(0, scan_from - cut)
+            open_at -= cut
+
+    if open_tag is not None:
+        close_entry(len(buf))
+    if not seen_taxonomy:
+        return None
+    return {"facts": {section: found}}
+
+
+def _inflate(raw: bytes, content_encoding: str) -> Iterator[bytes]:
+    """Yield the decoded body in chunks of at most `_CHUNK` bytes.
+
+    Mirrors `base._decode_body`: gzip by header or magic number, deflate with
+    or without the zlib wrapper, otherwise identity.
+    """
+    enc = (content_encoding or "").strip().lower()
+    if enc == "gzip" or raw[:2] == b"\x1f\x8b":
+        wbits = 16 + zlib.MAX_WBITS
+    elif enc == "deflate":
+        zlib_wrapped = len(raw) >= 2 and raw[0] & 0x0F == 8 and (raw[0] << 8 | raw[1]) % 31 == 0
+        wbits = zlib.MAX_WBITS if zlib_wrapped else -zlib.MAX_WBITS
+    else:
+        view = memoryview(raw)
+        for start in range(0, len(view), _CHUNK):
+            yield bytes(view[start:start + _CHUNK])
+        return
+
+    data = raw
+    while data:
+        inflater = zlib.decompressobj(wbits)
+        while data:
+            out = inflater.decompress(data, _CHUNK)
+            if out:
+                yield out
+            data = inflater.unconsumed_tail
+            if inflater.eof:
+                break
+        if not inflater.eof:
+            raise zlib.error("compressed body ended before its end-of-stream marker")
+        # Concatenated gzip members decode as one body, as gzip.decompress does.
+        data = inflater.unused_data if wbits > zlib.MAX_WBITS else b""
@@ -0,0 +1,484 @@
+"""Point-in-time snapshots of the sources, for replaying past dates.
+
+Every live source answers with today's data. Replaying the engine for a past
+date against them screens that date with knowledge it did not have: trials
+registered since, completion dates moved since, tickers listed since. The
+result looks like a backtest and is not one.
+
+`SnapshotArchive` keeps what the sources said on each night a capture was
+recorded, as intervals: each version of a record -- a raw study, a ticker
+mapping -- is stored once with the date it was first seen and the date it
+was replaced or disappeared. What was known on a date is every version whose
+interval contains it. A study that changes twice a year costs three versions,
+not one copy per night, so years of captures stay small.
+
+Captures come from the nightly run (`run_nightly --snapshot-archive`), which
+records the catalyst store's raw studies and the ticker index after a healthy
+run. Ticker history from before the first nightly capture can be backfilled
+from dated copies of `company_tickers.json`:
+
+    python -m helios_signals.sources.snapshots ARCHIVE company_tickers.json \\
+        --as-of 2024-06-30
+
+`TickerHistory` resolves a sponsor on any date from those intervals.
+
+Facts need no archive: every XBRL fact carries its `filed` date, so
+`CompanyFactsSource(as_of=...)` already answers point-in-time.
+
+The `Snapshot*` sources below stand in for the live ones in `SignalEngine`.
+They fail closed like the live ones: a date before the first capture, or
+further past the latest capture than `max_staleness_days`, raises
+`SourceError` and the replayed run is unhealthy rather than quietly screened
+on data from some other date.
+
+The archive holds what the catalyst store held, which is whatever the live
+query asked for. With `catalyst_prefilter` on, that excludes studies the
+sponsor and intervention screens reject, so a replay that loosens those
+screens cannot see the studies it would now let through.
+"""
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import gzip
+import json
+import logging
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..models import Catalyst
+from .base import SourceError
+from .clinicaltrials import ClinicalTrialsSource, parse_study
+from .sec import compile_tickers, normalise_company_name
+
+logger = logging.getLogger(__name__)
+
+_FORMAT = 1
+STUDIES = "studies"
+TICKERS = "tickers"
+
+# [first seen, replaced or gone (None while current), value]
+Version = List[Any]
+
+
+class SnapshotArchive:
+    """Interval history of source records, in one gzip JSON file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.captures: List[str] = []  # ISO dates, ascending, any kind
+        # The dates each kind was captured on. A ticker-only capture says
+        # nothing about what the registry held that day.
+        self.kind_captures: Dict[str, List[str]] = {STUDIES: [], TICKERS: []}
+        self.histories: Dict[str, Dict[str, List[Version]]] = {STUDIES: {}, TICKERS: {}}
+        self.meta: Dict[str, Any] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "SnapshotArchive":
+        """The archive at `path`, empty if there is none yet."""
+        archive = cls(path)
+        try:
+            with gzip.open(archive.path, "rt", encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return archive
+        except (OSError, ValueError) as exc:
+            raise SourceError(f"Cannot read snapshot archive {archive.path}: {exc}") from exc
+        if data.get("format") != _FORMAT:
+            raise SourceError(f"{archive.path} is not a version {_FORMAT} snapshot archive")
+        archive.captures = list(data["captures"])
+        # Archives from before per-kind captures captured every kind together.
+        kinds = data.get("kind_captures") or {}
+        archive.kind_captures = {kind: list(kinds.get(kind, archive.captures))
+                                 for kind in (STUDIES, TICKERS)}
+        archive.histories = {kind: dict(data["histories"].get(kind) or {})
+                             for kind in (STUDIES, TICKERS)}
+        archive.meta = dict(data.get("meta") or {})
+        return archive
+
+    def save(self) -> None:
+        data = {
+            "format": _FORMAT,
+            "captures": self.captures,
+            "kind_captures": self.kind_captures,
+            "histories": self.histories,
+            "meta": self.meta,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with gzip.GzipFile(tmp, "wb", mtime=0) as fh:
+            fh.write(json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+        os.replace(tmp, self.path)
+
+    # ---------------------------------------------------------------- capture
+
+    def record(self, as_of: date, kind: str, records: Dict[str, Any]) -> int:
+        """Record that the source of `kind` held exactly `records` on `as_of`.
+
+        Returns how many keys changed. Captures of a kind must not go back in
+        time (see `backfill` for that); a second capture on the same date
+        replaces the first.
+        """
+        day = as_of.isoformat()
+        captures = self.kind_captures[kind]
+        if captures and day < captures[-1]:
+            raise ValueError(f"{kind} capture for {day} is older than the latest, {captures[-1]}")
+        changed = _apply(self.histories[kind], day, records)
+        if not captures or captures[-1] != day:
+            captures.append(day)
+        if day not in self.captures:
+            bisect.insort(self.captures, day)
+        return changed
+
+    def backfill(self, as_of: date, kind: str, records: Dict[str, Any]) -> int:
+        """`record` for a date that may precede captures already made.
+
+        For seeding history from older copies of a source -- dated ticker
+        files, say -- after nightly captures have started. The kind's history
+        is rebuilt by replaying every capture in date order with this one
+        inserted, so it costs a pass over the whole history. Returns how many
+        keys changed on `as_of`.
+        """
+        day = as_of.isoformat()
+        captures = self.kind_captures[kind]
+        if not captures or day >= captures[-1]:
+            return self.record(as_of, kind, records)
+        old = Timeline(self.histories[kind])
+        rebuilt: Dict[str, Dict[str, List[Version]]] = {}
+        changed = 0
+        for capture in sorted(set(captures) | {day}):
+            if capture == day:
+                state = records
+            else:
+                current = old.at(date.fromisoformat(capture))
+                state = {key: old.value(key, index) for key, index in current.items()}
+            delta = _apply(rebuilt, capture, state)
+            if capture == day:
+                changed = delta
+        self.histories[kind] = rebuilt
+        self.kind_captures[kind] = sorted(set(captures) | {day})
+        if day not in self.captures:
+            bisect.insort(self.captures, day)
+        return changed
+
+    # ------------------------------------------------------------------ query
+
+    def covering(self, as_of: date, max_staleness_days: int, kind: Optional[str] = None) -> str:
+        """The latest capture (of `kind`, if given) on or before `as_of`, if recent enough.
+
+        Raises SourceError when there is none, or when it is more than
+        `max_staleness_days` old: the archive cannot say what was known then.
+        """
+        day = as_of.isoformat()
+        captures = self.captures if kind is None else self.kind_captures[kind]
+        position = bisect.bisect_right(captures, day)
+        if position == 0:
+            first = captures[0] if captures else "none"
+            raise SourceError(f"No snapshot on or before {day} (first capture: {first})")
+        latest = captures[position - 1]
+        if as_of - date.fromisoformat(latest) > timedelta(days=max_staleness_days):
+            raise SourceError(
+                f"Latest snapshot before {day} is {latest}, more than "
+                f"{max_staleness_days} days old"
+            )
+        return latest
+
+    def timeline(self, kind: str) -> "Timeline":
+        return Timeline(self.histories[kind])
+
+
+class Timeline:
+    """The records of one kind as they stood on successive dates.
+
+    `at` moves a cursor over the archive's open and close events, so a replay
+    that walks dates in order pays for the changes between consecutive dates,
+    not for the whole archive each time. Walking backwards starts over.
+    """
+
+    def __init__(self, histories: Dict[str, List[Version]]) -> None:
+        events: List[Tuple[str, int, str, int]] = []
+        for key, history in histories.items():
+            for index, (start, end, _) in enumerate(history):
+                if end is not None and end <= start:
+                    continue
+                events.append((start, 1, key, index))
+                if end is not None:
+                    events.append((end, 0, key, index))
+        # Closes sort before opens on the same date, so a replaced version is
+        # gone before its successor arrives.
+        events.sort()
+        self._histories = histories
+        self._events = events
+        self._cursor = 0
+        self._day = ""
+        self._current: Dict[str, int] = {}  # key -> version index
+
+    def at(self, as_of: date) -> Dict[str, int]:
+        """Key -> version index for every record current on `as_of`.
+
+        The mapping is the cursor's own and moves with the next call; copy it
+        to keep it. `value` gives the record a version index stands for.
+        """
+        day = as_of.isoformat()
+        if day < self._day:
+            self._cursor, self._current = 0, {}
+        self._day = day
+        while self._cursor < len(self._events) and self._events[self._cursor][0] <= day:
+            _, is_open, key, index = self._events[self._cursor]
+            if is_open:
+                self._current[key] = index
+            elif self._current.get(key) == index:
+                del self._current[key]
+            self._cursor += 1
+        return self._current
+
+    def value(self, key: str, index: int) -> Any:
+        return self._histories[key][index][2]
+
+
+def _apply(histories: Dict[str, List[Version]], day: str, records: Dict[str, Any]) -> int:
+    changed = 0
+    for key, value in records.items():
+        changed += _put(histories.setdefault(key, []), day, value)
+    for key, history in histories.items():
+        if key not in records:
+            changed += _drop(history, day)
+    return changed
+
+
+def _put(history: List[Version], day: str, value: Any) -> int:
+    last = history[-1] if history else None
+    if last is not None and last[1] is None:
+        if last[2] == value:
+            return 0
+        if last[0] == day:
+            history.pop()  # replaced the same day: the earlier capture never stood
+        else:
+            last[1] = day
+    previous = history[-1] if history else None
+    if previous is not None and previous[1] == day and previous[2] == value:
+        previous[1] = None  # a same-day recapture restored it
+        return 1
+    history.append([day, None, value])
+    return 1
+
+
+def _drop(history: List[Version], day: str) -> int:
+    last = history[-1] if history else None
+    if last is None or last[1] is not None:
+        return 0
+    if last[0] == day:
+        history.pop()
+    else:
+        last[1] = day
+    return 1
+
+
+def study_records(states: Dict[str, Any]) -> Dict[str, Any]:
+    """Archive records from catalyst store states: "PHASE|NCT" -> raw study."""
+    return {
+        f"{phase}|{nct}": study
+        for phase, state in states.items()
+        for nct, study in state.studies.items()
+    }
+
+
+def ticker_records(mapping: Dict[str, Tuple[str, int]]) -> Dict[str, Any]:
+    """Archive records from a ticker index: normalised name -> [ticker, CIK]."""
+    return {name: [ticker, cik] for name, (ticker, cik) in mapping.items()}
+
+
+def record_sources(
+    path: Path, as_of: date, catalysts: ClinicalTrialsSource, resolver: Any
+) -> Tuple[int, int]:
+    """Capture the catalyst store and the loaded ticker index into `path`.
+
+    Returns the number of studies and of ticker mappings that changed. Call
+    it after a healthy run only: a failed sync leaves the store as it was,
+    and recording that would claim the registry stood still.
+    """
+    if catalysts.store is None:
+        raise ValueError("snapshots are captured from the catalyst store; none is configured")
+    archive = SnapshotArchive.load(path)
+    archive.meta["query"] = catalysts.query.advanced()
+    states = catalysts.store.load(catalysts._signature())
+    studies = archive.record(as_of, STUDIES, study_records(states))
+    tickers = archive.record(as_of, TICKERS, ticker_records(resolver.mapping()))
+    archive.save()
+    logger.info("Snapshot %s for %s: %d studies and %d tickers changed",
+                path, as_of, studies, tickers)
+    return studies, tickers
+
+
+def record_tickers(path: Path, as_of: date, mapping: Dict[str, Tuple[str, int]]) -> int:
+    """Capture a ticker index alone, backfilling if `as_of` is in the past.
+
+    Returns the number of mappings that changed on `as_of`. For seeding the
+    archive from dated copies of `company_tickers.json` (see `main`), so
+    tickers that have since been delisted or renamed resolve on the dates
+    they were listed.
+    """
+    archive = SnapshotArchive.load(path)
+    changed = archive.backfill(as_of, TICKERS, ticker_records(mapping))
+    archive.save()
+    logger.info("Ticker snapshot %s for %s: %d changed", path, as_of, changed)
+    return changed
+
+
+# ------------------------------------------------------------------ sources
+
+
+class SnapshotCatalystSource:
+    """`ClinicalTrialsSource.fetch` answered from an archive, as of a date.
+
+    Studies are parsed once per version and the `Catalyst`s reused on every
+    date the version is current. The engine sets `ticker` and `cik` on the
+    candidates it resolves; a reused catalyst that no longer resolves is
+    vetoed before those fields are read, so the stale values never surface.
+    """
+
+    name = "snapshot.clinicaltrials"
+
+    def __init__(
+        self, archive: SnapshotArchive, as_of: date, max_staleness_days: int = 7,
+        timeline: Optional[Timeline] = None, parsed: Optional[Dict[Any, Any]] = None,
+    ) -> None:
+        self.archive = archive
+        self.as_of = as_of
+        self.max_staleness_days = max_staleness_days
+        self._timeline = timeline if timeline is not None else archive.timeline(STUDIES)
+        self._parsed = parsed if parsed is not None else {}
+
+    def fetch(self, phases: Iterable[str]) -> List[Catalyst]:
+        return [catalyst for _, catalyst in self.phased(phases)]
+
+    def phased(self, phases: Optional[Iterable[str]] = None) -> List[Tuple[str, Catalyst]]:
+        """(phase, catalyst) for the studies of `phases` -- every phase if None."""
+        captured = self.archive.covering(self.as_of, self.max_staleness_days, STUDIES)
+        wanted = set(phases) if phases is not None else None
+        out = []
+        for key, version in sorted(self._timeline.at(self.as_of).items()):
+            phase, _, _ = key.partition("|")
+            if wanted is not None and phase not in wanted:
+                continue
+            cache_key = (key, version)
+            if cache_key not in self._parsed:
+                study = self._timeline.value(key, version)
+                self._parsed[cache_key] = parse_study(
+                    study, phase, source=self.name, retrieved_at=captured
+                )
+            if self._parsed[cache_key] is not None:
+                out.append((phase, self._parsed[cache_key]))
+        return out
+
+
+class SnapshotTickerResolver:
+    """`TickerResolver` answered from an archive, as of a date."""
+
+    name = "snapshot.company_tickers"
+
+    def __init__(
+        self, archive: SnapshotArchive, as_of: date, max_staleness_days: int = 7,
+        timeline: Optional[Timeline] = None,
+    ) -> None:
+        self.archive = archive
+        self.as_of = as_of
+        self.max_staleness_days = max_staleness_days
+        self._timeline = timeline if timeline is not None else archive.timeline(TICKERS)
+        self._by_name: Optional[Dict[str, int]] = None
+
+    def load(self) -> int:
+        self.archive.covering(self.as_of, self.max_staleness_days, TICKERS)
+        self._by_name = dict(self._timeline.at(self.as_of))
+        return len(self._by_name)
+
+    def resolve(self, sponsor: str) -> Optional[Tuple[str, str]]:
+        if self._by_name is None:
+            raise SourceError("SnapshotTickerResolver.load() must be called before resolve()")
+        key = normalise_company_name(sponsor)
+        version = self._by_name.get(key)
+        if version is None:
+            return None
+        ticker, cik = self._timeline.value(key, version)
+        return ticker, f"{cik:010d}"
+
+
+class TickerHistory:
+    """Point-in-time sponsor resolution over an archive's ticker captures.
+
+    Where `SnapshotTickerResolver` answers for one date at a time, this
+    answers `resolve(sponsor, as_of)` for any date in any order: each name's
+    versions are non-overlapping validity intervals sorted by start, so a
+    lookup is a dict probe and a bisect. A company delisted in 2024 still
+    resolves on dates it was listed, which a replay against today's ticker
+    file cannot do.
+
+    Like the other snapshot sources it fails closed: a date with no ticker
+    capture within `max_staleness_days` raises SourceError.
+    """
+
+    name = "snapshot.ticker_history"
+
+    def __init__(self, archive: SnapshotArchive, max_staleness_days: int = 7) -> None:
+        self.archive = archive
+        self.max_staleness_days = max_staleness_days
+        self._starts: Dict[str, List[str]] = {}
+        self._versions: Dict[str, List[Version]] = {}
+        for key, history in archive.histories[TICKERS].items():
+            # Versions replaced on the day they appeared never stood.
+            versions = [v for v in history if v[1] is None or v[1] > v[0]]
+            if versions:
+                self._starts[key] = [v[0] for v in versions]
+                self._versions[key] = versions
+
+    def resolve(self, sponsor: str, as_of: date) -> Optional[Tuple[str, str]]:
+        """(ticker, zero-padded CIK) that `sponsor` matched on `as_of`, or None."""
+        self.archive.covering(as_of, self.max_staleness_days, TICKERS)
+        key = normalise_company_name(sponsor)
+        starts = self._starts.get(key)
+        if starts is None:
+            return None
+        day = as_of.isoformat()
+        position = bisect.bisect_right(starts, day) - 1
+        if position < 0:
+            return None
+        _, end, (ticker, cik) = self._versions[key][position]
+        if end is not None and end <= day:
+            return None
+        return ticker, f"{cik:010d}"
+
+    def intervals(self, sponsor: str) -> List[Tuple[date, Optional[date], str, str]]:
+        """Every (valid from, valid until, ticker, CIK) `sponsor` has matched.
+
+        `valid until` is exclusive, and None while the mapping is current.
+        """
+        return [
+            (date.fromisoformat(start), date.fromisoformat(end) if end else None,
+             ticker, f"{cik:010d}")
+            for start, end, (ticker, cik) in self._versions.get(
+                normalise_company_name(sponsor), []
+            )
+        ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Record a dated copy of company_tickers.json into a snapshot archive"
+    )
+    parser.add_argument("archive", type=Path, help="Snapshot archive to update")
+    parser.add_argument("tickers", type=Path, help="A copy of company_tickers.json")
+    parser.add_argument("--as-of", required=True, metavar="YYYY-MM-DD",
+                        help="The date the copy was published")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    mapping, _ = compile_tickers(json.loads(args.tickers.read_text(encoding="utf-8")))
+    record_tickers(args.archive, date.fromisoformat(args.as_of), mapping)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
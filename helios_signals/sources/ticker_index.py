@@ -0,0 +1,188 @@
+"""A compiled, persisted copy of the EDGAR ticker index.
+
+`TickerResolver` turns SEC's `company_tickers.json` into a map from normalised
+company name to (ticker, CIK). Normalising some ten thousand titles is the
+bulk of the resolver's start-up, and the file it normalises rarely changes
+from one night to the next. The compiled map is therefore written to disk as
+a columnar table (`helios_signals.columnar`) and reused for as long as the
+source file is unchanged.
+
+Layout: one row per name, sorted by name. CIKs are a `u32` column. Names and
+tickers are each one concatenated string in the header, in row order, with a
+`u32` column of where each row's name and ticker ends. A lookup bisects the
+rows, slicing out only the names it compares, so opening an index builds no
+per-name objects at all: the resolver answers straight from the mapped file.
+Names that two distinct companies normalise to are refused by the resolver and
+recorded separately.
+
+An index is keyed by `payload_version` of the ticker file it was compiled
+from, together with the version of the sponsor alias table compiled into it
+(see `aliases`). A digest of the decoded body rather than the server's ETag:
+it needs no response cache to be known, and it cannot be fooled by a server
+that reuses a validator across content. A version mismatch is a miss and the caller
+recompiles, so an index can go stale but never wrong.
+"""
+
+from __future__ import annotations
+
+import argparse
+import array
+import bisect
+import hashlib
+import itertools
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from ..columnar import ColumnarTable, write_table
+from ..models import utcnow
+
+logger = logging.getLogger(__name__)
+
+_KIND = "helios.tickers"
+# Bumped whenever name normalisation or the layout changes: an index compiled
+# under other rules would match names differently from a fresh load.
+_FORMAT = 2
+
+
+def payload_version(text: str) -> str:
+    """The version key for a ticker file with this decoded body."""
+    return "sha256:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def write_ticker_index(
+    path: Path,
+    mapping: Mapping[str, Tuple[str, int]],
+    ambiguous: Iterable[str],
+    version: str,
+) -> int:
+    """Persist a compiled name -> (ticker, CIK) map. Returns the row count."""
+    names = sorted(mapping)
+    tickers = [mapping[name][0] for name in names]
+    write_table(
+        path,
+        {
+            "cik": array.array("I", (mapping[name][1] for name in names)),
+            "name_end": array.array("I", itertools.accumulate(map(len, names))),
+            "ticker_end": array.array("I", itertools.accumulate(map(len, tickers))),
+        },
+        meta={
+            "kind": _KIND,
+            "format": _FORMAT,
+            "version": version,
+            "built_at": utcnow().isoformat(),
+            "names": "".join(names),
+            "tickers": "".join(tickers),
+            "ambiguous": sorted(ambiguous),
+        },
+    )
+    return len(names)
+
+
+class TickerIndex(Mapping[str, Tuple[str, int]]):
+    """Lookup side of `write_ticker_index`: normalised name -> (ticker, CIK).
+
+    Read-only; usable on its own by anything that needs the name -> ticker
+    map without a network round trip, such as a replay over a fixed index.
+    Every read goes to the mapped file, so the index must stay open while it
+    is in use.
+    """
+
+    name = "ticker_index"
+
+    def __init__(self, path: Path) -> None:
+        self._table = ColumnarTable(path)
+        meta = self._table.meta
+        if meta.get("kind") != _KIND or meta.get("format") != _FORMAT:
+            self._table.close()
+            raise ValueError(f"{path} is not a version {_FORMAT} ticker index")
+        self.path = self._table.path
+        self.version: str = meta["version"]
+        self.built_at: str = meta["built_at"]
+        self.ambiguous: List[str] = list(meta["ambiguous"])
+        self._names: str = meta["names"]
+        self._tickers: str = meta["tickers"]
+        self._ciks = self._table.column("cik")
+        self._name_ends = self._table.column("name_end")
+        self._ticker_ends = self._table.column("ticker_end")
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, key: str) -> Tuple[str, int]:
+        hit = self.lookup(key)
+        if hit is None:
+            raise KeyError(key)
+        return hit
+
+    def __iter__(self) -> Iterator[str]:
+        return map(self._name, range(len(self)))
+
+    def __enter__(self) -> "TickerIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._ciks = self._name_ends = self._ticker_ends = None
+        self._table.close()
+
+    def lookup(self, key: str) -> Optional[Tuple[str, int]]:
+        """(ticker, CIK) for an already-normalised name, or None."""
+        row = bisect.bisect_left(range(len(self)), key, key=self._name)
+        if row == len(self) or self._name(row) != key:
+            return None
+        start = self._ticker_ends[row - 1] if row else 0
+        return self._tickers[start:self._ticker_ends[row]], self._ciks[row]
+
+    def mapping(self) -> Dict[str, Tuple[str, int]]:
+        """Every name -> (ticker, CIK), copied out of the mapping."""
+        return dict(self.items())
+
+    def _name(self, row: int) -> str:
+        start = self._name_ends[row - 1] if row else 0
+        return self._names[start:self._name_ends[row]]
+
+
+def open_ticker_index(path: Path, version: Optional[str] = None) -> Optional[TickerIndex]:
+    """The index at `path` if it exists, is readable and matches `version`.
+
+    Anything else is a miss, logged, never an error: the caller can always
+    compile the index again from the source file.
+    """
+    if not Path(path).exists():
+        return None
+    try:
+        index = TickerIndex(path)
+    except ValueError as exc:  # ColumnarError included
+        logger.warning("Ignoring unreadable ticker index %s: %s", path, exc)
+        return None
+    if version is not None and index.version != version:
+        logger.info("Ticker index %s is for another source version; recompiling", path)
+        index.close()
+        return None
+    return index
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Compile a ticker index from a downloaded company_tickers.json"
+    )
+    parser.add_argument("tickers", type=Path, help="Local copy of company_tickers.json")
+    parser.add_argument("index", type=Path, help="Ticker index to write")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    from .sec import compile_tickers, index_version  # sec imports this module
+
+    text = args.tickers.read_text(encoding="utf-8")
+    mapping, ambiguous = compile_tickers(json.loads(text))
+    rows = write_ticker_index(args.index, mapping, ambiguous, index_version(text))
+    logger.info("Wrote %d names (%d ambiguous) to %s", rows, len(ambiguous), args.index)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
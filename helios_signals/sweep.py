@@ -0,0 +1,352 @@
+"""Threshold sweeps: many `SignalConfig`s screened against one snapshot.
+
+Comparing alternatives to the stated priors in `config` -- a tighter entry
+window, a lower runway floor, a smaller enrollment bar -- used to mean one
+networked run per setting, each downloading and parsing the same calendar,
+ticker index and filings. Nothing a threshold changes depends on that work.
+
+`Sweep` does it once. It reads the studies and tickers known on a date from a
+snapshot archive (`sources.snapshots`), resolves every sponsor, and computes
+runway as of that date for every CIK they resolve to, from the facts index.
+Each variant then runs the unchanged engine against those in-memory answers,
+so a variant costs only its screening. Variants are split into contiguous
+chunks and screened in a process pool. Each worker receives the shared
+inputs once, when it starts, not with every chunk.
+
+The result is one row per variant: its axis values, whether it ran, the
+catalysts in its window, its signal count, and its vetoes by screen.
+
+    python -m helios_signals.sweep --archive .cache/helios-snapshots.json.gz \\
+        --facts-index .cache/companyfacts.idx --as-of 2026-03-02 \\
+        --set min_enrollment=50,100,200 --set min_cash_runway_months=3,6,12 \\
+        --out sweep.csv
+
+A variant that fails `SignalConfig.validate` -- an entry window that opens
+inside its own exit window, say -- is reported with its error, not dropped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import dataclasses
+import itertools
+import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .backtest import chunks
+from .config import AccountConfig, SignalConfig
+from .engine import SignalEngine
+from .models import CashRunway, Catalyst, RunReport, VetoScreen
+from .sources.bulkfacts import FactsIndex
+from .sources.sec import CompanyFactsSource
+from .sources.snapshots import SnapshotArchive, SnapshotCatalystSource, SnapshotTickerResolver
+
+logger = logging.getLogger(__name__)
+
+# (axis name -> value, config) for one point of a grid.
+Variant = Tuple[Dict[str, Any], SignalConfig]
+
+
+def grid(base: SignalConfig, axes: Dict[str, Sequence[Any]]) -> List[Variant]:
+    """Every combination of `axes` values applied to `base`, first axis slowest."""
+    fields = {f.name for f in dataclasses.fields(SignalConfig)}
+    unknown = [name for name in axes if name not in fields]
+    if unknown:
+        raise ValueError(f"Not SignalConfig fields: {', '.join(unknown)}")
+    names = list(axes)
+    return [
+        (dict(zip(names, values)), dataclasses.replace(base, **dict(zip(names, values))))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+@dataclass
+class SweepRow:
+    """How one variant screened."""
+
+    label: Dict[str, Any]
+    healthy: bool
+    catalysts_in_window: int
+    signals: int
+    tickers: List[str] = field(default_factory=list)
+    vetoes: Dict[str, int] = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class SweepResult:
+    as_of: date
+    axes: List[str]
+    rows: List[SweepRow]
+
+    def veto_columns(self) -> List[str]:
+        """Every screen that vetoed anything, engine order first."""
+        seen = {name for row in self.rows for name in row.vetoes}
+        known = [screen.value for screen in VetoScreen if screen.value in seen]
+        return known + sorted(seen - set(known))
+
+    def table(self) -> List[Dict[str, Any]]:
+        """One flat dict per variant: axes, outcome counts, then vetoes by screen."""
+        screens = self.veto_columns()
+        out = []
+        for row in self.rows:
+            record: Dict[str, Any] = dict(row.label)
+            record.update(
+                healthy=row.healthy,
+                in_window=row.catalysts_in_window,
+                signals=row.signals,
+            )
+            record.update({f"veto_{name}": row.vetoes.get(name, 0) for name in screens})
+            record.update(tickers=" ".join(row.tickers), error=row.error or "")
+            out.append(record)
+        return out
+
+    def write_csv(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = self.table()
+        with path.open("w", encoding="utf-8", newline="") as fh:
+            writer = csv.DictWriter(fh, fieldnames=list(table[0]) if table else self.axes)
+            writer.writeheader()
+            writer.writerows(table)
+        return path
+
+    def render(self) -> str:
+        """The table as aligned text, without the ticker and error columns."""
+        table = [
+            {k: v for k, v in record.items() if k not in ("tickers", "error")}
+            for record in self.table()
+        ]
+        if not table:
+            return "(no variants)"
+        columns = list(table[0])
+        cells = [[str(record[c]) for c in columns] for record in table]
+        widths = [max(len(c), *(len(row[n]) for row in cells)) for n, c in enumerate(columns)]
+        lines = ["  ".join(c.rjust(w) for c, w in zip(columns, widths))]
+        lines += ["  ".join(v.rjust(w) for v, w in zip(row, widths)) for row in cells]
+        return "\n".join(lines)
+
+
+# ----------------------------------------------------------- shared inputs
+
+
+class _SharedCatalysts:
+    """The snapshot's catalysts, parsed once; `fetch` filters them by phase."""
+
+    name = SnapshotCatalystSource.name
+
+    def __init__(self, phased: List[Tuple[str, Catalyst]]) -> None:
+        self.phased = phased
+
+    def fetch(self, phases: Iterable[str]) -> List[Catalyst]:
+        wanted = set(phases)
+        return [catalyst for phase, catalyst in self.phased if phase in wanted]
+
+
+class _SharedResolver:
+    """Every sponsor in the snapshot, resolved once."""
+
+    name = SnapshotTickerResolver.name
+
+    def __init__(self, resolved: Dict[str, Optional[Tuple[str, str]]]) -> None:
+        self.resolved = resolved
+
+    def load(self) -> int:
+        return sum(1 for hit in self.resolved.values() if hit is not None)
+
+    def resolve(self, sponsor: str) -> Optional[Tuple[str, str]]:
+        return self.resolved.get(sponsor)
+
+
+class _SharedRunways:
+    """Runway for every resolved CIK as of the sweep date, computed once.
+
+    Handed to the engine as its runway table, so nothing is fetched per
+    variant. It answers every CIK a variant can ask for.
+    """
+
+    name = CompanyFactsSource.name
+
+    def __init__(self, runways: Dict[str, CashRunway]) -> None:
+        self.runways = runways
+
+    def lookup(self, cik: str, as_of: date) -> Optional[CashRunway]:
+        return self.runways.get(cik)
+
+    def fetch(self, cik: str) -> CashRunway:
+        return self.runways[cik]
+
+
+@dataclass
+class _Shared:
+    as_of: date
+    account: AccountConfig
+    catalysts: _SharedCatalysts
+    resolver: _SharedResolver
+    runways: _SharedRunways
+
+
+class Sweep:
+    """Screens a grid of `SignalConfig` variants against one snapshot date."""
+
+    def __init__(
+        self,
+        archive: Path,
+        facts_index: Path,
+        as_of: date,
+        account: Optional[AccountConfig] = None,
+        max_staleness_days: int = 7,
+        workers: Optional[int] = None,
+    ) -> None:
+        self.archive = Path(archive)
+        self.facts_index = Path(facts_index)
+        self.as_of = as_of
+        self.account = account or AccountConfig()
+        self.max_staleness_days = max_staleness_days
+        self.workers = workers or os.cpu_count() or 1
+
+    def run(self, variants: Sequence[Variant]) -> SweepResult:
+        """Screen every variant. Raises SourceError if the snapshot cannot answer."""
+        shared = self.load()
+        axes = list(dict.fromkeys(name for label, _ in variants for name in label))
+        jobs = chunks(list(variants), self.workers * 4 if self.workers > 1 else 1)
+        if self.workers == 1 or len(jobs) <= 1:
+            rows = [_screen(shared, label, config) for label, config in variants]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(jobs)),
+                initializer=_share,
+                initargs=(shared,),
+            ) as pool:
+                rows = [row for chunk in pool.map(_screen_chunk, jobs) for row in chunk]
+        logger.info("Swept %d variants as of %s", len(rows), self.as_of)
+        return SweepResult(self.as_of, axes, rows)
+
+    def load(self) -> _Shared:
+        """Everything the variants share, read from the snapshot once."""
+        archive = SnapshotArchive.load(self.archive)
+        phased = SnapshotCatalystSource(archive, self.as_of, self.max_staleness_days).phased()
+        resolver = SnapshotTickerResolver(archive, self.as_of, self.max_staleness_days)
+        resolver.load()
+        resolved = {
+            sponsor: resolver.resolve(sponsor)
+            for sponsor in dict.fromkeys(catalyst.sponsor for _, catalyst in phased)
+        }
+        facts = CompanyFactsSource(
+            client=None, bulk_index=FactsIndex(self.facts_index), as_of=self.as_of
+        )
+        ciks = dict.fromkeys(hit[1] for hit in resolved.values() if hit is not None)
+        runways = {cik: facts.fetch(cik) for cik in ciks}
+        logger.info(
+            "Sweep inputs for %s: %d studies in %s, %d sponsors, %d filers",
+            self.as_of, len(phased), archive.path, len(resolved), len(runways),
+        )
+        return _Shared(
+            self.as_of, self.account, _SharedCatalysts(phased), _SharedResolver(resolved),
+            _SharedRunways(runways),
+        )
+
+
+# Set in each worker process by the pool's initializer.
+_SHARED: Optional[_Shared] = None
+
+
+def _share(shared: _Shared) -> None:
+    global _SHARED
+    _SHARED = shared
+
+
+def _screen_chunk(variants: Sequence[Variant]) -> List[SweepRow]:
+    assert _SHARED is not None
+    return [_screen(_SHARED, label, config) for label, config in variants]
+
+
+def _screen(shared: _Shared, label: Dict[str, Any], config: SignalConfig) -> SweepRow:
+    engine = SignalEngine(
+        catalysts_source=shared.catalysts,
+        resolver=shared.resolver,
+        facts=shared.runways,
+        config=config,
+        account=shared.account,
+        runway_table=shared.runways,
+    )
+    return _row(label, engine.run(as_of=shared.as_of, dry_run=True))
+
+
+def _row(label: Dict[str, Any], report: RunReport) -> SweepRow:
+    errors = [f"{s.name}: {s.error}" for s in report.sources if not s.ok]
+    if report.fatal_error:
+        errors.insert(0, report.fatal_error)
+    return SweepRow(
+        label=label,
+        healthy=report.healthy,
+        catalysts_in_window=report.catalysts_in_window,
+        signals=len(report.signals),
+        tickers=[signal.ticker for signal in report.signals],
+        vetoes=dict(Counter(veto.screen_name for veto in report.vetoes)),
+        error="; ".join(errors) or None,
+    )
+
+
+def _axis(base: SignalConfig, spec: str) -> Tuple[str, List[Any]]:
+    """"name=v1,v2,..." parsed to the type of `base`'s value for `name`."""
+    name, sep, values = spec.partition("=")
+    name = name.strip()
+    if not sep or not values.strip():
+        raise ValueError(f"Expected name=value[,value...], got {spec!r}")
+    if not hasattr(base, name):
+        raise ValueError(f"Not a SignalConfig field: {name}")
+    kind = type(getattr(base, name))
+    if kind is bool:
+        parse = lambda raw: raw.lower() not in ("0", "false", "no", "off")  # noqa: E731
+    elif kind in (int, float):
+        parse = kind
+    else:
+        raise ValueError(f"Cannot sweep {name}: only int, float and bool fields")
+    return name, [parse(raw.strip()) for raw in values.split(",")]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Screen a grid of SignalConfig variants against one snapshot date"
+    )
+    parser.add_argument("--archive", type=Path, required=True,
+                        help="Snapshot archive recorded by run_nightly --snapshot-archive")
+    parser.add_argument("--facts-index", type=Path, required=True,
+                        help="Facts index from sources.bulkfacts, for point-in-time runway")
+    parser.add_argument("--as-of", required=True, metavar="YYYY-MM-DD")
+    parser.add_argument("--set", dest="axes", action="append", default=[],
+                        metavar="FIELD=V1,V2", help="A SignalConfig field and its values; "
+                        "repeat for more axes")
+    parser.add_argument("--max-staleness-days", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--out", type=Path, default=None, help="Comparison CSV to write")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
+    base = SignalConfig.from_env()
+    try:
+        axes = dict(_axis(base, spec) for spec in args.axes)
+        variants = grid(base, axes)
+    except ValueError as exc:
+        parser.error(str(exc))
+    result = Sweep(
+        args.archive, args.facts_index, date.fromisoformat(args.as_of),
+        max_staleness_days=args.max_staleness_days, workers=args.workers,
+    ).run(variants)
+    print(result.render())
+    if args.out is not None:
+        result.write_csv(args.out)
+        print(f"{len(result.rows)} variants -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
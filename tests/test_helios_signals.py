@@ -8,12 +8,18 @@ a test rather than a 09:00 UTC production run.
 from __future__ import annotations
 
 import gzip
+import http.client
 import json
+import urllib.parse
 import zlib
 from datetime import date, timedelta
 
 import pytest
 
+from helios_signals.analytics import LedgerAnalytics
+from helios_signals.analytics import main as analytics_main
+from helios_signals.backtest import Backtest
+from helios_signals.columnar import ColumnarError, ColumnarTable, write_table
 from helios_signals.config import AccountConfig, SignalConfig
 from helios_signals.engine import SignalEngine
 from helios_signals.ledger import RunLedger
@@ -24,22 +30,75 @@ from helios_signals.models import (
     EventType,
     Provenance,
     RunReport,
+    ScreenResult,
+    Signal,
     SourceReport,
+    VetoRecord,
+    VetoScreen,
 )
 from helios_signals.notify.telegram import (
     TelegramNotifier,
     render_run_summary,
     render_signal,
 )
+from helios_signals.profiles import BIOTECH, SectorProfile
+from helios_signals.run_nightly import arun_and_close
+from helios_signals.screens.batch import CatalystBatch, sector_mask
+from helios_signals.screens.biotech import (
+    screen_intervention_type,
+    screen_sponsor_class,
+    screen_trial_quality,
+)
 from helios_signals.screens.catalyst_window import screen_catalyst_window
 from helios_signals.screens.dilution import screen_dilution
-from helios_signals.sources.base import HttpJsonClient, SourceError, _decode_body, dig
-from helios_signals.sources.clinicaltrials import ClinicalTrialsSource, parse_ct_date
+from helios_signals.sources.aio import AsyncHttpJsonClient, read_response
+from helios_signals.sources.base import (
+    ConnectionPool,
+    HttpJsonClient,
+    HttpResponse,
+    SourceError,
+    _decode_body,
+    cache_stats_for,
+    dig,
+)
+from helios_signals.sources.bulkfacts import FactsIndex, build_facts_index
+from helios_signals.sources.cache import ResponseCache
+from helios_signals.sources.catalyst_store import CatalystStore, PhaseState
+from helios_signals.sources.clinicaltrials import (
+    CatalystQuery,
+    ClinicalTrialsSource,
+    parse_ct_date,
+    parse_study,
+)
+from helios_signals.sources.ratelimit import HostRateLimiter, TokenBucket
+from helios_signals.sources.recording import (
+    AsyncReplayTransport,
+    RecordingTransport,
+    ReplayTransport,
+    ResponseRecording,
+)
+from helios_signals.sources.runway_table import RunwayTable, build_runway_table
 from helios_signals.sources.sec import (
+    FACTS_URL,
     CompanyFactsSource,
     TickerResolver,
+    compile_tickers,
     normalise_company_name,
 )
+from helios_signals.sources.selective import extract_members
+from helios_signals.sources.snapshots import (
+    STUDIES,
+    SnapshotArchive,
+    SnapshotCatalystSource,
+    SnapshotTickerResolver,
+    TickerHistory,
+    record_tickers,
+)
+from helios_signals.sources.snapshots import TICKERS as TICKER_MAPPINGS
+from helios_signals.sources.snapshots import main as snapshots_main
+from helios_signals.sources.ticker_index import TickerIndex, write_ticker_index
+from helios_signals.sweep import Sweep, grid
+from helios_signals.sweep import main as sweep_main
 
 TODAY = date(2026, 8, 17)
 
@@ -169,9 +228,441 @@ class TestResponseDecoding:
         assert _decode_body(self.PAYLOAD.encode(), "identity") == self.PAYLOAD
 
 
+class FakeHttpConnection:
+    """Stands in for http.client.HTTPSConnection; replays scripted responses.
+
+    Each script entry is either a (status, headers, body) tuple or an exception
+    instance to raise from getresponse().
+    """
+
+    opened = []
+
+    def __init__(self, scheme, host, port, timeout, script):
+        self.host = host
+        self.script = script
+        self.requests = []
+        self.closed = False
+        FakeHttpConnection.opened.append(self)
+
+    def request(self, method, target, headers=None):
+        self.requests.append((method, target, dict(headers or {})))
+
+    def getresponse(self):
+        step = self.script.pop(0)
+        if isinstance(step, BaseException):
+            raise step
+        status, headers, body = step
+
+        class _Resp:
+            def __init__(self):
+                self.status = status
+                self.will_close = headers.get("Connection", "").lower() == "close"
+
+            def getheaders(self):
+                return list(headers.items())
+
+            def read(self):
+                return body
+
+        return _Resp()
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(script):
+    FakeHttpConnection.opened = []
+    return ConnectionPool(
+        connection_factory=lambda scheme, host, port, timeout: FakeHttpConnection(
+            scheme, host, port, timeout, script
+        )
+    )
+
+
+def make_client(script, **kw):
+    return HttpJsonClient(
+        user_agent="Helios/1 (a@b.com)", transport=make_pool(script),
+        sleep=lambda s: None, **kw,
+    )
+
+
+class TestConnectionPool:
+    """One TCP+TLS handshake per host per run, not one per request."""
+
+    OK = (200, {}, b'{"ok": true}')
+
+    def test_reuses_connection_across_calls_to_one_host(self):
+        client = make_client([self.OK, self.OK, self.OK])
+        for _ in range(3):
+            assert client.get_json("https://data.sec.gov/a.json") == {"ok": True}
+        assert len(FakeHttpConnection.opened) == 1
+        assert len(FakeHttpConnection.opened[0].requests) == 3
+
+    def test_distinct_hosts_get_distinct_connections(self):
+        client = make_client([self.OK, self.OK])
+        client.get_json("https://data.sec.gov/a.json")
+        client.get_json("https://clinicaltrials.gov/api/v2/studies?x=1")
+        assert [c.host for c in FakeHttpConnection.opened] == ["data.sec.gov", "clinicaltrials.gov"]
+        assert FakeHttpConnection.opened[1].requests[0][1] == "/api/v2/studies?x=1"
+
+    def test_stale_socket_reconnects_without_a_retry_sleep(self):
+        sleeps = []
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)",
+            transport=make_pool([self.OK, http.client.RemoteDisconnected("gone"), self.OK]),
+            sleep=sleeps.append,
+        )
+        client.get_json("https://data.sec.gov/a.json")
+        assert client.get_json("https://data.sec.gov/b.json") == {"ok": True}
+        assert sleeps == [], "a stale keep-alive socket is not a failed attempt"
+        assert len(FakeHttpConnection.opened) == 2
+        assert FakeHttpConnection.opened[0].closed
+
+    def test_connection_close_is_not_reused(self):
+        client = make_client([(200, {"Connection": "close"}, b"{}"), self.OK])
+        client.get_json("https://data.sec.gov/a.json")
+        client.get_json("https://data.sec.gov/b.json")
+        assert len(FakeHttpConnection.opened) == 2
+
+    def test_403_is_not_retried(self):
+        client = make_client([(403, {}, b"")])
+        with pytest.raises(SourceError, match="User-Agent"):
+            client.get_json("https://www.sec.gov/files/company_tickers.json")
+        assert len(FakeHttpConnection.opened[0].requests) == 1
+
+    def test_404_is_not_retried(self):
+        client = make_client([(404, {}, b"")])
+        with pytest.raises(SourceError, match="404"):
+            client.get_json("https://data.sec.gov/missing.json")
+
+    def test_transient_status_is_retried(self):
+        client = make_client([(503, {}, b""), (429, {}, b""), self.OK])
+        assert client.get_json("https://data.sec.gov/a.json") == {"ok": True}
+
+    def test_gives_up_after_max_retries(self):
+        client = make_client([(503, {}, b"")] * 2, max_retries=2)
+        with pytest.raises(SourceError, match="after 2 attempts"):
+            client.get_json("https://data.sec.gov/a.json")
+
+    def test_gzip_body_is_decoded(self):
+        body = gzip.compress(b'{"studies": []}')
+        client = make_client([(200, {"Content-Encoding": "gzip"}, body)])
+        assert client.get_json("https://clinicaltrials.gov/api/v2/studies") == {"studies": []}
+
+    def test_follows_redirects(self):
+        client = make_client([(301, {"Location": "/new.json"}, b""), self.OK])
+        assert client.get_json("https://www.sec.gov/old.json") == {"ok": True}
+        assert FakeHttpConnection.opened[0].requests[1][1] == "/new.json"
+
+    def test_response_type_is_plain_data(self):
+        resp = make_pool([(200, {"Content-Type": "application/json"}, b"{}")]).request(
+            "GET", "https://data.sec.gov/a.json", {}
+        )
+        assert resp == HttpResponse(200, {"content-type": "application/json"}, b"{}")
+
+
+class RoutingTransport:
+    """A ConnectionPool stand-in that answers by URL substring.
+
+    Honours If-None-Match against the ETag of the matching route, the way a
+    real server would, so conditional-GET behaviour can be exercised end to end.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes  # fragment -> (etag or None, payload)
+        self.requests = []
+
+    def request(self, method, url, headers):
+        self.requests.append((url, dict(headers)))
+        for frag, (etag, payload) in self.routes.items():
+            if frag in url:
+                if etag and headers.get("If-None-Match") == etag:
+                    return HttpResponse(304, {"etag": etag}, b"")
+                body = gzip.compress(json.dumps(payload).encode())
+                hdrs = {"content-encoding": "gzip"}
+                if etag:
+                    hdrs["etag"] = etag
+                return HttpResponse(200, hdrs, body)
+        return HttpResponse(404, {}, b"")
+
+    def close(self):
+        pass
+
+
+class TestResponseCache:
+    URL = "https://www.sec.gov/files/company_tickers.json"
+
+    def _client(self, tmp_path, routes):
+        transport = RoutingTransport(routes)
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)", transport=transport,
+            cache=ResponseCache(tmp_path / "http"), sleep=lambda s: None,
+        )
+        return client, transport
+
+    def test_unchanged_payload_is_served_from_disk(self, tmp_path):
+        client, transport = self._client(tmp_path, {"company_tickers": ('"v1"', {"a": 1})})
+        assert client.get_json(self.URL) == {"a": 1}
+        assert "If-None-Match" not in transport.requests[0][1]
+
+        assert client.get_json(self.URL) == {"a": 1}
+        assert transport.requests[1][1]["If-None-Match"] == '"v1"'
+
+        stats = client.cache_stats(self.URL)
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.bytes_saved > 0
+
+    def test_cache_survives_a_new_client(self, tmp_path):
+        """The point is night-to-night reuse, not within one process."""
+        routes = {"company_tickers": ('"v1"', {"a": 1})}
+        self._client(tmp_path, routes)[0].get_json(self.URL)
+        client, transport = self._client(tmp_path, routes)
+        assert client.get_json(self.URL) == {"a": 1}
+        assert client.cache_stats(self.URL).hits == 1
+
+    def test_changed_payload_replaces_the_entry(self, tmp_path):
+        client, transport = self._client(tmp_path, {"company_tickers": ('"v1"', {"a": 1})})
+        client.get_json(self.URL)
+        transport.routes["company_tickers"] = ('"v2"', {"a": 2})
+        assert client.get_json(self.URL) == {"a": 2}
+        assert client.get_json(self.URL) == {"a": 2}
+        assert client.cache_stats(self.URL).hits == 1
+
+    def test_response_without_validators_is_not_cached(self, tmp_path):
+        client, transport = self._client(tmp_path, {"company_tickers": (None, {"a": 1})})
+        client.get_json(self.URL)
+        client.get_json(self.URL)
+        assert all("If-None-Match" not in h for _, h in transport.requests)
+
+    def test_corrupt_cached_body_falls_back_to_a_full_download(self, tmp_path):
+        client, transport = self._client(tmp_path, {"company_tickers": ('"v1"', {"a": 1})})
+        client.get_json(self.URL)
+        for body in (tmp_path / "http").glob("*.body"):
+            body.write_bytes(b"\x1f\x8bnot gzip")
+        # Size mismatch makes the damaged entry a plain miss.
+        assert client.get_json(self.URL) == {"a": 1}
+
+    def test_stats_are_per_host(self, tmp_path):
+        client, _ = self._client(tmp_path, {"sec.gov": ('"v1"', {"a": 1})})
+        client.get_json(self.URL)
+        client.get_json(self.URL)
+        assert client.cache_stats("https://data.sec.gov/x.json").hits == 0
+        assert cache_stats_for(FakeClient({}), self.URL).hits == 0
+
+    def test_engine_reports_cache_counters_per_source(self, tmp_path):
+        routes = {
+            "clinicaltrials.gov": (None, {"studies": []}),
+            "company_tickers": ('"t1"', TICKERS),
+        }
+        client, _ = self._client(tmp_path, routes)
+        eng = SignalEngine(
+            catalysts_source=ClinicalTrialsSource(client),
+            resolver=TickerResolver(client),
+            facts=CompanyFactsSource(client),
+            config=SignalConfig(),
+            account=AccountConfig(),
+        )
+        eng.run(as_of=TODAY)
+        rep = eng.run(as_of=TODAY)
+        by_name = {s.name: s for s in rep.sources}
+        assert by_name["sec.company_tickers"].cache_hits == 1
+        assert by_name["clinicaltrials.gov"].cache_hits == 0
+        assert "cache_bytes_saved" in by_name["sec.company_tickers"].to_dict()
+
+
 # ------------------------------------------------------------ clinicaltrials
 
 
+def big_companyfacts():
+    """A companyfacts-shaped document with decoys around the two runway tags."""
+    def series(n, val):
+        return [
+            {"start": "2025-01-01", "end": "2025-03-31", "val": val + i,
+             "filed": "2025-05-01", "form": "10-Q", "accn": "0000000000-25-000001"}
+            for i in range(n)
+        ]
+
+    gaap = {
+        f"Decoy{i}": {
+            "label": f'Decoy "{i}"',
+            # Entry-like text inside strings must not be mistaken for entries.
+            "description": 'looks like {"label": "x"} and "Cash": {"units": 1}',
+            "units": {"USD": series(20, i)},
+        }
+        for i in range(200)
+    }
+    gaap["CashAndCashEquivalentsAtCarryingValue"] = {
+        "label": "Cash", "description": "d", "units": {"USD": series(5, 10**6)}
+    }
+    gaap["NetCashProvidedByUsedInOperatingActivities"] = {
+        "label": "OCF", "description": "d", "units": {"USD": series(5, -10**5)}
+    }
+    return {
+        "cik": 1234567,
+        "entityName": "Acme",
+        "facts": {
+            "dei": {"EntityPublicFloat": {"label": "f", "description": "d", "units": {"USD": []}}},
+            "us-gaap": gaap,
+            # Same tag name in another taxonomy: must not leak into us-gaap.
+            "ifrs-full": {"CashAndCashEquivalentsAtCarryingValue": {
+                "label": "IFRS cash", "description": "d", "units": {"USD": series(1, 1)}
+            }},
+        },
+    }
+
+
+class TestResponseRecording:
+    URL = "https://www.sec.gov/files/company_tickers.json"
+
+    def _record(self, tmp_path, routes, urls):
+        recording = ResponseRecording.create(tmp_path / "rec", as_of="2026-03-02")
+        live = RoutingTransport(routes)
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)",
+            transport=RecordingTransport(recording, live), sleep=lambda s: None,
+        )
+        return [client.get_json(url) for url in urls]
+
+    def _replay_client(self, tmp_path):
+        return HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)",
+            transport=ReplayTransport(ResponseRecording.open(tmp_path / "rec")),
+            sleep=lambda s: None,
+        )
+
+    def test_replay_returns_what_was_recorded(self, tmp_path):
+        live = self._record(tmp_path, {"company_tickers": (None, {"a": 1})}, [self.URL])
+        recording = ResponseRecording.open(tmp_path / "rec")
+        assert recording.meta == {"as_of": "2026-03-02"}
+        assert len(recording) == 1
+        assert self._replay_client(tmp_path).get_json(self.URL) == live[0] == {"a": 1}
+
+    def test_identical_bodies_are_stored_once(self, tmp_path):
+        self._record(tmp_path, {"company_tickers": (None, {"a": 1})}, [self.URL] * 3)
+        assert len(ResponseRecording.open(tmp_path / "rec")) == 3
+        assert len(list((tmp_path / "rec" / "bodies").iterdir())) == 1
+
+    def test_repeats_replay_in_order_then_hold_the_last(self, tmp_path):
+        recording = ResponseRecording.create(tmp_path / "rec")
+        for n in (1, 2):
+            recording.store("GET", self.URL, HttpResponse(200, {}, json.dumps({"n": n}).encode()))
+        client = self._replay_client(tmp_path)
+        assert [client.get_json(self.URL)["n"] for _ in range(3)] == [1, 2, 2]
+
+    def test_unrecorded_url_is_an_error_not_a_live_request(self, tmp_path):
+        self._record(tmp_path, {"company_tickers": (None, {"a": 1})}, [self.URL])
+        with pytest.raises(SourceError, match="not in the recording"):
+            self._replay_client(tmp_path).get_json("https://data.sec.gov/other.json")
+
+    def test_missing_recording_is_a_source_error(self, tmp_path):
+        with pytest.raises(SourceError, match="No recording"):
+            ResponseRecording.open(tmp_path / "nowhere")
+
+    def test_async_replay(self, tmp_path):
+        import asyncio
+
+        self._record(tmp_path, {"company_tickers": (None, {"a": 1})}, [self.URL])
+
+        async def no_sleep(s):
+            pass
+
+        client = AsyncHttpJsonClient(
+            user_agent="Helios/1 (a@b.com)",
+            transport=AsyncReplayTransport(ResponseRecording.open(tmp_path / "rec")),
+            sleep=no_sleep,
+        )
+        assert asyncio.run(client.get_json(self.URL)) == {"a": 1}
+
+
+class TestSelectiveDecoding:
+    WANTED = [
+        "CashAndCashEquivalentsAtCarryingValue",
+        "NetCashProvidedByUsedInOperatingActivities",
+        "CashAndDueFromBanks",
+    ]
+
+    def _expected(self, doc):
+        gaap = doc["facts"]["us-gaap"]
+        return {"facts": {"us-gaap": {t: gaap[t] for t in self.WANTED if t in gaap}}}
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate", "raw-deflate", ""])
+    def test_matches_a_full_parse(self, encoding):
+        doc = big_companyfacts()
+        raw = json.dumps(doc, separators=(",", ":")).encode()
+        if encoding == "gzip":
+            body = gzip.compress(raw)
+        elif encoding == "deflate":
+            body = zlib.compress(raw)
+        elif encoding == "raw-deflate":
+            c = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+            body, encoding = c.compress(raw) + c.flush(), "deflate"
+        else:
+            body = raw
+        assert extract_members(body, encoding, "us-gaap", self.WANTED) == self._expected(doc)
+
+    def test_entries_split_across_chunks(self, monkeypatch):
+        from helios_signals.sources import selective
+
+        monkeypatch.setattr(selective, "_CHUNK", 7)
+        doc = big_companyfacts()
+        body = gzip.compress(json.dumps(doc, indent=1).encode())
+        assert extract_members(body, "gzip", "us-gaap", self.WANTED) == self._expected(doc)
+
+    def test_unrecognised_layout_returns_none(self):
+        body = json.dumps({"facts": {"us-gaap": {"Cash": {"value": 1}}}}).encode()
+        assert extract_members(body, "", "us-gaap", self.WANTED) is None
+
+    def test_truncated_body_is_a_zlib_error(self):
+        body = gzip.compress(json.dumps(big_companyfacts()).encode())
+        with pytest.raises(zlib.error):
+            extract_members(body[: len(body) // 2], "gzip", "us-gaap", self.WANTED)
+
+    def test_client_falls_back_to_a_full_parse(self):
+        payload = {"facts": {"us-gaap": {"Cash": {"value": 1}}}}
+        client = make_client([(200, {}, json.dumps(payload).encode())])
+        assert client.get_json_members("https://data.sec.gov/x", "us-gaap", self.WANTED) == payload
+
+    def test_client_retries_a_truncated_body(self):
+        body = gzip.compress(json.dumps(big_companyfacts()).encode())
+        client = make_client([
+            (200, {"Content-Encoding": "gzip"}, body[:100]),
+            (200, {"Content-Encoding": "gzip"}, body),
+        ])
+        got = client.get_json_members("https://data.sec.gov/x", "us-gaap", self.WANTED)
+        assert got == self._expected(big_companyfacts())
+
+    def test_revalidated_copy_decodes_selectively(self, tmp_path):
+        doc = big_companyfacts()
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)",
+            transport=RoutingTransport({"companyfacts": ('"v1"', doc)}),
+            cache=ResponseCache(tmp_path),
+        )
+        url = FACTS_URL.format(cik=1234567)
+        first = client.get_json_members(url, "us-gaap", self.WANTED)
+        second = client.get_json_members(url, "us-gaap", self.WANTED)
+        assert first == second == self._expected(doc)
+        assert client.cache_stats(url).hits == 1
+
+    def test_runway_fetch_uses_the_selective_path(self):
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)",
+            transport=RoutingTransport({"companyfacts": (None, big_companyfacts())}),
+        )
+        calls = []
+        real = client.get_json_members
+
+        def spy(url, section, keys, headers=None):
+            calls.append((section, tuple(keys)))
+            return real(url, section, keys, headers)
+
+        client.get_json_members = spy
+        runway = CompanyFactsSource(client).fetch("0001234567")
+        assert calls and calls[0][0] == "us-gaap"
+        # $1M cash over a $100k quarterly burn.
+        assert runway.months == pytest.approx(30.0)
+
+
 class TestDateParsing:
     def test_full_date(self):
         assert parse_ct_date("2026-11-30") == date(2026, 11, 30)
@@ -186,6 +677,9 @@ class TestDateParsing:
     def test_rejects_garbage(self, bad):
         assert parse_ct_date(bad) is None
 
+    def test_non_padded_full_date_still_parses(self):
+        assert parse_ct_date("2026-3-5") == date(2026, 3, 5)
+
 
 class TestClinicalTrialsSource:
     def test_parses_studies(self):
@@ -222,6 +716,32 @@ class TestClinicalTrialsSource:
         with pytest.raises(SourceError, match="Unexpected response shape"):
             ClinicalTrialsSource(client).fetch(["PHASE3"])
 
+    def test_provenance_links_each_study_and_shares_the_page_timestamp(self):
+        client = FakeClient({"clinicaltrials.gov": {"studies": [
+            make_study("NCT1", "Acme Inc", "2026-10-15"),
+            make_study("NCT2", "Acme Inc", "2026-10-16"),
+        ]}})
+        a, b = ClinicalTrialsSource(client).fetch(["PHASE3"])
+        assert a.provenance.url == "https://clinicaltrials.gov/study/NCT1"
+        assert b.provenance.url == "https://clinicaltrials.gov/study/NCT2"
+        assert a.provenance.retrieved_at is b.provenance.retrieved_at
+
+    def test_repeated_strings_are_interned(self):
+        studies = [make_study(f"NCT{i}", "".join(["Acme ", "Inc"]), "2026-10-15")
+                   for i in range(2)]
+        client = FakeClient({"clinicaltrials.gov": {"studies": studies}})
+        a, b = ClinicalTrialsSource(client).fetch(["PHASE3"])
+        assert a.sponsor is b.sponsor
+        assert a.conditions[0] is b.conditions[0]
+
+    def test_catalyst_has_no_instance_dict(self):
+        client = FakeClient({"clinicaltrials.gov": {
+            "studies": [make_study("NCT1", "Acme Inc", "2026-10-15")]
+        }})
+        [c] = ClinicalTrialsSource(client).fetch(["PHASE3"])
+        assert not hasattr(c, "__dict__")
+        assert c.to_dict()["provenance"]["source"] == "clinicaltrials.gov"
+
     def test_follows_pagination(self):
         class Paged:
             def __init__(self):
@@ -236,6 +756,355 @@ class TestClinicalTrialsSource:
         assert len(ClinicalTrialsSource(Paged()).fetch(["PHASE3"])) == 2
 
 
+class TestConcurrentClinicalTrialsFetch:
+    @staticmethod
+    def _paged_client(pages_per_phase=3, on_get=None):
+        import threading
+
+        class Paged:
+            def __init__(self):
+                self.calls = []
+                self.lock = threading.Lock()
+
+            def get_json(self, url, headers=None):
+                phase = "PHASE3" if "PHASE3" in url else "PHASE2"
+                page = int(url.split("pageToken=")[1].split("&")[0]) if "pageToken=" in url else 0
+                with self.lock:
+                    self.calls.append((phase, page))
+                if on_get:
+                    on_get(phase, page)
+                payload = {"studies": [
+                    make_study(f"NCT{phase[-1]}{page}", "A Inc", "2026-10-15", phase=phase)
+                ]}
+                if page + 1 < pages_per_phase:
+                    payload["nextPageToken"] = str(page + 1)
+                return payload
+
+        return Paged()
+
+    def test_results_match_sequential_order(self):
+        seq = ClinicalTrialsSource(self._paged_client()).fetch(["PHASE3", "PHASE2"])
+        con = ClinicalTrialsSource(self._paged_client(), concurrent=True).fetch(
+            ["PHASE3", "PHASE2"]
+        )
+        assert [c.external_id for c in con] == [c.external_id for c in seq]
+        assert len(con) == 6
+
+    def test_phases_are_fetched_in_parallel(self):
+        """Both first pages must be in flight at once, or the barrier breaks."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(phase, page):
+            if page == 0:
+                barrier.wait()
+
+        src = ClinicalTrialsSource(self._paged_client(1, on_get=meet), concurrent=True)
+        assert len(src.fetch(["PHASE3", "PHASE2"])) == 2
+
+    def test_next_page_is_requested_while_current_page_parses(self, monkeypatch):
+        import threading
+
+        next_requested = threading.Event()
+
+        def note(phase, page):
+            if page == 1:
+                next_requested.set()
+
+        src = ClinicalTrialsSource(self._paged_client(2, on_get=note), concurrent=True)
+        seen_during_parse = []
+
+        def parse(study, phase, *args):
+            if not seen_during_parse:
+                seen_during_parse.append(next_requested.wait(timeout=5))
+            return parse_study(study, phase, *args)
+
+        monkeypatch.setattr("helios_signals.sources.clinicaltrials.parse_study", parse)
+        assert len(src.fetch(["PHASE3"])) == 2
+        assert seen_during_parse == [True]
+
+    def test_does_not_prefetch_past_max_pages(self):
+        client = self._paged_client(10)
+        ClinicalTrialsSource(client, max_pages=3, concurrent=True).fetch(["PHASE3"])
+        assert sorted(client.calls) == [("PHASE3", 0), ("PHASE3", 1), ("PHASE3", 2)]
+
+    def test_schema_drift_still_fails_loudly(self):
+        client = FakeClient({"clinicaltrials.gov": {"results": []}})
+        with pytest.raises(SourceError, match="Unexpected response shape"):
+            ClinicalTrialsSource(client, concurrent=True).fetch(["PHASE3", "PHASE2"])
+
+
+class TestCatalystQuery:
+    QUERY = CatalystQuery.for_screens(SignalConfig(), TODAY)
+
+    def test_expression_for_default_screens(self):
+        assert self.QUERY.advanced() == (
+            "AREA[LeadSponsorClass]INDUSTRY AND "
+            "AREA[InterventionType](BIOLOGICAL OR COMBINATION_PRODUCT OR DEVICE OR DRUG "
+            "OR GENETIC) AND AREA[PrimaryCompletionDate]RANGE[2026-08-01,2026-10-16]"
+        )
+
+    def test_sponsor_term_follows_config(self):
+        cfg = SignalConfig(require_industry_sponsor=False)
+        assert "LeadSponsorClass" not in CatalystQuery.for_screens(cfg, TODAY).advanced()
+
+    def test_empty_query_adds_no_filter(self):
+        url = ClinicalTrialsSource(FakeClient({}))._build_url("PHASE3", None)
+        assert "filter.advanced" not in url
+        assert "filter.overallStatus" in url
+
+    def test_query_is_sent_alongside_status_filter(self):
+        src = ClinicalTrialsSource(FakeClient({}), query=self.QUERY)
+        url = urllib.parse.unquote_plus(src._build_url("PHASE3", None))
+        assert f"filter.advanced={self.QUERY.advanced()}" in url
+        assert "filter.overallStatus=RECRUITING" in url
+
+    def test_store_keeps_static_terms_only(self, tmp_path):
+        src = ClinicalTrialsSource(
+            FakeClient({}), store=CatalystStore(tmp_path / "s.json"), query=self.QUERY
+        )
+        url = urllib.parse.unquote_plus(src._build_url("PHASE3", None, TODAY))
+        assert "PrimaryCompletionDate" not in url
+        assert "AREA[LastUpdatePostDate]RANGE[2026-08-17,MAX] AND AREA[LeadSponsorClass]" in url
+
+    def test_store_signature_depends_on_query(self, tmp_path):
+        store = CatalystStore(tmp_path / "s.json")
+        plain = ClinicalTrialsSource(FakeClient({}), store=store)
+        filtered = ClinicalTrialsSource(FakeClient({}), store=store, query=self.QUERY)
+        assert plain._signature() != filtered._signature()
+
+    def test_matches_mirrors_each_term(self):
+        q = self.QUERY
+        assert q.matches(make_study("NCT1", "A Inc", "2026-10-01"))
+        assert not q.matches(make_study("NCT1", "A Inc", "2026-10-01", sponsor_class="OTHER"))
+        assert not q.matches(
+            make_study("NCT1", "A Inc", "2026-10-01", intervention_type="BEHAVIORAL")
+        )
+        assert not q.matches(make_study("NCT1", "A Inc", "2026-12-01"))
+        assert not q.matches(make_study("NCT1", "A Inc", "2026-07-31"))
+
+    def test_month_only_dates_match_if_any_day_is_in_range(self):
+        assert self.QUERY.matches(make_study("NCT1", "A Inc", "2026-10"))
+        assert self.QUERY.matches(make_study("NCT1", "A Inc", "2026-08"))
+        assert not self.QUERY.matches(make_study("NCT1", "A Inc", "2026-11"))
+
+    @staticmethod
+    def _registry(filtered_studies):
+        everything = [
+            make_study("NCT1", "A Inc", "2026-10-01"),
+            make_study("NCT2", "Univ", "2026-10-01", sponsor_class="OTHER"),
+            make_study("NCT3", "B Inc", "2026-10-01", intervention_type="BEHAVIORAL"),
+        ]
+
+        class Registry:
+            def get_json(self, url, headers=None):
+                if "LeadSponsorClass" in urllib.parse.unquote_plus(url):
+                    return {"studies": filtered_studies}
+                return {"studies": everything}
+
+        return Registry()
+
+    def test_verify_passes_when_server_agrees(self):
+        client = self._registry([make_study("NCT1", "A Inc", "2026-10-01")])
+        [check] = ClinicalTrialsSource(client, query=self.QUERY).verify_query(["PHASE3"])
+        assert check.ok
+        assert (check.unfiltered, check.filtered, check.expected) == (3, 1, 1)
+        assert check.kept_fraction == pytest.approx(1 / 3)
+
+    def test_verify_lists_studies_the_filter_drops(self):
+        [check] = ClinicalTrialsSource(self._registry([]), query=self.QUERY).verify_query(
+            ["PHASE3"]
+        )
+        assert not check.ok
+        assert check.missing == ["NCT1"]
+
+
+class TestCatalystDeltaSync:
+    """ClinicalTrialsSource with a CatalystStore."""
+
+    class Server:
+        """A registry that answers full, delta and count queries for PHASE3."""
+
+        def __init__(self, studies):
+            self.studies = {s["protocolSection"]["identificationModule"]["nctId"]: s
+                            for s in studies}
+            self.changed = set()
+            self.calls = []
+            self.count_offset = 0
+
+        def set_status(self, nct, status):
+            self.studies[nct]["protocolSection"]["statusModule"]["overallStatus"] = status
+            self.changed.add(nct)
+
+        def add(self, study):
+            nct = study["protocolSection"]["identificationModule"]["nctId"]
+            self.studies[nct] = study
+            self.changed.add(nct)
+
+        def _tracked(self):
+            return [s for _, s in sorted(self.studies.items())
+                    if s["protocolSection"]["statusModule"]["overallStatus"] in (
+                        "RECRUITING", "ACTIVE_NOT_RECRUITING", "ENROLLING_BY_INVITATION")]
+
+        def get_json(self, url, headers=None):
+            if "LastUpdatePostDate" in url:
+                self.calls.append("delta")
+                return {"studies": [self.studies[n] for n in sorted(self.changed)]}
+            tracked = self._tracked()
+            if "pageSize=1&" in url:
+                self.calls.append("count")
+                return {"studies": tracked[:1], "totalCount": len(tracked) + self.count_offset}
+            self.calls.append("full")
+            return {"studies": tracked, "totalCount": len(tracked)}
+
+    @staticmethod
+    def source(server, tmp_path, today=TODAY, **kw):
+        return ClinicalTrialsSource(
+            server, store=CatalystStore(tmp_path / "store.json"), today=lambda: today, **kw
+        )
+
+    def seeded(self, tmp_path):
+        server = self.Server([
+            make_study("NCT1", "A Inc", "2026-10-15"),
+            make_study("NCT2", "B Inc", "2026-10-16"),
+        ])
+        self.source(server, tmp_path).fetch(["PHASE3"])
+        server.calls.clear()
+        return server
+
+    def test_first_run_is_a_full_download(self, tmp_path):
+        server = self.Server([make_study("NCT1", "A Inc", "2026-10-15")])
+        got = self.source(server, tmp_path).fetch(["PHASE3"])
+        assert [c.external_id for c in got] == ["NCT1"]
+        assert server.calls == ["full"]
+        assert (tmp_path / "store.json").exists()
+
+    def test_stored_studies_keep_their_public_url(self, tmp_path):
+        server = self.seeded(tmp_path)
+        got = self.source(server, tmp_path, TODAY + timedelta(days=1)).fetch(["PHASE3"])
+        assert [c.provenance.url for c in got] == [
+            "https://clinicaltrials.gov/study/NCT1",
+            "https://clinicaltrials.gov/study/NCT2",
+        ]
+
+    def test_next_run_requests_only_changes(self, tmp_path):
+        server = self.seeded(tmp_path)
+        server.add(make_study("NCT3", "C Inc", "2026-10-17"))
+        got = self.source(server, tmp_path, TODAY + timedelta(days=1)).fetch(["PHASE3"])
+        assert [c.external_id for c in got] == ["NCT1", "NCT2", "NCT3"]
+        assert server.calls == ["delta", "count"]
+
+    def test_delta_query_drops_status_filter_and_overlaps_a_day(self, tmp_path):
+        src = self.source(self.Server([]), tmp_path)
+        url = src._build_url("PHASE3", None, TODAY - timedelta(days=1))
+        assert "filter.overallStatus" not in url
+        assert "RANGE[2026-08-16,MAX]" in urllib.parse.unquote(url)
+
+    def test_study_leaving_tracked_statuses_is_tombstoned(self, tmp_path):
+        server = self.seeded(tmp_path)
+        server.set_status("NCT2", "TERMINATED")
+        later = TODAY + timedelta(days=1)
+        got = self.source(server, tmp_path, later).fetch(["PHASE3"])
+        assert [c.external_id for c in got] == ["NCT1"]
+        src = self.source(server, tmp_path)
+        state = CatalystStore(tmp_path / "store.json").load(src._signature())["PHASE3"]
+        assert state.tombstones == {"NCT2": {"status": "TERMINATED", "on": later.isoformat()}}
+
+    def test_reactivated_study_loses_its_tombstone(self, tmp_path):
+        server = self.seeded(tmp_path)
+        server.set_status("NCT2", "SUSPENDED")
+        self.source(server, tmp_path, TODAY + timedelta(days=1)).fetch(["PHASE3"])
+        server.set_status("NCT2", "RECRUITING")
+        got = self.source(server, tmp_path, TODAY + timedelta(days=2)).fetch(["PHASE3"])
+        assert [c.external_id for c in got] == ["NCT1", "NCT2"]
+
+    def test_untracked_unknown_study_is_ignored(self, tmp_path):
+        server = self.seeded(tmp_path)
+        study = make_study("NCT9", "Z Inc", "2026-10-15")
+        study["protocolSection"]["statusModule"]["overallStatus"] = "COMPLETED"
+        server.add(study)
+        got = self.source(server, tmp_path, TODAY + timedelta(days=1)).fetch(["PHASE3"])
+        assert [c.external_id for c in got] == ["NCT1", "NCT2"]
+        assert server.calls == ["delta", "count"]
+
+    def test_count_mismatch_forces_full_refresh(self, tmp_path):
+        server = self.seeded(tmp_path)
+        server.count_offset = 1
+        self.source(server, tmp_path, TODAY + timedelta(days=1)).fetch(["PHASE3"])
+        assert server.calls == ["delta", "count", "full"]
+
+    def test_stale_full_refresh_forces_full_download(self, tmp_path):
+        server = self.seeded(tmp_path)
+        self.source(server, tmp_path, TODAY + timedelta(days=7)).fetch(["PHASE3"])
+        assert server.calls == ["full"]
+
+    def test_delta_over_max_pages_forces_full_refresh(self, tmp_path):
+        server = self.seeded(tmp_path)
+        server.add(make_study("NCT3", "C Inc", "2026-10-17"))
+        real = server.get_json
+
+        def paged(url, headers=None):
+            payload = real(url, headers)
+            if "LastUpdatePostDate" in url:
+                payload = dict(payload, nextPageToken="more")
+            return payload
+
+        server.get_json = paged
+        src = self.source(server, tmp_path, TODAY + timedelta(days=1), max_pages=1)
+        assert len(src.fetch(["PHASE3"])) == 3
+        assert server.calls == ["delta", "full"]
+
+    def test_failure_leaves_store_untouched(self, tmp_path):
+        server = self.seeded(tmp_path)
+        before = (tmp_path / "store.json").read_text()
+        server.add(make_study("NCT3", "C Inc", "2026-10-17"))
+
+        def broken(url, headers=None):
+            raise SourceError("simulated outage")
+
+        server.get_json = broken
+        with pytest.raises(SourceError):
+            self.source(server, tmp_path, TODAY + timedelta(days=1)).fetch(["PHASE3"])
+        assert (tmp_path / "store.json").read_text() == before
+
+    def test_store_for_other_fields_is_ignored(self, tmp_path):
+        store = CatalystStore(tmp_path / "store.json")
+        store.save("another-query", {"PHASE3": PhaseState(synced_on=TODAY, full_refresh_on=TODAY)})
+        server = self.Server([make_study("NCT1", "A Inc", "2026-10-15")])
+        self.source(server, tmp_path).fetch(["PHASE3"])
+        assert server.calls == ["full"]
+
+    def test_corrupt_store_is_ignored(self, tmp_path):
+        (tmp_path / "store.json").write_text("{not json")
+        server = self.Server([make_study("NCT1", "A Inc", "2026-10-15")])
+        assert len(self.source(server, tmp_path).fetch(["PHASE3"])) == 1
+        assert server.calls == ["full"]
+
+    def test_async_fetch_syncs_the_same_way(self, tmp_path):
+        import asyncio
+
+        server = self.seeded(tmp_path)
+        server.set_status("NCT1", "TERMINATED")
+
+        class Async:
+            async def get_json(self, url, headers=None):
+                return server.get_json(url, headers)
+
+        src = self.source(Async(), tmp_path, TODAY + timedelta(days=1))
+        got = asyncio.run(src.afetch(["PHASE3"]))
+        assert [c.external_id for c in got] == ["NCT2"]
+        assert server.calls == ["delta", "count"]
+
+    def test_old_tombstones_are_pruned(self):
+        state = PhaseState(tombstones={
+            "NCT1": {"status": "WITHDRAWN", "on": "2026-01-01"},
+            "NCT2": {"status": "WITHDRAWN", "on": "2026-08-01"},
+        })
+        state.prune_tombstones(TODAY)
+        assert list(state.tombstones) == ["NCT2"]
+
+
 # ----------------------------------------------------------------------- SEC
 
 
@@ -253,6 +1122,20 @@ class TestNameNormalisation:
     def test_empty_input(self):
         assert normalise_company_name("") == ""
 
+    @pytest.mark.parametrize("name", [
+        "Hoffmann-La Roche", "Eli Lilly and Company", "Bayer AG\t(Germany)",
+        "Laboratoires Thea S.A.S.", "Société Générale Pharma", "Zürich Bio-Sciences AG",
+        "  ", "3M Co.",
+    ])
+    def test_fast_path_matches_the_regex(self, name):
+        import re
+
+        from helios_signals.sources.sec import _SUFFIXES
+
+        lowered = re.sub(r"[^a-z0-9\s]", " ", name.lower())
+        expected = " ".join(t for t in lowered.split() if t not in _SUFFIXES)
+        assert normalise_company_name(name) == expected
+
 
 class TestTickerResolver:
     @staticmethod
@@ -288,6 +1171,200 @@ class TestTickerResolver:
         with pytest.raises(SourceError, match="load"):
             r.resolve("Acme")
 
+    def test_repeated_sponsors_are_answered_from_the_memo(self):
+        r = TickerResolver(FakeClient({"company_tickers": self._payload()}))
+        r.load()
+        for sponsor in ("Acme Therapeutics Inc", "Nobody Ltd", "Acme Therapeutics Inc",
+                        "Nobody Ltd", "Acme Therapeutics Inc"):
+            r.resolve(sponsor)
+        assert (r.memo_hits, r.memo_misses) == (3, 2)
+        assert r.resolve("Nobody Ltd") is None
+
+    def test_reload_clears_the_memo(self):
+        client = FakeClient({"company_tickers": self._payload()})
+        r = TickerResolver(client)
+        r.load()
+        assert r.resolve("Gamma Bio") is None
+        client.routes["company_tickers"] = {
+            "0": {"cik_str": 42, "ticker": "GAMA", "title": "Gamma Bio Inc"}
+        }
+        r.load()
+        assert r.resolve("Gamma Bio") == ("GAMA", "0000000042")
+        assert (r.memo_hits, r.memo_misses) == (0, 1)
+
+
+class TestTickerIndex:
+    URL = "https://www.sec.gov/files/company_tickers.json"
+
+    def _resolver(self, tmp_path, payload, etag='"t1"'):
+        transport = RoutingTransport({"company_tickers": (etag, payload)})
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)", transport=transport,
+            cache=ResponseCache(tmp_path / "http"), sleep=lambda s: None,
+        )
+        return TickerResolver(client, index_path=tmp_path / "tickers.hxct")
+
+    def test_unchanged_file_loads_from_the_index(self, tmp_path, monkeypatch):
+        payload = TestTickerResolver._payload()
+        first = self._resolver(tmp_path, payload)
+        assert first.load() == 2 and not first.index_hit
+
+        def no_compile(_):
+            raise AssertionError("recompiled an unchanged ticker file")
+
+        monkeypatch.setattr("helios_signals.sources.sec.compile_tickers", no_compile)
+        second = self._resolver(tmp_path, payload)
+        assert second.load() == 2 and second.index_hit
+        assert second.resolve("Acme Therapeutics, Inc.") == ("ACME", "0001234567")
+        assert second.mapping() == first.mapping()
+
+    def test_index_hit_answers_from_the_mapped_file(self, tmp_path, monkeypatch):
+        payload = TestTickerResolver._payload()
+        self._resolver(tmp_path, payload).load()
+
+        def no_copy(self):
+            raise AssertionError("copied the whole index into memory")
+
+        monkeypatch.setattr(TickerIndex, "mapping", no_copy)
+        again = self._resolver(tmp_path, payload)
+        again.load()
+        assert again.index_hit
+        assert again.resolve("Beta Pharma") == ("BETA", "0007654321")
+        assert again.resolve("Nobody Inc") is None
+
+    def test_index_reads_as_a_mapping(self, tmp_path):
+        write_ticker_index(
+            tmp_path / "t.hxct",
+            {"beta": ("BB", 2), "alpha": ("A", 1), "gamma": ("GGG", 3)},
+            [], "v",
+        )
+        with TickerIndex(tmp_path / "t.hxct") as index:
+            assert list(index) == ["alpha", "beta", "gamma"]
+            assert index["beta"] == ("BB", 2) and index.get("delta") is None
+            assert index.mapping() == {"alpha": ("A", 1), "beta": ("BB", 2), "gamma": ("GGG", 3)}
+
+    def test_changed_file_recompiles_the_index(self, tmp_path):
+        self._resolver(tmp_path, TestTickerResolver._payload()).load()
+        payload = {"0": {"cik_str": 42, "ticker": "GAMA", "title": "Gamma Bio Inc"}}
+        changed = self._resolver(tmp_path, payload, etag='"t2"')
+        assert changed.load() == 1 and not changed.index_hit
+        assert changed.resolve("Acme Therapeutics") is None
+        assert TickerIndex(tmp_path / "tickers.hxct").lookup("gamma bio") == ("GAMA", 42)
+
+    def test_ambiguous_names_survive_the_index(self, tmp_path):
+        payload = {
+            "0": {"cik_str": 1, "ticker": "AAA", "title": "Vertex Pharmaceuticals Inc"},
+            "1": {"cik_str": 2, "ticker": "BBB", "title": "Vertex Pharma Corp"},
+        }
+        self._resolver(tmp_path, payload).load()
+        again = self._resolver(tmp_path, payload)
+        again.load()
+        assert again.index_hit
+        assert again.resolve("Vertex Pharmaceuticals") is None
+        assert TickerIndex(tmp_path / "tickers.hxct").ambiguous == ["vertex"]
+
+    def test_damaged_index_is_recompiled(self, tmp_path):
+        payload = TestTickerResolver._payload()
+        self._resolver(tmp_path, payload).load()
+        (tmp_path / "tickers.hxct").write_bytes(b"not an index")
+        again = self._resolver(tmp_path, payload)
+        assert again.load() == 2 and not again.index_hit
+        assert again.resolve("Beta Pharma") == ("BETA", "0007654321")
+
+    def test_clients_without_get_text_still_use_the_index(self, tmp_path):
+        client = FakeClient({"company_tickers": TestTickerResolver._payload()})
+        TickerResolver(client, index_path=tmp_path / "t.hxct").load()
+        again = TickerResolver(client, index_path=tmp_path / "t.hxct")
+        again.load()
+        assert again.index_hit
+
+    def test_async_load_shares_the_index(self, tmp_path):
+        import asyncio
+
+        payload = TestTickerResolver._payload()
+        self._resolver(tmp_path, payload).load()
+
+        class TextClient:
+            async def get_text(self, url, headers=None):
+                return json.dumps(payload)
+
+        resolver = TickerResolver(TextClient(), index_path=tmp_path / "tickers.hxct")
+        asyncio.run(resolver.aload())
+        assert resolver.index_hit
+        assert resolver.resolve("ACME THERAPEUTICS") == ("ACME", "0001234567")
+
+
+class TestSponsorAliases:
+    PAYLOAD = {
+        "0": {"cik_str": 59478, "ticker": "LLY", "title": "LILLY ELI & CO"},
+        "1": {"cik_str": 200406, "ticker": "JNJ", "title": "JOHNSON & JOHNSON"},
+        "2": {"cik_str": 999, "ticker": "BAYR", "title": "Bayer Inc"},
+        "3": {"cik_str": 1, "ticker": "AAA", "title": "Vertex Pharmaceuticals Inc"},
+        "4": {"cik_str": 2, "ticker": "BBB", "title": "Vertex Pharma Corp"},
+        "5": {"cik_str": 2, "ticker": "BBB-P", "title": "Vertex Pharma Corp"},
+    }
+
+    def _resolver(self, **kw):
+        r = TickerResolver(FakeClient({"company_tickers": self.PAYLOAD}), **kw)
+        r.load()
+        return r
+
+    def test_differently_spelled_sponsor_resolves(self):
+        assert self._resolver().resolve("Eli Lilly and Company") == ("LLY", "0000059478")
+
+    def test_subsidiary_resolves_to_the_parent(self):
+        r = self._resolver()
+        assert r.resolve("Janssen Research & Development, LLC") == ("JNJ", "0000200406")
+
+    def test_unlisted_parent_blocks_a_namesake(self):
+        """"Bayer" must not resolve to an unrelated registrant called Bayer."""
+        assert self._resolver().resolve("Bayer") is None
+        assert self._resolver(aliases={}).resolve("Bayer") == ("BAYR", "0000000999")
+
+    def test_alias_settles_an_ambiguous_name_on_the_primary_ticker(self):
+        r = self._resolver(aliases={"Vertex Pharma": 2})
+        assert r.resolve("Vertex Pharmaceuticals") == ("BBB", "0000000002")
+        assert r.outcome("Vertex Pharmaceuticals") == "hit"
+
+    def test_alias_to_an_unlisted_cik_is_a_miss(self):
+        assert self._resolver(aliases={"Eli Lilly and Company": 12345}).resolve(
+            "Eli Lilly and Company") is None
+
+    def test_editing_the_table_recompiles_the_index(self, tmp_path):
+        path = tmp_path / "tickers.hxct"
+        self._resolver(index_path=path)
+        assert self._resolver(index_path=path).index_hit
+        changed = self._resolver(aliases={"Bayer": 999}, index_path=path)
+        assert not changed.index_hit
+        assert changed.resolve("Bayer") == ("BAYR", "0000000999")
+
+    def test_outcomes_are_reused_by_the_next_run(self, tmp_path):
+        path = tmp_path / "tickers.hxct"
+        first = self._resolver(index_path=path)
+        for sponsor in ("Eli Lilly and Company", "Nobody Ltd", "Vertex Pharmaceuticals"):
+            first.resolve(sponsor)
+        assert first.save_outcomes() == 3
+        saved = json.loads((tmp_path / "tickers.hxct.outcomes.json").read_text())
+        assert saved["outcomes"] == {
+            "Eli Lilly and Company": ["LLY", "0000059478"],
+            "Nobody Ltd": "miss",
+            "Vertex Pharmaceuticals": "ambiguous",
+        }
+
+        second = self._resolver(index_path=path)
+        assert second.resolve("Eli Lilly and Company") == ("LLY", "0000059478")
+        assert second.resolve("Vertex Pharmaceuticals") is None
+        assert (second.memo_hits, second.memo_misses) == (2, 0)
+
+    def test_outcomes_from_another_index_are_ignored(self, tmp_path):
+        path = tmp_path / "tickers.hxct"
+        first = self._resolver(index_path=path)
+        first.resolve("Bayer")
+        first.save_outcomes()
+        changed = self._resolver(aliases={"Bayer": 999}, index_path=path)
+        assert changed.resolve("Bayer") == ("BAYR", "0000000999")
+        assert changed.memo_hits == 0
+
 
 def facts_payload(cash=None, ocf=None, ocf_start="2026-01-01", ocf_end="2026-03-31"):
     gaap = {}
@@ -342,6 +1419,216 @@ class TestCashRunway:
         assert "facts unavailable" in r.note
 
 
+def make_companyfacts_zip(path, members):
+    import zipfile
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name, payload in members.items():
+            zf.writestr(name, payload if isinstance(payload, str) else json.dumps(payload))
+    return path
+
+
+class TestBulkFactsIndex:
+    def _index(self, tmp_path, members):
+        archive = make_companyfacts_zip(tmp_path / "companyfacts.zip", members)
+        build_facts_index(archive, tmp_path / "facts.idx")
+        return FactsIndex(tmp_path / "facts.idx")
+
+    def test_keeps_only_runway_series(self, tmp_path):
+        payload = facts_payload(30_000_000, -10_000_000)
+        payload["facts"]["us-gaap"]["Revenues"] = {"units": {"USD": [{"val": 1}]}}
+        payload["facts"]["dei"] = {"EntityCommonStockSharesOutstanding": {}}
+        with self._index(tmp_path, {"CIK0001234567.json": payload}) as idx:
+            got = idx.get(1234567)
+        assert set(got["facts"]) == {"us-gaap"}
+        assert set(got["facts"]["us-gaap"]) == {
+            "CashAndCashEquivalentsAtCarryingValue",
+            "NetCashProvidedByUsedInOperatingActivities",
+        }
+
+    def test_lookup_by_binary_search(self, tmp_path):
+        members = {
+            f"CIK{cik:010d}.json": facts_payload(cik, -1)
+            for cik in (900, 5, 70, 1234567, 31)
+        }
+        with self._index(tmp_path, members) as idx:
+            assert len(idx) == 5
+            assert list(idx.ciks()) == [5, 31, 70, 900, 1234567]
+            for cik in (5, 31, 70, 900, 1234567):
+                cash = idx.get(cik)["facts"]["us-gaap"]["CashAndCashEquivalentsAtCarryingValue"]
+                assert cash["units"]["USD"][0]["val"] == cik
+            assert idx.get(6) is None and 6 not in idx
+
+    def test_unusable_members_are_skipped(self, tmp_path):
+        members = {
+            "CIK0000000001.json": facts_payload(1, -1),
+            "CIK0000000002.json": "{not json",
+            "CIK0000000003.json": {"facts": {"us-gaap": {"Revenues": {}}}},
+            "README.txt": "hello",
+        }
+        with self._index(tmp_path, members) as idx:
+            assert list(idx.ciks()) == [1]
+
+    def test_source_computes_runway_without_network(self, tmp_path):
+        members = {"CIK0001234567.json": facts_payload(30_000_000, -10_000_000)}
+        client = FakeClient({}, fail_on=["companyfacts"])
+        with self._index(tmp_path, members) as idx:
+            src = CompanyFactsSource(client, bulk_index=idx)
+            r = src.fetch("0001234567")
+            missing = src.fetch("0000000042")
+        assert r.months == pytest.approx(9.0)
+        assert r.provenance.url == "facts.idx#CIK0001234567"
+        assert missing.months is None and "not in facts.idx" in missing.note
+        assert client.calls == []
+
+    def test_rejects_a_file_that_is_not_an_index(self, tmp_path):
+        (tmp_path / "junk.idx").write_bytes(b"x" * 64)
+        with pytest.raises(SourceError, match="not a version"):
+            FactsIndex(tmp_path / "junk.idx")
+
+    def test_rejects_a_truncated_index(self, tmp_path):
+        members = {"CIK0000000001.json": facts_payload(1, -1)}
+        self._index(tmp_path, members).close()
+        data = (tmp_path / "facts.idx").read_bytes()
+        (tmp_path / "facts.idx").write_bytes(data[:10] + data[-24:])
+        with pytest.raises(SourceError, match="truncated"):
+            FactsIndex(tmp_path / "facts.idx")
+
+
+class TestColumnarTable:
+    def test_round_trip(self, tmp_path):
+        import array
+
+        cols = {
+            "id": array.array("I", [3, 1, 2]),
+            "value": array.array("d", [1.5, float("nan"), float("inf")]),
+        }
+        write_table(tmp_path / "t.col", cols, meta={"kind": "test"})
+        with ColumnarTable(tmp_path / "t.col") as t:
+            assert len(t) == 3 and t.meta == {"kind": "test"}
+            assert list(t.column("id")) == [3, 1, 2]
+            assert t.column("value")[0] == 1.5 and t.column("value")[2] == float("inf")
+
+    def test_rejects_ragged_columns(self, tmp_path):
+        import array
+
+        with pytest.raises(ValueError, match="differ in length"):
+            write_table(tmp_path / "t.col", {"a": array.array("i", [1]), "b": array.array("i")})
+
+    def test_rejects_a_truncated_file(self, tmp_path):
+        import array
+
+        write_table(tmp_path / "t.col", {"a": array.array("q", range(100))})
+        data = (tmp_path / "t.col").read_bytes()
+        (tmp_path / "t.col").write_bytes(data[:8] + data[200:])
+        with pytest.raises(ColumnarError):
+            ColumnarTable(tmp_path / "t.col")
+
+
+def filed_facts_payload():
+    """Two filings: a 10-K public in February, a 10-Q public in May."""
+    return {
+        "entityName": "Acme",
+        "facts": {"us-gaap": {
+            "CashAndCashEquivalentsAtCarryingValue": {"units": {"USD": [
+                {"end": "2025-12-31", "val": 50e6, "filed": "2026-02-15", "form": "10-K"},
+                {"end": "2026-03-31", "val": 20e6, "filed": "2026-05-10", "form": "10-Q"},
+            ]}},
+            "NetCashProvidedByUsedInOperatingActivities": {"units": {"USD": [
+                {"start": "2025-10-01", "end": "2025-12-31", "val": -5e6,
+                 "filed": "2026-02-15", "form": "10-K"},
+                {"start": "2026-01-01", "end": "2026-03-31", "val": -10e6,
+                 "filed": "2026-05-10", "form": "10-Q"},
+            ]}},
+        }},
+    }
+
+
+class TestRunwayTable:
+    DATES = [date(2026, 1, 31), date(2026, 3, 1), date(2026, 6, 1)]
+
+    def _table(self, tmp_path, members, **kw):
+        archive = make_companyfacts_zip(tmp_path / "companyfacts.zip", members)
+        build_facts_index(archive, tmp_path / "facts.idx")
+        with FactsIndex(tmp_path / "facts.idx") as idx:
+            build_runway_table(idx, self.DATES, tmp_path / "runway.col")
+        return RunwayTable(tmp_path / "runway.col", **kw)
+
+    def test_runway_is_point_in_time(self, tmp_path):
+        with self._table(tmp_path, {"CIK0001234567.json": filed_facts_payload()}) as table:
+            # Nothing filed by the end of January: no row, so no answer.
+            assert table.lookup("0001234567", date(2026, 1, 31)) is None
+            march = table.lookup("0001234567", date(2026, 4, 15))
+            june = table.lookup("0001234567", date(2026, 6, 1))
+        assert march.months == pytest.approx(30.0)
+        assert march.cash_as_of == date(2025, 12, 31)
+        assert march.cash_tag == "CashAndCashEquivalentsAtCarryingValue"
+        assert june.months == pytest.approx(6.0)
+        assert june.burn_period_end == date(2026, 3, 31)
+        assert june.provenance.source == "runway_table"
+        assert june.provenance.url == "runway.col#CIK0001234567@2026-06-01"
+
+    def test_matches_the_live_computation(self, tmp_path):
+        payload = facts_payload(cash=30_000_000, ocf=-10_000_000)
+        for fact_list in payload["facts"]["us-gaap"].values():
+            fact_list["units"]["USD"][0]["filed"] = "2026-05-01"
+        live = CompanyFactsSource(FakeClient({"companyfacts": payload})).fetch("0001234567")
+        with self._table(tmp_path, {"CIK0001234567.json": payload}) as table:
+            row = table.lookup("0001234567", date(2026, 6, 1))
+        assert (row.months, row.cash_usd, row.quarterly_burn_usd, row.note) == (
+            live.months, live.cash_usd, live.quarterly_burn_usd, live.note
+        )
+
+    def test_unknown_and_infinite_runway_survive_storage(self, tmp_path):
+        members = {
+            "CIK0000000001.json": facts_payload(cash=None, ocf=-1e6),
+            "CIK0000000002.json": facts_payload(cash=1e6, ocf=1e6),
+        }
+        for payload in members.values():
+            for fact_list in payload["facts"]["us-gaap"].values():
+                fact_list["units"]["USD"][0]["filed"] = "2026-05-01"
+        with self._table(tmp_path, members) as table:
+            unknown = table.lookup("1", date(2026, 6, 1))
+            positive = table.lookup("2", date(2026, 6, 1))
+        assert unknown.months is None and unknown.note == "no cash tag found"
+        assert positive.months == float("inf")
+
+    def test_stale_rows_are_misses(self, tmp_path):
+        with self._table(tmp_path, {"CIK0001234567.json": filed_facts_payload()},
+                         max_age_days=7) as table:
+            assert table.lookup("0001234567", date(2026, 6, 5)) is not None
+            assert table.lookup("0001234567", date(2026, 7, 1)) is None
+
+    def test_engine_screens_from_the_table_without_fetching(self, tmp_path):
+        studies = [make_study("NCT1", "Acme Therapeutics Inc",
+                              (date(2026, 6, 1) + timedelta(days=40)).isoformat())]
+        eng = build_engine(studies, TICKERS, facts_payload(1e9, -1), price=20.0,
+                           min_cash_runway_months=12)
+        eng.runway_table = self._table(tmp_path, {"CIK0001234567.json": filed_facts_payload()})
+        rep = eng.run(as_of=date(2026, 6, 1))
+        eng.runway_table.close()
+
+        assert not any("companyfacts" in c for c in eng.facts.client.calls)
+        assert [s.name for s in rep.sources][-1] == "runway_table"
+        # 6 months of runway from the table, not the huge balance on the wire.
+        assert rep.signals == []
+        assert rep.vetoes[0]["screen"] == "dilution"
+        assert rep.vetoes[0]["detail"]["source"] == "runway_table"
+
+    def test_engine_fetches_what_the_table_lacks(self, tmp_path):
+        studies = [make_study("NCT1", "Acme Therapeutics Inc",
+                              (date(2026, 6, 1) + timedelta(days=40)).isoformat())]
+        eng = build_engine(studies, TICKERS, facts_payload(30_000_000, -1_000_000), price=20.0)
+        eng.runway_table = self._table(tmp_path, {"CIK0000000009.json": filed_facts_payload()})
+        rep = eng.run(as_of=date(2026, 6, 1))
+        eng.runway_table.close()
+
+        assert len(rep.signals) == 1
+        assert [(s.name, s.records) for s in rep.sources][-2:] == [
+            ("runway_table", 0), ("sec.companyfacts", 1)
+        ]
+
+
 # ------------------------------------------------------------------- screens
 
 
@@ -453,6 +1740,22 @@ class TestConfigValidation:
         SignalConfig().validate()
         AccountConfig().validate()
 
+    def test_catalyst_prefilter_is_opt_in(self, monkeypatch):
+        assert SignalConfig.from_env().catalyst_prefilter is False
+        monkeypatch.setenv("HELIOS_CATALYST_PREFILTER", "1")
+        assert SignalConfig.from_env().catalyst_prefilter is True
+
+    def test_rate_limits_from_env_skip_empty_rules(self, monkeypatch):
+        monkeypatch.setenv("HELIOS_RATE_LIMITS", "sec.gov=5, ,clinicaltrials.gov=2,")
+        limits = SignalConfig.from_env().rate_limits_per_s
+        assert limits["sec.gov"] == 5.0 and limits["clinicaltrials.gov"] == 2.0
+
+    @pytest.mark.parametrize("value", ["sec.gov=", "sec.gov=fast", "=5", "sec.gov"])
+    def test_malformed_rate_limit_names_the_rule(self, monkeypatch, value):
+        monkeypatch.setenv("HELIOS_RATE_LIMITS", value)
+        with pytest.raises(ValueError, match=f"HELIOS_RATE_LIMITS: bad rule '{value}'"):
+            SignalConfig.from_env()
+
 
 # -------------------------------------------------------------------- engine
 
@@ -517,6 +1820,55 @@ class TestEngine:
         assert rep.signals == []
         assert any(not s.ok for s in rep.sources)
 
+    def test_catalyst_and_resolver_loads_overlap(self):
+        """Each load waits for the other to start; run back to back it would hang."""
+        import threading
+
+        studies = [make_study("NCT1", "Acme Therapeutics Inc",
+                              (TODAY + timedelta(days=40)).isoformat())]
+        eng = build_engine(studies, TICKERS, facts_payload(30_000_000, -1_000_000), price=20.0)
+        barrier = threading.Barrier(2, timeout=5)
+        real_fetch, real_load = eng.catalysts_source.fetch, eng.resolver.load
+
+        def fetch(phases):
+            barrier.wait()
+            return real_fetch(phases)
+
+        def load():
+            barrier.wait()
+            return real_load()
+
+        eng.catalysts_source.fetch, eng.resolver.load = fetch, load
+        rep = eng.run(as_of=TODAY)
+        assert rep.healthy and len(rep.signals) == 1
+        assert [s.name for s in rep.sources][:2] == ["clinicaltrials.gov", "sec.company_tickers"]
+
+    def test_each_load_reports_its_own_elapsed_time(self):
+        import time as _time
+
+        eng = build_engine([], TICKERS, facts_payload(1e7, -1e6), price=20.0)
+        real_load = eng.resolver.load
+
+        def slow_load():
+            _time.sleep(0.2)
+            return real_load()
+
+        eng.resolver.load = slow_load
+        rep = eng.run(as_of=TODAY)
+        catalysts, resolver = rep.sources[:2]
+        assert resolver.elapsed_ms >= 200
+        assert catalysts.elapsed_ms < 200
+
+    def test_catalyst_failure_still_reports_the_resolver(self):
+        eng = build_engine([], TICKERS, facts_payload(1e7, -1e6),
+                           price=20.0, fail_on=["clinicaltrials.gov"])
+        rep = eng.run(as_of=TODAY)
+        assert [(s.name, s.ok) for s in rep.sources] == [
+            ("clinicaltrials.gov", False), ("sec.company_tickers", True)
+        ]
+        assert rep.catalysts_found == 0
+        assert not any("companyfacts" in c for c in eng.facts.client.calls)
+
     @pytest.mark.parametrize(
         "exc", [make_unicode_decode_error, ValueError, KeyError, RuntimeError]
     )
@@ -596,6 +1948,8 @@ class TestEngine:
         rep = eng.run(as_of=TODAY)
         assert len(rep.signals) == 1
         assert sum(v["screen"] == "one_position_per_ticker" for v in rep.vetoes) == 2
+        resolver = next(r for r in rep.sources if r.name == "sec.company_tickers")
+        assert (resolver.memo_hits, resolver.memo_misses) == (2, 1)
 
     def test_same_trial_from_two_phase_queries_is_deduped(self):
         """A PHASE2|PHASE3 trial appears in both queries; it is one catalyst."""
@@ -629,6 +1983,787 @@ class TestEngine:
         assert "gap" in caveats and "stop" in caveats
 
 
+class TestRunwayPrefetch:
+    """Runway fetches run concurrently but the run's outcome must not notice."""
+
+    def test_each_distinct_cik_is_fetched_once(self):
+        studies = [
+            make_study(f"NCT{i}", "Acme Therapeutics Inc",
+                       (TODAY + timedelta(days=30 + i)).isoformat())
+            for i in range(3)
+        ]
+        eng = build_engine(studies, TICKERS, facts_payload(3_000_000, -3_000_000),
+                           price=20.0, max_signals_per_run=5)
+        rep = eng.run(as_of=TODAY)
+        calls = [c for c in eng.facts.client.calls if "companyfacts" in c]
+        assert len(calls) == 1
+        # Still vetoed three times: the veto log is per catalyst, not per fetch.
+        assert sum(v["screen"] == "dilution" for v in rep.vetoes) == 3
+
+    def test_signal_order_is_independent_of_completion_order(self):
+        import threading
+        import time as _time
+
+        names = [f"Sponsor{i} Therapeutics Inc" for i in range(6)]
+        studies = [
+            make_study(f"NCT{i}", names[i], (TODAY + timedelta(days=30 + i)).isoformat())
+            for i in range(6)
+        ]
+        tickers = {
+            str(i): {"cik_str": 1000000 + i, "ticker": f"SP{i}", "title": names[i]}
+            for i in range(6)
+        }
+        eng = build_engine(studies, tickers, facts_payload(1e8, -1e6),
+                           price=20.0, max_signals_per_run=6)
+        real_fetch = eng.facts.fetch
+        lock = threading.Lock()
+
+        def slow_first(cik):
+            # Earlier CIKs finish last.
+            _time.sleep((1000005 - int(cik)) * 0.01)
+            with lock:
+                return real_fetch(cik)
+
+        eng.facts.fetch = slow_first
+        rep = eng.run(as_of=TODAY)
+        assert [s.ticker for s in rep.signals] == [f"SP{i}" for i in range(6)]
+
+    def test_any_runway_exception_fails_the_run_closed(self):
+        names = [f"Sponsor{i} Therapeutics Inc" for i in range(4)]
+        studies = [
+            make_study(f"NCT{i}", names[i], (TODAY + timedelta(days=30 + i)).isoformat())
+            for i in range(4)
+        ]
+        tickers = {
+            str(i): {"cik_str": 1000000 + i, "ticker": f"SP{i}", "title": names[i]}
+            for i in range(4)
+        }
+        eng = build_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0)
+        real_fetch = eng.facts.fetch
+
+        def one_bad(cik):
+            if cik.endswith("2"):
+                raise RuntimeError("schema surprise")
+            return real_fetch(cik)
+
+        eng.facts.fetch = one_bad
+        rep = eng.run(as_of=TODAY)
+        assert rep.signals == []
+        assert not rep.healthy
+        failed = [s for s in rep.sources if not s.ok]
+        assert failed[0].name == "sec.companyfacts"
+        assert "RuntimeError" in failed[0].error
+
+    def test_candidates_past_the_signal_cap_are_never_fetched(self):
+        names = [f"Sponsor{i} Therapeutics Inc" for i in range(4)]
+        studies = [
+            make_study(f"NCT{i}", names[i], (TODAY + timedelta(days=30 + i)).isoformat())
+            for i in range(4)
+        ]
+        tickers = {
+            str(i): {"cik_str": 1000000 + i, "ticker": f"SP{i}", "title": names[i]}
+            for i in range(4)
+        }
+        eng = build_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0,
+                           max_signals_per_run=2)
+        real_fetch = eng.facts.fetch
+        fetched = []
+
+        def last_is_bad(cik):
+            fetched.append(cik)
+            if cik.endswith("3"):
+                raise RuntimeError("never needed")
+            return real_fetch(cik)
+
+        eng.facts.fetch = last_is_bad
+        rep = eng.run(as_of=TODAY)
+        assert rep.healthy
+        assert [s.ticker for s in rep.signals] == ["SP0", "SP1"]
+        assert sorted(fetched) == ["0001000000", "0001000001"]
+
+    def test_a_vetoed_window_fetches_the_next(self):
+        names = [f"Sponsor{i} Therapeutics Inc" for i in range(3)]
+        studies = [
+            make_study(f"NCT{i}", names[i], (TODAY + timedelta(days=30 + i)).isoformat())
+            for i in range(3)
+        ]
+        tickers = {
+            str(i): {"cik_str": 1000000 + i, "ticker": f"SP{i}", "title": names[i]}
+            for i in range(3)
+        }
+        eng = build_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0,
+                           max_signals_per_run=1)
+        real_fetch = eng.facts.fetch
+        short = CompanyFactsSource(FakeClient({"companyfacts": facts_payload(3e6, -3e6)}))
+        eng.facts.fetch = lambda cik: short.fetch(cik) if cik.endswith("0") else real_fetch(cik)
+        rep = eng.run(as_of=TODAY)
+        assert [v["screen"] for v in rep.vetoes] == ["dilution"]
+        assert [s.ticker for s in rep.signals] == ["SP1"]
+        facts = [s for s in rep.sources if s.name == "sec.companyfacts"]
+        assert facts[0].records == 2
+
+    def test_sec_rate_ceiling_is_validated(self):
+        cfg = SignalConfig()
+        cfg.rate_limits_per_s["sec.gov"] = 25
+        with pytest.raises(ValueError, match="fair-access"):
+            cfg.validate()
+
+
+class TestTokenBucket:
+    def _bucket(self, rate, burst=None):
+        clock = {"t": 0.0}
+        slept = []
+
+        def sleep(s):
+            slept.append(s)
+            clock["t"] += s
+
+        return TokenBucket(rate, burst, clock=lambda: clock["t"], sleep=sleep), slept, clock
+
+    def test_burst_is_free_then_paced(self):
+        bucket, slept, _ = self._bucket(10, burst=10)
+        for _ in range(10):
+            bucket.acquire()
+        assert slept == []
+        bucket.acquire()
+        assert slept == [pytest.approx(0.1)]
+
+    def test_default_never_exceeds_the_rate_in_the_first_second(self):
+        bucket, _, clock = self._bucket(10)
+        stamps = []
+        for _ in range(30):
+            bucket.acquire()
+            stamps.append(round(clock["t"], 9))
+        assert sum(1 for t in stamps if t < 1.0) == 10
+        assert stamps[:2] == [0.0, pytest.approx(0.1)]
+
+    def test_refills_over_time(self):
+        bucket, slept, clock = self._bucket(2, burst=1)
+        bucket.acquire()
+        clock["t"] += 0.5
+        bucket.acquire()
+        assert slept == []
+
+    def test_waiters_queue_rather_than_collide(self):
+        bucket, _, _ = self._bucket(10, burst=1)
+        bucket.reserve()
+        waits = [bucket.reserve() for _ in range(3)]
+        assert waits == [pytest.approx(0.1), pytest.approx(0.2), pytest.approx(0.3)]
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_async_acquire_shares_the_bucket(self, monkeypatch):
+        import asyncio
+
+        bucket, slept, _ = self._bucket(10, burst=1)
+        bucket.acquire()
+        waits = []
+
+        async def no_sleep(s):
+            waits.append(s)
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        asyncio.run(bucket.acquire_async())
+        assert slept == [] and waits == [pytest.approx(0.1)]
+
+
+class TestHostRateLimiter:
+    def test_sec_hosts_share_one_bucket(self):
+        limiter = HostRateLimiter({"sec.gov": 10})
+        www = limiter.bucket_for("https://www.sec.gov/files/company_tickers.json")
+        data = limiter.bucket_for("https://data.sec.gov/api/xbrl/companyfacts/CIK1.json")
+        assert www is data is not None
+
+    def test_unlisted_host_is_not_throttled(self):
+        limiter = HostRateLimiter({"sec.gov": 10})
+        assert limiter.bucket_for("https://clinicaltrials.gov/api/v2/studies") is None
+        assert limiter.bucket_for("https://notsec.gov/x") is None
+
+    def test_most_specific_rule_wins(self):
+        limiter = HostRateLimiter({"sec.gov": 10, "data.sec.gov": 2})
+        assert limiter.bucket_for("https://data.sec.gov/x").rate_per_s == 2
+        assert limiter.bucket_for("https://www.sec.gov/x").rate_per_s == 10
+
+    def test_client_draws_a_token_per_request(self):
+        clock = {"t": 0.0}
+        slept = []
+
+        def sleep(s):
+            slept.append(s)
+            clock["t"] += s
+
+        limiter = HostRateLimiter({"sec.gov": 10}, clock=lambda: clock["t"], sleep=sleep)
+        client = make_client([(200, {}, b"{}")] * 12, rate_limiter=limiter)
+        for i in range(12):
+            client.get_json(f"https://data.sec.gov/{i}.json")
+        assert slept == [pytest.approx(0.1)] * 11
+
+    def test_concurrent_callers_never_exceed_the_rate(self):
+        """Eight threads, one budget: 20 requests at 10 rps take ~1s, not 0s."""
+        import threading
+        import time as _time
+
+        stamps = []
+        lock = threading.Lock()
+
+        class Stamping(RoutingTransport):
+            def request(self, method, url, headers):
+                with lock:
+                    stamps.append(_time.monotonic())
+                return HttpResponse(200, {}, b"{}")
+
+        client = HttpJsonClient(
+            user_agent="Helios/1 (a@b.com)", transport=Stamping({}),
+            rate_limiter=HostRateLimiter({"sec.gov": 10}),
+        )
+        threads = [
+            threading.Thread(target=lambda: [client.get_json("https://data.sec.gov/x")
+                                             for _ in range(5)])
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(stamps) == 20
+        # One free token, then 19 more at 10/s.
+        assert max(stamps) - min(stamps) >= 1.8
+
+
+# ------------------------------------------------------------------- asyncio
+
+
+class AsyncFakeClient:
+    """FakeClient behind an awaitable get_json, for the async source paths."""
+
+    def __init__(self, inner):
+        self.inner = inner
+        self.closed = False
+
+    @property
+    def calls(self):
+        return self.inner.calls
+
+    async def get_json(self, url, headers=None):
+        return self.inner.get_json(url, headers)
+
+    async def close(self):
+        self.closed = True
+
+
+def build_async_engine(studies, tickers, facts, price=None, fail_on=None,
+                       raises=SourceError, **overrides):
+    eng = build_engine(studies, tickers, facts, price=price, fail_on=fail_on,
+                       raises=raises, **overrides)
+    client = AsyncFakeClient(eng.catalysts_source.client)
+    eng.catalysts_source.client = client
+    eng.resolver.client = client
+    eng.facts.client = client
+    return eng
+
+
+def feed(raw):
+    import asyncio
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(raw)
+    reader.feed_eof()
+    return reader
+
+
+class TestAsyncHttpParsing:
+    def _read(self, raw, method="GET"):
+        import asyncio
+
+        async def go():
+            return await read_response(feed(raw), method)
+
+        return asyncio.run(go())
+
+    def test_content_length_body(self):
+        resp, reusable = self._read(
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nETag: x\r\n\r\n{}"
+        )
+        assert resp == HttpResponse(200, {"content-length": "2", "etag": "x"}, b"{}")
+        assert reusable
+
+    def test_chunked_body(self):
+        raw = (b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+               b"3\r\n{\"a\r\n5\r\n\": 1}\r\n0\r\n\r\n")
+        resp, reusable = self._read(raw)
+        assert json.loads(resp.body) == {"a": 1} and reusable
+
+    def test_unframed_body_runs_to_close(self):
+        resp, reusable = self._read(b"HTTP/1.1 200 OK\r\n\r\n{\"a\": 2}")
+        assert json.loads(resp.body) == {"a": 2}
+        assert not reusable
+
+    def test_connection_close_is_honoured(self):
+        _, reusable = self._read(
+            b"HTTP/1.1 200 OK\r\nConnection: close\r\nContent-Length: 0\r\n\r\n"
+        )
+        assert not reusable
+
+    def test_interim_response_is_skipped(self):
+        resp, _ = self._read(
+            b"HTTP/1.1 100 Continue\r\n\r\nHTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n"
+        )
+        assert resp.status == 404
+
+    def test_not_modified_has_no_body(self):
+        resp, reusable = self._read(b"HTTP/1.1 304 Not Modified\r\nETag: x\r\n\r\n")
+        assert resp.status == 304 and resp.body == b"" and reusable
+
+
+class TestAsyncConnectionPool:
+    """Against a real local socket, so keep-alive is exercised, not assumed."""
+
+    @staticmethod
+    def _serve(handler):
+        import asyncio
+
+        connections = []
+
+        async def on_connect(reader, writer):
+            connections.append(writer)
+            await handler(reader, writer)
+
+        async def start():
+            return await asyncio.start_server(on_connect, "127.0.0.1", 0)
+
+        return start, connections
+
+    def test_reuses_one_connection(self):
+        import asyncio
+
+        async def handler(reader, writer):
+            body = b'{"ok": true}'
+            while True:
+                try:
+                    await reader.readuntil(b"\r\n\r\n")
+                except asyncio.IncompleteReadError:
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body))
+                await writer.drain()
+            writer.close()
+
+        start, connections = self._serve(handler)
+
+        async def go():
+            server = await start()
+            port = server.sockets[0].getsockname()[1]
+            client = AsyncHttpJsonClient(user_agent="Helios/1 (a@b.com)")
+            try:
+                out = [await client.get_json(f"http://127.0.0.1:{port}/x{i}") for i in range(3)]
+            finally:
+                await client.close()
+                server.close()
+            return out
+
+        assert asyncio.run(go()) == [{"ok": True}] * 3
+        assert len(connections) == 1
+
+    def test_stale_connection_is_replaced(self):
+        import asyncio
+
+        async def handler(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\n{}")
+            await writer.drain()
+            writer.close()  # server drops keep-alive without saying so
+
+        start, connections = self._serve(handler)
+
+        async def go():
+            server = await start()
+            port = server.sockets[0].getsockname()[1]
+            sleeps = []
+
+            async def sleep(s):
+                sleeps.append(s)
+
+            client = AsyncHttpJsonClient(user_agent="Helios/1 (a@b.com)", sleep=sleep)
+            try:
+                await client.get_json(f"http://127.0.0.1:{port}/a")
+                await asyncio.sleep(0.05)
+                await client.get_json(f"http://127.0.0.1:{port}/b")
+            finally:
+                await client.close()
+                server.close()
+            return sleeps
+
+        assert asyncio.run(go()) == []
+        assert len(connections) == 2
+
+
+class TestAsyncHttpJsonClient:
+    class Scripted:
+        def __init__(self, script):
+            self.script = script
+            self.requests = []
+
+        async def request(self, method, url, headers):
+            self.requests.append((url, dict(headers)))
+            return self.script.pop(0)
+
+        async def close(self):
+            pass
+
+    def _client(self, script, **kw):
+        async def no_sleep(s):
+            pass
+
+        return AsyncHttpJsonClient(
+            user_agent="Helios/1 (a@b.com)", transport=self.Scripted(script),
+            sleep=no_sleep, **kw,
+        )
+
+    def test_retries_transient_status(self):
+        import asyncio
+
+        client = self._client([HttpResponse(503, {}, b""), HttpResponse(200, {}, b'{"a": 1}')])
+        assert asyncio.run(client.get_json("https://data.sec.gov/x")) == {"a": 1}
+
+    def test_403_is_fatal(self):
+        import asyncio
+
+        client = self._client([HttpResponse(403, {}, b"")])
+        with pytest.raises(SourceError, match="User-Agent"):
+            asyncio.run(client.get_json("https://www.sec.gov/x"))
+
+    def test_shares_the_disk_cache(self, tmp_path):
+        import asyncio
+
+        cache = ResponseCache(tmp_path)
+        client = self._client([
+            HttpResponse(200, {"etag": '"e"'}, gzip.compress(b'{"a": 1}')),
+            HttpResponse(304, {}, b""),
+        ], cache=cache)
+        client._transport.script[0].headers["content-encoding"] = "gzip"
+        url = "https://www.sec.gov/files/company_tickers.json"
+        assert asyncio.run(client.get_json(url)) == {"a": 1}
+        assert asyncio.run(client.get_json(url)) == {"a": 1}
+        assert client._transport.requests[1][1]["If-None-Match"] == '"e"'
+        assert cache.stats_for(url).hits == 1
+
+    def test_cache_io_stays_off_the_event_loop(self, tmp_path):
+        import asyncio
+        import threading
+
+        cache = ResponseCache(tmp_path)
+        client = self._client([HttpResponse(200, {"etag": '"e"'}, b'{"a": 1}')], cache=cache)
+        threads = []
+        store = cache.store
+        cache.store = lambda *args: (threads.append(threading.get_ident()), store(*args))
+
+        async def go():
+            return threading.get_ident(), await client.get_json("https://www.sec.gov/x")
+
+        loop_thread, payload = asyncio.run(go())
+        assert payload == {"a": 1}
+        assert threads and loop_thread not in threads
+
+
+class TestAsyncEngine:
+    def _studies(self, n=3):
+        names = [f"Sponsor{i} Therapeutics Inc" for i in range(n)]
+        studies = [
+            make_study(f"NCT{i}", names[i], (TODAY + timedelta(days=30 + i)).isoformat())
+            for i in range(n)
+        ]
+        tickers = {
+            str(i): {"cik_str": 1000000 + i, "ticker": f"SP{i}", "title": names[i]}
+            for i in range(n)
+        }
+        return studies, tickers
+
+    def test_nightly_closes_the_client_when_the_run_ends(self):
+        import asyncio
+
+        studies, tickers = self._studies()
+        eng = build_async_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0)
+        rep = asyncio.run(arun_and_close(eng, TODAY, dry_run=True))
+        assert rep.healthy and eng.catalysts_source.client.closed
+
+    def test_arun_matches_run(self):
+        import asyncio
+
+        studies, tickers = self._studies()
+        sync = build_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0).run(
+            as_of=TODAY
+        )
+        eng = build_async_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0)
+        rep = asyncio.run(eng.arun(as_of=TODAY))
+        assert rep.healthy
+        assert [s.ticker for s in rep.signals] == [s.ticker for s in sync.signals]
+        assert rep.vetoes == sync.vetoes
+        assert [s.name for s in rep.sources] == [s.name for s in sync.sources]
+
+    def test_arun_fails_closed_on_catalyst_failure(self):
+        import asyncio
+
+        eng = build_async_engine([], TICKERS, facts_payload(1e7, -1e6), price=20.0,
+                                 fail_on=["clinicaltrials.gov"], raises=RuntimeError)
+        rep = asyncio.run(eng.arun(as_of=TODAY))
+        assert not rep.healthy and rep.signals == []
+        assert [s.ok for s in rep.sources] == [False, True]
+
+    def test_arun_fails_closed_on_runway_exception(self):
+        import asyncio
+
+        studies, tickers = self._studies()
+        eng = build_async_engine(studies, tickers, facts_payload(1e8, -1e6), price=20.0)
+
+        async def boom(cik):
+            raise RuntimeError("schema surprise")
+
+        eng.facts.afetch = boom
+        rep = asyncio.run(eng.arun(as_of=TODAY))
+        assert rep.signals == [] and not rep.healthy
+
+
+# ------------------------------------------------------------------ backtest
+
+
+class TestSnapshotArchive:
+    def test_versions_are_intervals(self, tmp_path):
+        archive = SnapshotArchive(tmp_path / "snap.json.gz")
+        assert archive.record(date(2026, 1, 1), STUDIES, {"a": 1, "b": 1}) == 2
+        assert archive.record(date(2026, 1, 2), STUDIES, {"a": 1, "b": 1}) == 0
+        assert archive.record(date(2026, 1, 5), STUDIES, {"a": 2}) == 2
+        assert archive.histories[STUDIES] == {
+            "a": [["2026-01-01", "2026-01-05", 1], ["2026-01-05", None, 2]],
+            "b": [["2026-01-01", "2026-01-05", 1]],
+        }
+        archive.save()
+        timeline = SnapshotArchive.load(tmp_path / "snap.json.gz").timeline(STUDIES)
+
+        def values(day):
+            return {k: timeline.value(k, i) for k, i in timeline.at(day).items()}
+
+        assert values(date(2025, 12, 31)) == {}
+        assert values(date(2026, 1, 4)) == {"a": 1, "b": 1}
+        assert values(date(2026, 1, 5)) == {"a": 2}
+        assert values(date(2026, 1, 2)) == {"a": 1, "b": 1}  # walking back starts over
+
+    def test_same_day_recapture_replaces_the_first(self, tmp_path):
+        archive = SnapshotArchive(tmp_path / "snap.json.gz")
+        archive.record(date(2026, 1, 1), STUDIES, {"a": 1})
+        archive.record(date(2026, 1, 5), STUDIES, {"a": 2})
+        archive.record(date(2026, 1, 5), STUDIES, {"a": 1})
+        assert archive.histories[STUDIES]["a"] == [["2026-01-01", None, 1]]
+        assert archive.captures == ["2026-01-01", "2026-01-05"]
+        with pytest.raises(ValueError, match="older than the latest"):
+            archive.record(date(2026, 1, 4), STUDIES, {})
+
+    def test_sources_fail_closed_outside_the_captures(self, tmp_path):
+        archive = SnapshotArchive(tmp_path / "snap.json.gz")
+        archive.record(date(2026, 1, 10), TICKER_MAPPINGS, {})
+        with pytest.raises(SourceError, match="No snapshot on or before"):
+            SnapshotCatalystSource(archive, date(2026, 1, 9)).fetch(["PHASE3"])
+        with pytest.raises(SourceError, match="more than 7 days old"):
+            SnapshotTickerResolver(archive, date(2026, 1, 18)).load()
+        assert SnapshotTickerResolver(archive, date(2026, 1, 17)).load() == 0
+
+
+class TestTickerHistory:
+    OLD = {"0": {"cik_str": 111, "ticker": "ACME", "title": "Acme Therapeutics Inc"},
+           "1": {"cik_str": 333, "ticker": "GONE", "title": "Gone Bio Inc"}}
+    NEW = {"0": {"cik_str": 111, "ticker": "ACMX", "title": "Acme Therapeutics Inc"}}
+
+    def test_resolves_on_any_date_in_any_order(self, tmp_path):
+        path = tmp_path / "snap.json.gz"
+        record_tickers(path, date(2026, 3, 1), compile_tickers(self.NEW, {})[0])
+        # Backfilled after the nightly capture, from an older copy of the file.
+        record_tickers(path, date(2025, 6, 30), compile_tickers(self.OLD, {})[0])
+        history = TickerHistory(SnapshotArchive.load(path), max_staleness_days=400)
+
+        assert history.resolve("Acme Therapeutics", date(2026, 3, 2)) == ("ACMX", "0000000111")
+        assert history.resolve("Gone Bio", date(2025, 7, 1)) == ("GONE", "0000000333")
+        assert history.resolve("Acme Therapeutics", date(2025, 7, 1)) == ("ACME", "0000000111")
+        assert history.resolve("Gone Bio", date(2026, 3, 1)) is None
+        assert history.intervals("Gone Bio") == [
+            (date(2025, 6, 30), date(2026, 3, 1), "GONE", "0000000333")
+        ]
+
+    def test_fails_closed_outside_ticker_captures(self, tmp_path):
+        path = tmp_path / "snap.json.gz"
+        record_tickers(path, date(2026, 3, 1), compile_tickers(self.NEW, {})[0])
+        history = TickerHistory(SnapshotArchive.load(path))
+        with pytest.raises(SourceError, match="No snapshot"):
+            history.resolve("Acme Therapeutics", date(2026, 2, 28))
+        with pytest.raises(SourceError, match="more than 7 days old"):
+            history.resolve("Acme Therapeutics", date(2026, 3, 9))
+
+    def test_backfill_matches_recording_in_order(self, tmp_path):
+        states = {date(2026, 1, d): {"a": d % 2, "b": 1} for d in (1, 3, 5, 7)}
+        states[date(2026, 1, 9)] = {"a": 1}
+        in_order = SnapshotArchive(tmp_path / "a.json.gz")
+        for day in sorted(states):
+            in_order.record(day, TICKER_MAPPINGS, states[day])
+        backfilled = SnapshotArchive(tmp_path / "b.json.gz")
+        for day in sorted(states, reverse=True):
+            backfilled.backfill(day, TICKER_MAPPINGS, states[day])
+        assert backfilled.histories == in_order.histories
+        assert backfilled.kind_captures == in_order.kind_captures
+
+    def test_ticker_captures_do_not_cover_studies(self, tmp_path):
+        archive = SnapshotArchive(tmp_path / "snap.json.gz")
+        archive.record(date(2026, 1, 1), STUDIES, {})
+        archive.record(date(2026, 1, 1), TICKER_MAPPINGS, {})
+        archive.record(date(2026, 1, 20), TICKER_MAPPINGS, {})
+        assert archive.covering(date(2026, 1, 21), 7, TICKER_MAPPINGS) == "2026-01-20"
+        with pytest.raises(SourceError, match="more than 7 days old"):
+            SnapshotCatalystSource(archive, date(2026, 1, 21)).fetch(["PHASE3"])
+
+    def test_archives_without_kind_captures_still_load(self, tmp_path):
+        path = tmp_path / "snap.json.gz"
+        archive = SnapshotArchive(path)
+        archive.record(date(2026, 1, 1), TICKER_MAPPINGS, {"acme": ["ACME", 111]})
+        archive.save()
+        with gzip.open(path, "rt") as fh:
+            data = json.load(fh)
+        del data["kind_captures"]
+        with gzip.open(path, "wt") as fh:
+            json.dump(data, fh)
+        loaded = SnapshotArchive.load(path)
+        assert loaded.kind_captures == {STUDIES: ["2026-01-01"], TICKER_MAPPINGS: ["2026-01-01"]}
+
+    def test_cli_records_a_dated_ticker_file(self, tmp_path):
+        (tmp_path / "tickers.json").write_text(json.dumps(self.OLD))
+        snapshots_main([str(tmp_path / "snap.json.gz"), str(tmp_path / "tickers.json"),
+                        "--as-of", "2025-06-30"])
+        archive = SnapshotArchive.load(tmp_path / "snap.json.gz")
+        assert archive.kind_captures[TICKER_MAPPINGS] == ["2025-06-30"]
+        assert TickerHistory(archive).resolve("Gone Bio", date(2025, 7, 1)) == (
+            "GONE", "0000000333")
+
+
+class TestBacktest:
+    ACME, BETA = "Acme Therapeutics Inc", "Beta Bio Corp"
+
+    def setup(self, tmp_path):
+        archive = SnapshotArchive(tmp_path / "snap.json.gz")
+        acme, beta = normalise_company_name(self.ACME), normalise_company_name(self.BETA)
+        archive.record(date(2026, 1, 1), STUDIES, {
+            "PHASE3|NCT1": make_study("NCT1", self.ACME, "2026-02-15"),
+        })
+        archive.record(date(2026, 1, 1), TICKER_MAPPINGS, {acme: ["ACME", 111]})
+        # The readout slips out of the window, and a new trial is registered.
+        archive.record(date(2026, 1, 10), STUDIES, {
+            "PHASE3|NCT1": make_study("NCT1", self.ACME, "2026-06-01"),
+            "PHASE3|NCT2": make_study("NCT2", self.BETA, "2026-02-20"),
+        })
+        archive.record(
+            date(2026, 1, 10), TICKER_MAPPINGS, {acme: ["ACME", 111], beta: ["BETA", 222]}
+        )
+        archive.save()
+
+        def filed(on):
+            payload = facts_payload(30_000_000, -10_000_000)
+            for series in payload["facts"]["us-gaap"].values():
+                series["units"]["USD"][0]["filed"] = on
+            return payload
+
+        make_companyfacts_zip(tmp_path / "facts.zip", {
+            "CIK0000000111.json": filed("2025-11-01"),
+            # Beta's first filing is public only from the 15th.
+            "CIK0000000222.json": filed("2026-01-15"),
+        })
+        build_facts_index(tmp_path / "facts.zip", tmp_path / "facts.idx")
+        return Backtest(tmp_path / "snap.json.gz", tmp_path / "facts.idx", workers=1)
+
+    DATES = [date(2026, 1, 5), date(2026, 1, 12), date(2026, 1, 16), date(2026, 1, 19)]
+
+    def test_replays_what_was_known_on_each_date(self, tmp_path):
+        result = self.setup(tmp_path).run_dates(self.DATES)
+        outcomes = [(r["as_of"], r["kind"], r["outcome"], r["nct_id"]) for r in result.panel]
+        assert outcomes == [
+            ("2026-01-05", "signal", "no_action", "NCT1"),
+            ("2026-01-12", "veto", "dilution", "NCT2"),
+            ("2026-01-16", "signal", "no_action", "NCT2"),
+        ]
+        assert [d.healthy for d in result.days] == [True, True, True, False]
+        assert "more than 7 days old" in result.unhealthy[0].errors[0]
+
+    def test_process_pool_matches_a_single_process(self, tmp_path):
+        backtest = self.setup(tmp_path)
+        serial = backtest.run(date(2026, 1, 1), date(2026, 1, 20))
+        backtest.workers = 3
+        pooled = backtest.run(date(2026, 1, 1), date(2026, 1, 20))
+        assert pooled.panel == serial.panel
+        assert [d.to_dict() for d in pooled.days] == [d.to_dict() for d in serial.days]
+
+    def test_panel_csv(self, tmp_path):
+        path = self.setup(tmp_path).run_dates(self.DATES[:1]).write_panel(tmp_path / "p.csv")
+        lines = path.read_text().splitlines()
+        assert lines[0] == "as_of,kind,outcome,ticker,nct_id,sponsor,event_date,phase,reason"
+        assert lines[1].startswith("2026-01-05,signal,no_action,ACME,NCT1,")
+
+
+class TestSweep:
+    AS_OF = date(2026, 1, 16)
+
+    def sweep(self, tmp_path, workers=1):
+        TestBacktest().setup(tmp_path)
+        return Sweep(tmp_path / "snap.json.gz", tmp_path / "facts.idx", self.AS_OF, workers=workers)
+
+    def test_grid_is_every_combination(self):
+        axes = {"min_enrollment": [50, 100], "max_signals_per_run": [1, 3]}
+        variants = grid(SignalConfig(), axes)
+        assert [label for label, _ in variants] == [
+            {"min_enrollment": 50, "max_signals_per_run": 1},
+            {"min_enrollment": 50, "max_signals_per_run": 3},
+            {"min_enrollment": 100, "max_signals_per_run": 1},
+            {"min_enrollment": 100, "max_signals_per_run": 3},
+        ]
+        assert variants[1][1].min_enrollment == 50 and variants[1][1].max_signals_per_run == 3
+        with pytest.raises(ValueError, match="min_enrolment"):
+            grid(SignalConfig(), {"min_enrolment": [1]})
+
+    def test_each_variant_matches_a_full_engine_run(self, tmp_path):
+        sweep = self.sweep(tmp_path)
+        variants = grid(SignalConfig(), {
+            "min_cash_runway_months": [3.0, 36.0], "entry_window_max_days": [30, 60],
+        })
+        rows = sweep.run(variants).rows
+        assert [(r.signals, r.catalysts_in_window, r.vetoes) for r in rows] == [
+            (0, 0, {}), (1, 1, {}), (0, 0, {}), (0, 1, {"dilution": 1}),
+        ]
+        assert rows[1].tickers == ["BETA"]
+        for (_, config), row in zip(variants, rows):
+            backtest = Backtest(tmp_path / "snap.json.gz", tmp_path / "facts.idx", config)
+            day = backtest.run_dates([self.AS_OF]).days[0]
+            assert (day.signals, day.catalysts_in_window, day.vetoes) == (
+                row.signals, row.catalysts_in_window, sum(row.vetoes.values())
+            )
+
+    def test_invalid_variant_is_reported_and_pool_matches_serial(self, tmp_path):
+        variants = grid(SignalConfig(), {"entry_window_min_days": [3, 20, 25]})
+        serial = self.sweep(tmp_path).run(variants)
+        assert [r.healthy for r in serial.rows] == [False, True, True]
+        assert "entry_window_min_days must exceed" in serial.rows[0].error
+        pooled = self.sweep(tmp_path, workers=2).run(variants)
+        assert pooled.rows == serial.rows
+
+    def test_cli_writes_the_comparison_table(self, tmp_path, capsys):
+        self.sweep(tmp_path)
+        assert sweep_main([
+            "--archive", str(tmp_path / "snap.json.gz"),
+            "--facts-index", str(tmp_path / "facts.idx"),
+            "--as-of", "2026-01-16", "--workers", "1",
+            "--set", "min_cash_runway_months=3,36", "--out", str(tmp_path / "sweep.csv"),
+        ]) == 0
+        lines = (tmp_path / "sweep.csv").read_text().splitlines()
+        assert lines[0] == (
+            "min_cash_runway_months,healthy,in_window,signals,veto_dilution,tickers,error"
+        )
+        assert lines[1:] == ["3.0,True,1,1,0,BETA,", "36.0,True,1,0,1,,"]
+        assert "min_cash_runway_months" in capsys.readouterr().out
+
+
 # ------------------------------------------------------------------ telegram
 
 
@@ -703,19 +2838,313 @@ class TestLedger:
         p = led.write_latest(RunReport(run_id="r1", started_at="t"), tmp_path / "latest.json")
         assert json.loads(p.read_text())["run_id"] == "r1"
 
+    @staticmethod
+    def vetoed_report():
+        cat = Catalyst(EventType.PHASE_3_COMPLETION, TODAY, "Acme Inc", "t", "NCT1",
+                       Provenance("test"))
+        return RunReport(run_id="r1", started_at="t", vetoes=[
+            VetoRecord(VetoScreen.TICKER_RESOLUTION, cat),
+            VetoRecord(VetoScreen.PRICE_BAND, cat, "ACME", (3.5, 5.0, 500.0)),
+            VetoRecord(VetoScreen.SIZING, cat, "ACME", (0.4, 40.0)),
+        ])
+
+    def test_vetoes_inline_by_default(self, tmp_path):
+        led = RunLedger(tmp_path / "runs.jsonl")
+        led.append(self.vetoed_report())
+        [entry] = led.read()
+        assert [v["screen"] for v in entry["vetoes"]] == [
+            "ticker_resolution", "price_band", "sizing"
+        ]
+        assert entry["vetoes"][1]["reason"] == "Price $3.50 outside $5-$500"
+        assert list(led.read_vetoes(entry)) == entry["vetoes"]
+
+    def test_sidecar_replaces_inline_vetoes(self, tmp_path):
+        led = RunLedger(tmp_path / "runs.jsonl", veto_sidecar=True)
+        report = self.vetoed_report()
+        led.append(report)
+        latest = json.loads(led.write_latest(report, tmp_path / "latest.json").read_text())
+        [entry] = led.read()
+        assert "vetoes" not in entry
+        assert entry["veto_sidecar"]["count"] == 3
+        assert entry["veto_sidecar"]["by_screen"] == {
+            "price_band": 1, "sizing": 1, "ticker_resolution": 1
+        }
+        assert latest["veto_sidecar"] == entry["veto_sidecar"]
+        assert (tmp_path / "vetoes" / "r1.jsonl.gz").exists()
+        assert list(led.read_vetoes(entry)) == [v.to_dict() for v in report.vetoes]
+
+    def test_altered_sidecar_is_refused(self, tmp_path):
+        led = RunLedger(tmp_path / "runs.jsonl", veto_sidecar=True)
+        led.append(self.vetoed_report())
+        [entry] = led.read()
+        (tmp_path / "vetoes" / "r1.jsonl.gz").write_bytes(gzip.compress(b"{}\n"))
+        with pytest.raises(ValueError, match="does not match"):
+            list(led.read_vetoes(entry))
+
+    @staticmethod
+    def dated_report(run_id, ticker, nct, healthy=True):
+        cat = Catalyst(EventType.PHASE_3_COMPLETION, TODAY, "Acme Inc", "t", nct,
+                       Provenance("test"))
+        return RunReport(
+            run_id=run_id, started_at="t", fatal_error=None if healthy else "boom",
+            vetoes=[VetoRecord(VetoScreen.ONE_POSITION_PER_TICKER, cat, ticker)],
+        )
+
+    def filled(self, tmp_path, **kwargs):
+        led = RunLedger(tmp_path / "runs.jsonl", **kwargs)
+        led.append(self.dated_report("2026-01-05-a", "PFE", "NCT1"))
+        led.append(self.dated_report("2026-01-06-b", "MRK", "NCT2", healthy=False))
+        led.append(self.dated_report("2026-01-07-c", "PFE", "NCT3"))
+        return led
+
+    @staticmethod
+    def ids(entries):
+        return [e["run_id"] for e in entries]
+
+    def test_find_by_key(self, tmp_path):
+        led = self.filled(tmp_path)
+        assert self.ids(led.find(ticker="PFE")) == ["2026-01-05-a", "2026-01-07-c"]
+        assert self.ids(led.find(nct_id="NCT2")) == ["2026-01-06-b"]
+        assert self.ids(led.find(healthy=False)) == ["2026-01-06-b"]
+        assert self.ids(led.find(ticker="PFE", nct_id="NCT2")) == []
+        assert self.ids(led.find(ticker="NOPE")) == []
+        assert led.get("2026-01-07-c")["run_id"] == "2026-01-07-c"
+        assert led.get("missing") is None
+
+    def test_runs_between_is_inclusive(self, tmp_path):
+        led = self.filled(tmp_path)
+        got = led.runs_between(date(2026, 1, 6), date(2026, 1, 7))
+        assert self.ids(got) == ["2026-01-06-b", "2026-01-07-c"]
+        assert self.ids(led.find(ticker="PFE", since=date(2026, 1, 6))) == ["2026-01-07-c"]
+        assert self.ids(led.find(until=date(2026, 1, 5))) == ["2026-01-05-a"]
+
+    def test_fresh_ledger_object_reuses_the_index_file(self, tmp_path):
+        self.filled(tmp_path)
+        assert (tmp_path / "runs.jsonl.idx").read_text().count("\n") == 3
+        led = RunLedger(tmp_path / "runs.jsonl")
+        assert self.ids(led.find(ticker="MRK")) == ["2026-01-06-b"]
+
+    def test_index_catches_up_with_lines_it_missed(self, tmp_path):
+        self.filled(tmp_path)
+        idx = tmp_path / "runs.jsonl.idx"
+        idx.write_text("".join(idx.read_text().splitlines(True)[:1]))
+        with (tmp_path / "runs.jsonl").open("a") as fh:
+            fh.write("{not json\n")
+        fresh = RunLedger(tmp_path / "runs.jsonl")
+        assert self.ids(fresh.find(ticker="PFE")) == ["2026-01-05-a", "2026-01-07-c"]
+        assert idx.read_text().count("\n") == 3
+
+    def test_stale_index_is_rebuilt(self, tmp_path):
+        self.filled(tmp_path)
+        # Rewrite the ledger under the index: same length, different bytes.
+        ledger = tmp_path / "runs.jsonl"
+        ledger.write_text(ledger.read_text().replace("PFE", "AZN"))
+        fresh = RunLedger(ledger)
+        assert self.ids(fresh.find(ticker="PFE")) == []
+        assert self.ids(fresh.find(ticker="AZN")) == ["2026-01-05-a", "2026-01-07-c"]
+
+    def test_sidecar_vetoes_are_indexed(self, tmp_path):
+        self.filled(tmp_path, veto_sidecar=True)
+        (tmp_path / "runs.jsonl.idx").unlink()
+        led = RunLedger(tmp_path / "runs.jsonl")
+        assert self.ids(led.find(nct_id="NCT3")) == ["2026-01-07-c"]
+
+    def test_query_sees_runs_appended_by_another_writer(self, tmp_path):
+        led = self.filled(tmp_path)
+        assert self.ids(led.find(ticker="LLY")) == []
+        RunLedger(tmp_path / "runs.jsonl").append(self.dated_report("2026-01-08-d", "LLY", "NCT4"))
+        assert self.ids(led.find(ticker="LLY")) == ["2026-01-08-d"]
+        led.append(self.dated_report("2026-01-09-e", "LLY", "NCT5"))
+        assert self.ids(led.find(ticker="LLY")) == ["2026-01-08-d", "2026-01-09-e"]
+        assert (tmp_path / "runs.jsonl.idx").read_text().count("\n") == 5
+
+
+class TestSegmentedLedger:
+    @staticmethod
+    def report(run_id, ticker="PFE"):
+        return TestLedger.dated_report(run_id, ticker, "NCT-" + run_id)
+
+    def ledger(self, tmp_path, clock):
+        return RunLedger(tmp_path / "runs.jsonl", segmented=True, today=lambda: clock[0])
+
+    def three_months(self, tmp_path):
+        clock = [date(2026, 1, 30)]
+        led = self.ledger(tmp_path, clock)
+        led.append(self.report("2026-01-30-a"))
+        led.append(self.report("2026-01-31-b", "MRK"))
+        clock[0] = date(2026, 2, 2)
+        led.append(self.report("2026-02-02-c"))
+        clock[0] = date(2026, 3, 2)
+        led.append(self.report("2026-03-02-d"))
+        return led, clock
+
+    def test_closed_months_are_frozen_and_chained(self, tmp_path):
+        led, _ = self.three_months(tmp_path)
+        names = sorted(p.name for p in tmp_path.iterdir())
+        assert "runs-2026-01.jsonl.gz" in names and "runs-2026-01.jsonl" not in names
+        assert "runs-2026-02.jsonl.gz" in names and "runs-2026-03.jsonl" in names
+        manifest = json.loads((tmp_path / "runs.manifest.json").read_text())["segments"]
+        assert [(m["segment"], m["runs"]) for m in manifest] == [
+            ("runs-2026-01.jsonl", 2), ("runs-2026-02.jsonl", 1)
+        ]
+        assert manifest[0]["chain"] != manifest[1]["chain"]
+        assert led.verify() == []
+
+    def test_read_streams_across_segments_after_legacy_file(self, tmp_path):
+        RunLedger(tmp_path / "runs.jsonl").append(self.report("2025-12-31-z"))
+        led, _ = self.three_months(tmp_path)
+        assert TestLedger.ids(led.read()) == [
+            "2025-12-31-z", "2026-01-30-a", "2026-01-31-b", "2026-02-02-c", "2026-03-02-d"
+        ]
+        assert TestLedger.ids(RunLedger(tmp_path / "runs.jsonl").read())[-1] == "2026-03-02-d"
+
+    def test_find_reaches_into_frozen_segments(self, tmp_path):
+        led, _ = self.three_months(tmp_path)
+        assert TestLedger.ids(led.find(ticker="PFE")) == [
+            "2026-01-30-a", "2026-02-02-c", "2026-03-02-d"
+        ]
+        (tmp_path / "runs.jsonl.idx").unlink()
+        fresh = RunLedger(tmp_path / "runs.jsonl", segmented=True)
+        assert TestLedger.ids(fresh.find(ticker="MRK")) == ["2026-01-31-b"]
+
+    def test_altered_frozen_segment_is_refused(self, tmp_path):
+        led, _ = self.three_months(tmp_path)
+        frozen = tmp_path / "runs-2026-01.jsonl.gz"
+        frozen.write_bytes(gzip.compress(gzip.decompress(frozen.read_bytes()).replace(
+            b"MRK", b"AZN")))
+        with pytest.raises(ValueError, match="does not match its manifest"):
+            list(led.read())
+        assert any("runs-2026-01.jsonl.gz" in problem for problem in led.verify())
+
+    def test_dropped_segment_breaks_the_chain(self, tmp_path):
+        led, _ = self.three_months(tmp_path)
+        path = tmp_path / "runs.manifest.json"
+        data = json.loads(path.read_text())
+        del data["segments"][0]
+        path.write_text(json.dumps(data))
+        assert led.verify() == ["Manifest chain breaks at runs-2026-02.jsonl"]
+
+    def test_interrupted_freeze_is_finished_on_next_append(self, tmp_path):
+        led, clock = self.three_months(tmp_path)
+        # As if the March freeze had stopped before removing February's file.
+        february = tmp_path / "runs-2026-02.jsonl"
+        february.write_bytes(gzip.decompress((tmp_path / "runs-2026-02.jsonl.gz").read_bytes()))
+        assert TestLedger.ids(led.read())[-2:] == ["2026-02-02-c", "2026-03-02-d"]
+        led.append(self.report("2026-03-03-e"))
+        assert not february.exists()
+        assert len(TestLedger.ids(led.read())) == 5
+
+    def test_frozen_month_cannot_be_appended_to(self, tmp_path):
+        led, clock = self.three_months(tmp_path)
+        clock[0] = date(2026, 1, 31)
+        with pytest.raises(ValueError, match="frozen"):
+            led.append(self.report("2026-01-31-x"))
+
+
+class TestLedgerAnalytics:
+    VALUES = {"price_band": (3.5, 5.0, 500.0), "sizing": (0.4, 40.0), "ticker_resolution": ()}
+
+    @staticmethod
+    def report(run_id, in_window, screens=(), buys=(), source_ok=True):
+        cat = Catalyst(EventType.PHASE_3_COMPLETION, TODAY, "Acme Inc", "t", "NCT-" + run_id,
+                       Provenance("test"))
+        return RunReport(
+            run_id=run_id, started_at="t", catalysts_found=100,
+            catalysts_in_window=in_window,
+            sources=[SourceReport("clinicaltrials", source_ok, 100, 5)],
+            signals=[Signal(Decision.BUY, ticker, cat, "ok", position_value=value)
+                     for ticker, value in buys],
+            vetoes=[VetoRecord(VetoScreen.named(screen), cat, "ACME",
+                               TestLedgerAnalytics.VALUES[screen])
+                    for screen in screens],
+        )
+
+    def filled(self, tmp_path, **kwargs):
+        led = RunLedger(tmp_path / "runs.jsonl", **kwargs)
+        led.append(self.report("2026-01-30-a", 10, ["price_band", "sizing"], [("PFE", 400.0)]))
+        led.append(self.report("2026-01-31-b", 20, ["price_band"]))
+        led.append(self.report("2026-02-02-c", 6, ["sizing"], [("PFE", 100.0), ("MRK", 50.0)],
+                               source_ok=False))
+        return led
+
+    def test_refresh_and_common_questions(self, tmp_path):
+        led = self.filled(tmp_path, veto_sidecar=True)
+        store = LedgerAnalytics(tmp_path / "analytics")
+        assert store.refresh(led) == 3
+        assert store.vetoes_per_screen_per_month() == {
+            ("2026-01", "price_band"): 2, ("2026-01", "sizing"): 1, ("2026-02", "sizing"): 1,
+        }
+        assert store.catalysts_in_window_trend() == {("2026-01",): 15.0, ("2026-02",): 6.0}
+
+    def test_group_by_decodes_keys_and_filters(self, tmp_path):
+        store = LedgerAnalytics(tmp_path / "analytics")
+        store.refresh(self.filled(tmp_path))
+        assert store.group_by("signals", ("ticker",), "position_value", "sum") == {
+            ("MRK",): 50.0, ("PFE",): 500.0,
+        }
+        assert store.group_by("signals", ("ticker",), where={"month": "2026-01"}) == {
+            ("PFE",): 1
+        }
+        assert store.group_by("sources", ("source",), where={"ok": 0}) == {
+            ("clinicaltrials",): 1
+        }
+        assert store.group_by("runs") == {(): 3}
+        with pytest.raises(ValueError, match="no column"):
+            store.group_by("runs", ("nope",))
+
+    def test_where_matches_an_integer_against_a_float_column(self, tmp_path, capsys):
+        store = LedgerAnalytics(tmp_path / "analytics")
+        store.refresh(self.filled(tmp_path))
+        assert store.group_by("signals", ("ticker",), where={"position_value": 400}) == {
+            ("PFE",): 1
+        }
+        assert store.group_by(
+            "signals", ("ticker",), where={"position_value": 100, "month": "2026-02"}
+        ) == {("PFE",): 1}
+        args = ["--ledger", str(tmp_path / "runs.jsonl"), "--store", str(tmp_path / "analytics")]
+        assert analytics_main(args + ["query", "signals", "--by", "ticker",
+                                      "--where", "position_value=50"]) == 0
+        assert capsys.readouterr().out.splitlines()[1:] == ["MRK\t1"]
+
+    def test_refresh_is_incremental(self, tmp_path):
+        led = self.filled(tmp_path)
+        store = LedgerAnalytics(tmp_path / "analytics")
+        store.refresh(led)
+        assert store.refresh(led) == 0
+        led.append(self.report("2026-02-03-d", 8, ["ticker_resolution"], [("LLY", 10.0)]))
+        assert store.refresh(led) == 1
+        assert store.group_by("vetoes", ("screen",)) == {
+            ("price_band",): 2, ("sizing",): 2, ("ticker_resolution",): 1,
+        }
+        assert store.group_by("signals", ("ticker",)) == {("LLY",): 1, ("MRK",): 1, ("PFE",): 2}
+
+    def test_rebuilt_when_the_ledger_changes_under_it(self, tmp_path):
+        store = LedgerAnalytics(tmp_path / "analytics")
+        store.refresh(self.filled(tmp_path))
+        (tmp_path / "runs.jsonl").unlink()
+        (tmp_path / "runs.jsonl.idx").unlink()
+        led = RunLedger(tmp_path / "runs.jsonl")
+        led.append(self.report("2026-03-01-x", 1))
+        assert store.refresh(led) == 1
+        assert store.group_by("runs", ("month",)) == {("2026-03",): 1}
+
+    def test_cli_refreshes_and_prints_a_table(self, tmp_path, capsys):
+        self.filled(tmp_path)
+        args = ["--ledger", str(tmp_path / "runs.jsonl"), "--store", str(tmp_path / "a")]
+        assert analytics_main(args + ["query", "runs", "--by", "month",
+                                      "--value", "catalysts_in_window", "--agg", "mean"]) == 0
+        assert capsys.readouterr().out.splitlines() == [
+            "month\tmean(catalysts_in_window)", "2026-01\t15", "2026-02\t6",
+        ]
+
 
 # ------------------------------------------------------------ biotech screens
 
 
 from helios_signals.knowledge import PhasePriors, classify_therapeutic_area  # noqa: E402
 from helios_signals.models import SponsorClass, TrialDesign  # noqa: E402
-from helios_signals.profiles import BIOTECH, get_profile  # noqa: E402
-from helios_signals.screens.biotech import (  # noqa: E402
-    screen_intervention_type,
-    screen_materiality,
-    screen_sponsor_class,
-    screen_trial_quality,
-)
+from helios_signals.profiles import get_profile  # noqa: E402
+from helios_signals.screens.biotech import screen_materiality  # noqa: E402
 
 CFG = SignalConfig()
 
@@ -945,3 +3374,168 @@ class TestEngineWithSectorScreens:
         names = {s.name for s in eng.run(as_of=TODAY).signals[0].screens}
         assert names == {"catalyst_window", "sponsor_class", "intervention_type",
                          "trial_quality", "dilution", "materiality"}
+
+
+class TestBatchScreening:
+    @staticmethod
+    def varied_catalysts():
+        """Every combination the gates distinguish, over a spread of dates."""
+        out = []
+        variants = [
+            {}, {"sponsor_class": "NIH"}, {"sponsor_class": "BOGUS"},
+            {"intervention_type": "BEHAVIORAL"}, {"intervention_type": "biological"},
+            {"intervention_type": "COMBINATION_PRODUCT"}, {"intervention_type": "GENETIC"},
+            {"enrollment": 20}, {"enrollment": 100}, {"enrollment": None},
+        ]
+        for i, days in enumerate(range(-3, 75, 3)):
+            for j, overrides in enumerate(variants):
+                study = make_study(f"NCT{i:03d}{j:02d}", "Acme Inc",
+                                   (TODAY + timedelta(days=days)).isoformat(), **overrides)
+                if overrides.get("enrollment", 0) is None:
+                    del study["protocolSection"]["designModule"]["enrollmentInfo"]["count"]
+                out.append(parse_study(study, "PHASE3"))
+        return out
+
+    @pytest.mark.parametrize("gate,screen", [
+        (CatalystBatch.sponsor_mask, screen_sponsor_class),
+        (CatalystBatch.intervention_mask, screen_intervention_type),
+        (CatalystBatch.quality_mask, screen_trial_quality),
+    ])
+    @pytest.mark.parametrize("veto_unknown", [True, False])
+    def test_each_gate_agrees_with_its_screen(self, gate, screen, veto_unknown):
+        cfg = SignalConfig(veto_on_unknown_enrollment=veto_unknown)
+        batch = CatalystBatch(self.varied_catalysts())
+        passed = set(batch.indices(gate(batch, cfg)))
+        for row, cat in enumerate(batch.catalysts):
+            assert (row in passed) == screen(cat, cfg).passed, cat.external_id
+
+    @pytest.mark.parametrize("overrides", [{}, {"hard_exit_days_before": 0,
+                                                "entry_window_min_days": 1}])
+    def test_timing_gate_agrees_with_screen(self, overrides):
+        cfg = SignalConfig(**overrides)
+        batch = CatalystBatch(self.varied_catalysts())
+        passed = set(batch.indices(batch.timing_mask(TODAY, cfg)))
+        for row, cat in enumerate(batch.catalysts):
+            assert (row in passed) == screen_catalyst_window(cat, TODAY, cfg).passed
+
+    def test_rows_are_in_date_order_ties_in_input_order(self):
+        cats = self.varied_catalysts()[::-1]
+        batch = CatalystBatch(cats)
+        assert batch.catalysts == sorted(cats, key=lambda c: c.event_date)
+
+    def test_masks_combine_and_count(self):
+        cfg = SignalConfig()
+        batch = CatalystBatch(self.varied_catalysts())
+        both = batch.sponsor_mask(cfg) & batch.intervention_mask(cfg)
+        expected = [c for c in batch.catalysts
+                    if screen_sponsor_class(c, cfg).passed
+                    and screen_intervention_type(c, cfg).passed]
+        assert batch.rows(both) == expected
+        assert batch.count(both) == len(expected)
+
+    def test_empty_batch(self):
+        batch = CatalystBatch([])
+        assert batch.rows(batch.timing_mask(TODAY, SignalConfig())) == []
+        assert batch.rows(sector_mask(batch, BIOTECH.screens, SignalConfig())) == []
+
+    def test_profile_with_ungated_screen_has_no_mask(self):
+        extra = SectorProfile("x", "x", screens=[*BIOTECH.screens, lambda c, cfg: None])
+        assert sector_mask(CatalystBatch([]), extra.screens, SignalConfig()) is None
+
+    def test_screen_results_built_only_when_read(self):
+        class Counting(SectorProfile):
+            calls = 0
+
+            def apply(self, catalyst, config):
+                Counting.calls += 1
+                return super().apply(catalyst, config)
+
+        day = (TODAY + timedelta(days=40)).isoformat()
+        studies = [make_study("NCT0", "Acme Therapeutics Inc", day)]
+        studies += [make_study(f"NCT{i}", "Acme Therapeutics Inc", day, sponsor_class="NIH")
+                    for i in range(1, 6)]
+        eng = build_engine(studies, TICKERS, facts_payload(1e8, -1e6), price=20.0,
+                           max_signals_per_run=1)
+        eng.profile = Counting(**{k: getattr(BIOTECH, k) for k in
+                                  ("name", "description", "screens", "knowledge_note")})
+        rep = eng.run(as_of=TODAY)
+        # The survivor fills max_signals_per_run, so the loop never reaches
+        # the five NIH trials the gates rejected, and their screens never run.
+        assert len(rep.signals) == 1
+        assert Counting.calls == 1
+
+    def test_engine_falls_back_without_gates(self):
+        studies = [make_study("NCT1", "Acme Therapeutics Inc",
+                              (TODAY + timedelta(days=40)).isoformat(), sponsor_class="NIH")]
+        eng = build_engine(studies, TICKERS, facts_payload(1e8, -1e6), price=20.0)
+        eng.profile = SectorProfile("biotech", "ungated", screens=[
+            lambda c, cfg: screen_sponsor_class(c, cfg)
+        ])
+        rep = eng.run(as_of=TODAY)
+        assert rep.signals == []
+        assert [v["screen"] for v in rep.vetoes] == ["sponsor_class"]
+
+
+class TestVetoRecords:
+    def test_reads_like_the_dict_it_replaced(self):
+        cat = Catalyst(EventType.PHASE_3_COMPLETION, TODAY, "Acme Inc", "t", "NCT1",
+                       Provenance("test"))
+        veto = VetoRecord(VetoScreen.ONE_POSITION_PER_TICKER, cat, "ACME")
+        assert veto["screen"] == "one_position_per_ticker"
+        assert veto["reason"].startswith("A signal for ACME was already issued")
+        assert veto["external_id"] == "NCT1"
+        assert veto.get("detail") is None
+        with pytest.raises(KeyError):
+            veto["nope"]
+
+    def test_ledger_keys_match_the_dicts_each_screen_wrote(self):
+        cat = Catalyst(EventType.PHASE_3_COMPLETION, TODAY, "Acme Inc", "t", "NCT1",
+                       Provenance("test"))
+        result = ScreenResult("x", False, "r", {"k": 1})
+        keys = {
+            screen: list(veto.to_dict())
+            for screen, veto in [
+                ("sponsor_class", VetoRecord(VetoScreen.SPONSOR_CLASS, cat, result=result)),
+                ("ticker_resolution", VetoRecord(VetoScreen.TICKER_RESOLUTION, cat)),
+                ("one_position", VetoRecord(VetoScreen.ONE_POSITION_PER_TICKER, cat, "ACME")),
+                ("dilution", VetoRecord(VetoScreen.DILUTION, cat, "ACME", result=result)),
+                ("materiality", VetoRecord(VetoScreen.MATERIALITY, cat, "ACME", result=result)),
+                ("price_band", VetoRecord(VetoScreen.PRICE_BAND, cat, "ACME", (3.5, 5.0, 500.0))),
+                ("sizing", VetoRecord(VetoScreen.SIZING, cat, "ACME", (0.4, 40.0))),
+            ]
+        }
+        assert keys == {
+            "sponsor_class": ["sponsor", "external_id", "screen", "reason", "detail"],
+            "ticker_resolution": ["sponsor", "external_id", "screen", "reason"],
+            "one_position": ["ticker", "external_id", "screen", "reason"],
+            "dilution": ["ticker", "sponsor", "external_id", "screen", "reason", "detail"],
+            "materiality": ["ticker", "external_id", "screen", "reason", "detail"],
+            "price_band": ["ticker", "screen", "reason"],
+            "sizing": ["ticker", "screen", "reason"],
+        }
+
+    def test_sector_reason_is_rendered_only_when_read(self):
+        studies = [make_study("NCT1", "Acme Therapeutics Inc",
+                              (TODAY + timedelta(days=40)).isoformat(), sponsor_class="NIH")]
+        rep = build_engine(studies, TICKERS, facts_payload(1e8, -1e6), price=20.0).run(
+            as_of=TODAY
+        )
+        [veto] = rep.vetoes
+        assert veto.screen is VetoScreen.SPONSOR_CLASS
+        assert veto.result is None
+        expected = screen_sponsor_class(veto.catalyst, SignalConfig())
+        assert veto["reason"] == expected.reason
+        assert veto["detail"] == expected.detail
+        assert veto.result == expected
+
+    def test_unknown_screen_name_is_kept(self):
+        assert VetoScreen.named("sector_specific") == "sector_specific"
+        assert VetoScreen.named("dilution") is VetoScreen.DILUTION
+
+    def test_report_counts_vetoes_by_screen(self):
+        rep = RunReport(run_id="r", started_at="t", vetoes=[
+            VetoRecord(VetoScreen.SIZING, values=(0.5, 10.0)),
+            VetoRecord(VetoScreen.SIZING, values=(0.2, 10.0)),
+            VetoRecord("custom"),
+        ])
+        assert rep.veto_counts() == {"custom": 1, "sizing": 2}